@@ -24,3 +24,6 @@ else:
 # Parser global options
 autofix = True            # Enable Autofix? see hachoir.field.GenericFieldSet
 check_padding_pattern = True   # Check padding fields pattern?
+
+# Stream options
+use_mmap = True           # Map regular files in memory? see FileInputStream
@@ -56,6 +56,21 @@ class Dict(object):
         """
         return self._value_list[self._index[key]]
 
+    def get(self, key, default=None):
+        """
+        Get item with specified key, or default if the key doesn't exist.
+
+        >>> d=Dict( (("two", "deux"), ("one", "un")) )
+        >>> d.get("one")
+        'un'
+        >>> d.get("three") is None
+        True
+        """
+        index = self._index.get(key)
+        if index is None:
+            return default
+        return self._value_list[index]
+
     def __setitem__(self, key, value):
         self._value_list[self._index[key]] = value
 
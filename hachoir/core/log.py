@@ -137,6 +137,7 @@ log = Log()
 
 
 class Logger(object):
+    __slots__ = ()
 
     def _logger(self):
         return "<%s>" % self.__class__.__name__
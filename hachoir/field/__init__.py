@@ -25,12 +25,13 @@ from hachoir.field.helper import (isString, isInteger,  # noqa
 from hachoir.field.fake_array import FakeArray  # noqa
 from hachoir.field.basic_field_set import (BasicFieldSet,  # noqa
                                            ParserError, MatchError)
+from hachoir.field.projection import Projection  # noqa
 from hachoir.field.generic_field_set import GenericFieldSet  # noqa
 from hachoir.field.seekable_field_set import SeekableFieldSet, RootSeekableFieldSet  # noqa
 from hachoir.field.field_set import FieldSet  # noqa
 from hachoir.field.static_field_set import StaticFieldSet  # noqa
 from hachoir.field.parser import Parser  # noqa
-from hachoir.field.vector import GenericVector, UserVector  # noqa
+from hachoir.field.vector import GenericVector, UserVector, PackedVector  # noqa
 
 # Complex types
 from hachoir.field.float import Float32, Float64, Float80  # noqa
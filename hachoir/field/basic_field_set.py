@@ -24,9 +24,13 @@ class MatchError(FieldError):
 
 
 class BasicFieldSet(Field):
+    # endian is usually a class attribute: the slot is only used by field
+    # sets inheriting the endian of their parent
+    __slots__ = ("stream", "root", "endian", "_field_array_count",
+                 "_global_event_handler", "_path_cache")
+
     _event_handler = None
     is_field_set = True
-    endian = None
 
     def __init__(self, parent, name, stream, description, size):
         # Sanity checks (preconditions)
@@ -43,11 +47,13 @@ class BasicFieldSet(Field):
         self._name = name
         self._size = size
         self._description = description
+        self._absolute_address = None
+        self._path = None
         self.stream = stream
         self._field_array_count = {}
 
         # Set endian
-        if not self.endian:
+        if not getattr(self, "endian", None):
             assert parent and parent.endian
             self.endian = parent.endian
 
@@ -59,8 +65,12 @@ class BasicFieldSet(Field):
         else:
             # This field set is the root
             self._address = 0
+            self._path = "/"
             self.root = self
             self._global_event_handler = None
+            # Absolute path => weak reference to the field, see
+            # GenericFieldSet.getField()
+            self._path_cache = {}
 
         # Sanity checks (post-conditions)
         assert self.endian in (BIG_ENDIAN, LITTLE_ENDIAN, MIDDLE_ENDIAN)
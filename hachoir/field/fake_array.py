@@ -1,4 +1,3 @@
-import itertools
 from hachoir.field import MissingField
 
 
@@ -13,6 +12,10 @@ class FakeArray:
             ...
 
     And to get array size using len(fieldset.array("item")).
+
+    Items are read in the list of the array fields kept by the field set
+    (GenericFieldSet._arrayFields()). Other field sets and items missing
+    from the list (added out of order) are looked up by their name.
     """
 
     def __init__(self, fieldset, name):
@@ -24,59 +27,66 @@ class FakeArray:
             self.fieldset = fieldset
             self.name = name
         self._format = "%s[%%u]" % self.name
-        self._cache = {}
-        self._known_size = False
-        self._max_index = -1
+
+    def _fields(self):
+        try:
+            arrayFields = self.fieldset._arrayFields
+        except AttributeError:
+            return ()
+        return arrayFields(self.name)
+
+    def _get(self, index):
+        """
+        Get a field of the array, or None if the field doesn't exist.
+        """
+        fields = self._fields()
+        if 0 <= index < len(fields):
+            return fields[index]
+        fieldset = self.fieldset
+        name = self._format % index
+        if getattr(fieldset, "done", False) and name not in fieldset._fields:
+            return None
+        try:
+            return fieldset[name]
+        except MissingField:
+            return None
 
     def __bool__(self):
         "Is the array empty or not?"
-        if self._cache:
-            return True
-        else:
-            return (0 in self)
+        return (0 in self)
 
     def __len__(self):
         "Number of fields in the array"
-        total = self._max_index + 1
-        if not self._known_size:
-            for index in itertools.count(total):
-                try:
-                    self[index]
-                    total += 1
-                except MissingField:
-                    break
-        return total
+        index = 0
+        while self._get(index) is not None:
+            index = max(index + 1, len(self._fields()))
+        return index
 
     def __contains__(self, index):
-        try:
-            self[index]
-            return True
-        except MissingField:
-            return False
+        return self._get(index) is not None
 
     def __getitem__(self, index):
         """
         Get a field of the array. Returns a field, or raise MissingField
         exception if the field doesn't exist.
         """
-        try:
-            value = self._cache[index]
-        except KeyError:
-            try:
-                value = self.fieldset[self._format % index]
-            except MissingField:
-                self._known_size = True
-                raise
-            self._cache[index] = value
-            self._max_index = max(index, self._max_index)
-        return value
+        fields = self._fields()
+        if 0 <= index < len(fields):
+            return fields[index]
+        return self.fieldset[self._format % index]
 
     def __iter__(self):
         """
         Iterate in the fields in their index order: field[0], field[1], ...
         """
-        for index in itertools.count(0):
-            try:
-                yield self[index]
-            except MissingField:
+        index = 0
+        while True:
+            fields = self._fields()
+            while index < len(fields):
+                yield fields[index]
+                index += 1
+            field = self._get(index)
+            if field is None:
                 break
+            yield field
+            index += 1
@@ -5,6 +5,7 @@ Parent of all field classes in :mod:`hachoir.field`.
 from hachoir.stream import InputFieldStream
 from hachoir.core.log import Logger
 from hachoir.core.tools import makePrintable
+from functools import lru_cache
 from weakref import ref as weakref_ref
 
 
@@ -22,6 +23,26 @@ def joinPath(path, name):
         return "/%s" % name
 
 
+@lru_cache(maxsize=4096)
+def splitPath(key):
+    """
+    Split a field path: return (absolute, names, simple). names is a tuple,
+    simple is False if a name is empty or only made of dots ("." is the
+    field itself, ".." its parent, etc.).
+
+    >>> splitPath("/frames/frame[0]")
+    (True, ('frames', 'frame[0]'), True)
+    >>> splitPath("../size")
+    (False, ('..', 'size'), False)
+    """
+    absolute = (key[0] == "/")
+    if absolute:
+        key = key[1:]
+    names = tuple(key.split("/")) if key else ()
+    simple = all(name.strip(".") for name in names)
+    return (absolute, names, simple)
+
+
 class MissingField(KeyError, FieldError):
 
     def __init__(self, field, key):
@@ -34,6 +55,14 @@ class MissingField(KeyError, FieldError):
 
 
 class Field(Logger):
+    # Fixed attributes and caches are stored in slots. __dict__ is kept for
+    # the attributes set by subclasses and parsers (and the rarely used
+    # _sub_istream), it is only allocated when such attribute is set.
+    __slots__ = ("__dict__", "__weakref__",
+                 "_parent", "_name", "_address", "_size", "_description",
+                 "_absolute_address", "_path",
+                 "__value", "__display", "__raw_display")
+
     static_size = None
     """(optional) Helper to compute field size.
 
@@ -74,6 +103,8 @@ class Field(Logger):
         self._address = parent.nextFieldAddress()
         self._size = size
         self._description = description
+        self._absolute_address = None
+        self._path = None
 
     def _logger(self):
         return self.path
@@ -186,16 +217,22 @@ class Field(Logger):
 
     @property
     def path(self):
-        """str: Full path of this field starting from the root field."""
-        if not self._parent:
-            return '/'
-        names = []
-        field = self
-        while field is not None:
-            names.append(field._name)
-            field = field._parent
-        names[-1] = ''
-        return '/'.join(reversed(names))
+        """str: Full path of this field starting from the root field.
+
+        Cached once the field is added to its parent: the name of a field
+        can change until it is added (ex: "raw[]" becomes "raw[2]").
+        """
+        path = self._path
+        if path is None:
+            parent = self._parent
+            if parent is None:
+                path = self._path = '/'
+            else:
+                path = joinPath(parent.path, self._name)
+                if (parent._path is not None
+                        and parent._fields.get(self._name) is self):
+                    self._path = path
+        return path
 
     @property
     def address(self):
@@ -204,14 +241,22 @@ class Field(Logger):
 
     @property
     def absolute_address(self):
-        """int: Absolute address (from beginning of stream), in bits."""
-        address = self._address
-        current = self._parent
-        while current:
-            address += current._address
-            current = current._parent
+        """int: Absolute address (from beginning of stream), in bits. Cached,
+        see :meth:`_invalidateCache`."""
+        address = self._absolute_address
+        if address is None:
+            address = self._address
+            if self._parent is not None:
+                address += self._parent.absolute_address
+            self._absolute_address = address
         return address
 
+    def _invalidateCache(self):
+        """Forget the cached absolute address and path. Must be called when
+        the address of the field changes."""
+        self._absolute_address = None
+        self._path = None
+
     @property
     def size(self):
         """int: Size of this field, in bits. Cached."""
@@ -237,24 +282,24 @@ class Field(Logger):
         Returns:
             Field: The field matching the provided path.
         """
-        if key:
-            if key[0] == "/":
-                if self._parent:
-                    current = self._parent.root
-                else:
-                    current = self
-                if len(key) == 1:
-                    return current
-                key = key[1:]
-            else:
-                current = self
-            for part in key.split("/"):
-                field = current._getField(part, const)
-                if field is None:
-                    raise MissingField(current, part)
-                current = field
-            return current
-        raise KeyError("Key must not be an empty string!")
+        if not key:
+            raise KeyError("Key must not be an empty string!")
+        if "/" not in key:
+            field = self._getField(key, const)
+            if field is None:
+                raise MissingField(self, key)
+            return field
+        absolute, names, simple = splitPath(key)
+        if absolute and self._parent:
+            current = self._parent.root
+        else:
+            current = self
+        for name in names:
+            field = current._getField(name, const)
+            if field is None:
+                raise MissingField(current, name)
+            current = field
+        return current
 
     def __getitem__(self, key):
         """Alias for :meth:`getField`, with ``const=False``"""
@@ -289,9 +334,9 @@ class Field(Logger):
         Returns:
             InputFieldStream: an input stream containing the field content.
         """
-        if hasattr(self, "_sub_istream"):
+        try:
             stream = self._sub_istream()
-        else:
+        except AttributeError:
             stream = None
         if stream is None:
             stream = self._createInputStream()
@@ -1,5 +1,5 @@
 from hachoir.field import FieldSet, RawBytes
-from hachoir.stream import StringInputStream
+from hachoir.stream import InputSubStream, ConcatStream
 
 
 class FragmentGroup:
@@ -13,17 +13,25 @@ class FragmentGroup:
         self.items.append(item)
 
     def createInputStream(self):
-        # FIXME: Use lazy stream creation
-        data = []
+        # Read the fragments from the parent stream, without copying their
+        # data. Adjacent fragments are merged.
+        extents = []
         for item in self.items:
-            data.append(item["rawdata"].value)
-        data = b"".join(data)
+            address = item["rawdata"].absolute_address
+            size = item["rawdata"].size
+            if extents and sum(extents[-1]) == address:
+                extents[-1][1] += size
+            else:
+                extents.append([address, size])
+        stream = self.items[0].stream
+        segments = [InputSubStream(stream, address, size)
+                    for address, size in extents]
 
         tags = {"args": self.args}
         if self.parser is not None:
             tags["class"] = self.parser
         tags = iter(tags.items())
-        return StringInputStream(data, "<fragment group>", tags=tags)
+        return ConcatStream(segments, source="<fragment group>", tags=tags)
 
 
 class CustomFragment(FieldSet):
@@ -1,8 +1,12 @@
 from hachoir.field import (MissingField, BasicFieldSet, Field, ParserError,
-                           createRawField, createNullField, createPaddingField, FakeArray)
+                           createRawField, createNullField, createPaddingField, FakeArray,
+                           joinPath)
+from hachoir.field.field import splitPath
+from hachoir.field.projection import Projection
 from hachoir.core.dict import Dict, UniqKeyError
 from hachoir.core.tools import lowerBound, makeUnicode
 import hachoir.core.config as config
+from weakref import ref as weakref_ref
 
 
 class GenericFieldSet(BasicFieldSet):
@@ -44,7 +48,9 @@ class GenericFieldSet(BasicFieldSet):
     - and maybe set endian and static_size class attributes.
     """
 
-    _current_size = 0
+    __slots__ = ("_fields", "_field_generator", "_array_cache",
+                 "_array_fields", "_array_scanned", "_projection",
+                 "_current_size", "__is_feeding")
 
     def __init__(self, parent, name, stream, description=None, size=None):
         """
@@ -65,6 +71,9 @@ class GenericFieldSet(BasicFieldSet):
         self._fields = Dict()
         self._field_generator = self.createFields()
         self._array_cache = {}
+        self._array_fields = None
+        self._projection = None
+        self._current_size = 0
         self.__is_feeding = False
 
     def array(self, key):
@@ -75,6 +84,33 @@ class GenericFieldSet(BasicFieldSet):
             self._array_cache[key] = array
             return self._array_cache[key]
 
+    def _arrayFields(self, name):
+        """
+        List of the fields of the array name: name[0], name[1], ... The
+        fields added since the previous call are indexed by their array
+        name. A field added out of order (ex: name[2] before name[1]) is
+        not indexed.
+        """
+        arrays = self._array_fields
+        if arrays is None:
+            arrays = self._array_fields = {}
+            self._array_scanned = 0
+        values = self._fields.values
+        if self._array_scanned < len(values):
+            for index in range(self._array_scanned, len(values)):
+                field = values[index]
+                key = field._name
+                if key[-1] != "]":
+                    continue
+                pos = key.rfind("[")
+                if pos < 0:
+                    continue
+                items = arrays.setdefault(key[:pos], [])
+                if key[pos + 1:-1] == str(len(items)):
+                    items.append(field)
+            self._array_scanned = len(values)
+        return arrays.get(name, ())
+
     def reset(self):
         """
         Reset a field set:
@@ -86,10 +122,12 @@ class GenericFieldSet(BasicFieldSet):
         But keep: name, value, description and size.
         """
         BasicFieldSet.reset(self)
+        self._clearPathCache()
         self._fields = Dict()
         self._field_generator = self.createFields()
         self._current_size = 0
         self._array_cache = {}
+        self._array_fields = None
 
     def __str__(self):
         return '<%s path=%s, current_size=%s, current length=%s>' % \
@@ -156,12 +194,16 @@ class GenericFieldSet(BasicFieldSet):
             self.setUniqueFieldName(field)
         if config.debug:
             self.info("[+] DBG: _addField(%s)" % field.name)
+        if self._projection is not None \
+                and isinstance(field, GenericFieldSet):
+            self._projectField(field)
 
         # required for the msoffice parser
         if field._address != self._current_size:
             self.warning("Fix address of %s to %s (was %s)" %
                          (field.path, self._current_size, field._address))
             field._address = self._current_size
+            field._invalidateCache()
 
         ask_stop = False
         # Compute field size and check that there is enough place for it
@@ -200,6 +242,44 @@ class GenericFieldSet(BasicFieldSet):
         if ask_stop:
             raise StopIteration()
 
+    def setProjection(self, patterns):
+        """
+        Only parse the fields selected by patterns, a list of absolute path
+        globs (see Projection), ex: ["/Segment[*]/Info[*]/**"]. Must be
+        called on the root field set, before reading the selected fields.
+
+        Field sets of known size which don't contain a selected field are
+        skipped: their createFields() is not run (only fields created by
+        their constructor exist) and done is True. Field sets of unknown
+        size are parsed to compute their size. Use None to disable the
+        projection of the fields added next.
+        """
+        if self._parent:
+            raise ParserError("setProjection() must be called on the root")
+        if patterns is None:
+            self._projection = None
+            return
+        projection = Projection(patterns)
+        state = projection.start()
+        if state is None:
+            self._projection = None
+            return
+        self._projection = (projection, state)
+        for field in self._fields:
+            if isinstance(field, GenericFieldSet):
+                self._projectField(field)
+
+    def _projectField(self, field):
+        projection, state = self._projection
+        state = projection.next(state, field._name)
+        if state is None:
+            # The field is selected with all its subfields
+            return
+        field._projection = (projection, state)
+        if not state and field._size is not None:
+            # No subfield can be selected: skip the field set
+            field._field_generator = None
+
     def _fixFieldSize(self, field, new_size):
         if new_size > 0:
             if field.is_field_set and 0 < field.size:
@@ -230,12 +310,43 @@ class GenericFieldSet(BasicFieldSet):
             if len(self._fields.values) <= key:
                 raise MissingField(self, key)
             return self._fields.values[key]
-        return Field.getField(self, key, const)
+        if not key:
+            raise KeyError("Key must not be an empty string!")
+
+        # Paths of two names or more are cached by the root, by absolute
+        # path. The path of the field set is only known once it's added.
+        if key[0] == "/":
+            path = key
+        elif "/" in key:
+            path = self.path
+            if self._path is None:
+                return Field.getField(self, key, const)
+            path = joinPath(path, key)
+        else:
+            return Field.getField(self, key, const)
+        cache = self.root._path_cache
+        ref = cache.get(path)
+        if ref is not None:
+            field = ref()
+            if field is not None:
+                return field
+        field = Field.getField(self, key, const)
+        absolute, names, simple = splitPath(key)
+        if simple and 2 <= len(names):
+            cache[path] = weakref_ref(field)
+        return field
+
+    def _clearPathCache(self):
+        """Clear the path cache of the root: called when fields are deleted
+        or replaced."""
+        self.root._path_cache.clear()
 
     def _truncate(self, size):
         assert size > 0
         if size < self._current_size:
+            self._clearPathCache()
             self._size = size
+            self._array_fields = None
             while True:
                 field = self._fields.values[-1]
                 if field._address < size:
@@ -262,6 +373,8 @@ class GenericFieldSet(BasicFieldSet):
         size = field.size
         self._current_size -= size
         del self._fields[index]
+        self._clearPathCache()
+        self._array_fields = None
         return field
 
     def _fixLastField(self):
@@ -459,11 +572,14 @@ class GenericFieldSet(BasicFieldSet):
         if field._name.endswith("[]"):
             self.setUniqueFieldName(field)
         field._address = old_field.address
+        field._invalidateCache()
         if field.name != name and field.name in self._fields:
             raise ParserError(
                 "Unable to replace %s: name \"%s\" is already used!"
                 % (name, field.name))
         self._fields.replace(name, field.name, field)
+        self._clearPathCache()
+        self._array_fields = None
         self.raiseEvent("field-replaced", old_field, field)
         if 1 < len(new_fields):
             index = self._fields.index(new_fields[0].name) + 1
@@ -472,6 +588,7 @@ class GenericFieldSet(BasicFieldSet):
                 if field._name.endswith("[]"):
                     self.setUniqueFieldName(field)
                 field._address = address
+                field._invalidateCache()
                 if field.name in self._fields:
                     raise ParserError(
                         "Unable to replace %s: name \"%s\" is already used!"
@@ -531,6 +648,11 @@ class GenericFieldSet(BasicFieldSet):
 
         self.replaceField(old_field.name, replace)
 
+    def _invalidateCache(self):
+        BasicFieldSet._invalidateCache(self)
+        for field in self._fields.values:
+            field._invalidateCache()
+
     def nextFieldAddress(self):
         return self._current_size
 
@@ -5,12 +5,36 @@ Integer field classes:
 """
 
 from hachoir.field import Bits, FieldError
+from hachoir.core.endian import BIG_ENDIAN, LITTLE_ENDIAN
+from struct import Struct
+
+
+def _createUnpackers():
+    """
+    Create a dictionary (size, endian, signed) => unpack function used by
+    GenericInteger to read byte-aligned integers of 8, 16, 32 and 64 bits.
+    """
+    unpackers = {}
+    for size, code in ((8, "b"), (16, "h"), (32, "i"), (64, "q")):
+        for endian, prefix in ((BIG_ENDIAN, ">"), (LITTLE_ENDIAN, "<")):
+            unpackers[size, endian, True] = Struct(prefix + code).unpack
+            unpackers[size, endian, False] = Struct(
+                prefix + code.upper()).unpack
+    return unpackers
+
+
+_unpackers = _createUnpackers()
 
 
 class GenericInteger(Bits):
     """
     Generic integer class used to generate other classes.
+
+    static_signed is True for classes of signed integers, False for
+    unsigned integers and None if it depends on the field.
     """
+    __slots__ = ("signed",)
+    static_signed = None
 
     def __init__(self, parent, name, signed, size, description=None):
         if not (8 <= size <= 16384):
@@ -20,14 +44,23 @@ class GenericInteger(Bits):
         self.signed = signed
 
     def createValue(self):
-        return self._parent.stream.readInteger(
-            self.absolute_address, self.signed, self._size, self._parent.endian)
+        parent = self._parent
+        address = self.absolute_address
+        if not address & 7:
+            unpack = _unpackers.get((self._size, parent.endian, self.signed))
+            if unpack is not None:
+                return unpack(parent.stream.readBytes(
+                    address, self._size >> 3))[0]
+        return parent.stream.readInteger(
+            address, self.signed, self._size, parent.endian)
 
 
 def integerFactory(name, is_signed, size, doc):
     class Integer(GenericInteger):
+        __slots__ = ()
         __doc__ = doc
         static_size = size
+        static_signed = is_signed
 
         def __init__(self, parent, name, description=None):
             GenericInteger.__init__(
@@ -0,0 +1,82 @@
+"""
+Projection of a field tree: the fields needed by the caller, written as
+path globs. See GenericFieldSet.setProjection().
+"""
+
+import re
+
+# "**" name: matches any number of names
+ANY = None
+
+
+def compileName(name):
+    if name == "**":
+        return ANY
+    if "*" not in name and "?" not in name:
+        return name
+    regex = re.escape(name).replace(r"\*", ".*").replace(r"\?", ".")
+    return re.compile(regex, re.DOTALL)
+
+
+class Projection:
+    """
+    Set of absolute path globs. In a name, "*" matches any characters and
+    "?" matches one character; a "**" name matches any number of names.
+    Brackets are not special: "/Segment[*]/Info[*]/**".
+
+    A field matching a glob is selected with all its subfields.
+
+    The state of a field set is the set of the (glob index, name index)
+    which may match its subfields: None if the field set is selected, an
+    empty set if none of its subfields can be selected.
+    """
+
+    def __init__(self, patterns):
+        if isinstance(patterns, str):
+            patterns = (patterns,)
+        self.patterns = tuple(patterns)
+        self._globs = []
+        for pattern in self.patterns:
+            if not pattern.startswith("/"):
+                raise ValueError("Projection path must be absolute: %r"
+                                 % pattern)
+            names = pattern[1:].split("/") if pattern != "/" else ()
+            self._globs.append(tuple(compileName(name) for name in names))
+
+    def _close(self, positions):
+        closure = set()
+        while positions:
+            index, pos = positions.pop()
+            glob = self._globs[index]
+            if pos == len(glob):
+                return None
+            closure.add((index, pos))
+            if glob[pos] is ANY and (index, pos + 1) not in closure:
+                positions.add((index, pos + 1))
+        return frozenset(closure)
+
+    def start(self):
+        """
+        State of the root field set.
+        """
+        return self._close(set((index, 0)
+                               for index in range(len(self._globs))))
+
+    def next(self, state, name):
+        """
+        State of the field name of a field set in the state state.
+        """
+        positions = set()
+        for index, pos in state:
+            item = self._globs[index][pos]
+            if item is ANY:
+                positions.add((index, pos))
+            elif isinstance(item, str):
+                if item == name:
+                    positions.add((index, pos + 1))
+            elif item.fullmatch(name):
+                positions.add((index, pos + 1))
+        return self._close(positions)
+
+    def __repr__(self):
+        return "<Projection %r>" % (self.patterns,)
@@ -33,6 +33,11 @@ class GenericString(Bytes):
 
     charset have to be in CHARSET_8BIT or in UTF_CHARSET.
     """
+    # _raw_value: raw value with prefix and suffix, not stripped,
+    # and not converted to Unicode
+    __slots__ = ("_format", "_strip", "_truncate", "_character_size",
+                 "_charset", "_content_size", "_content_offset", "_length",
+                 "_raw_value")
 
     VALID_FORMATS = ("C", "UnixLine",
                      "fixed", "Pascal8", "Pascal16", "Pascal32")
@@ -108,10 +113,6 @@ class GenericString(Bytes):
         "Pascal32": 4
     }
 
-    # Raw value: with prefix and suffix, not stripped,
-    # and not converted to Unicode
-    _raw_value = None
-
     def __init__(self, parent, name, format, description=None,
                  strip=None, charset=None, nbytes=None, truncate=None):
         Bytes.__init__(self, parent, name, 1, description)
@@ -123,6 +124,7 @@ class GenericString(Bytes):
         self._format = format
         self._strip = strip
         self._truncate = truncate
+        self._raw_value = None
 
         # Check charset and compute character size in bytes
         # (or None when it's not possible to guess character size)
@@ -1,6 +1,9 @@
 from hachoir.field import Bytes
 from hachoir.core.tools import makePrintable, humanFilesize
 from hachoir.stream import InputIOStream
+from hachoir.stream.input import InputPipe
+from collections import OrderedDict
+from weakref import ref as weakref_ref
 
 
 class SubFile(Bytes):
@@ -33,6 +36,13 @@ class SubFile(Bytes):
 
 
 class CompressedStream:
+    """
+    Decompress a stream: read() returns the next decompressed bytes.
+
+    If the decompressor has a copy() method, checkpoint() returns the state
+    of the decompression and resume() creates a CompressedStream continuing
+    the decompression from a checkpoint.
+    """
     offset = 0
 
     def __init__(self, stream, decompressor):
@@ -40,6 +50,31 @@ class CompressedStream:
         self.decompressor = decompressor(stream)
         self._buffer = b''
 
+    def close(self):
+        self.stream = None
+
+    def checkpoint(self):
+        """
+        State of the decompression, or None if the decompressor cannot be
+        copied.
+        """
+        if not hasattr(self.decompressor, "copy"):
+            return None
+        return (self.offset, self._buffer, self.decompressor.copy())
+
+    def resume(self, checkpoint):
+        """
+        Create a CompressedStream continuing the decompression from a
+        checkpoint.
+        """
+        offset, buffer, decompressor = checkpoint
+        stream = object.__new__(CompressedStream)
+        stream.stream = self.stream
+        stream.offset = offset
+        stream._buffer = buffer
+        stream.decompressor = decompressor.copy()
+        return stream
+
     def read(self, size):
         d = self._buffer
         data = [d[:size]]
@@ -63,14 +98,111 @@ class CompressedStream:
         return b''.join(data)
 
 
+class CompressedPipe(InputPipe):
+    """
+    InputPipe of a CompressedStream with random access (like zran): the
+    state of the decompression is recorded every checkpoint_interval bytes
+    of decompressed data. Blocks dropped from memory are not spilled to
+    disk, they are decompressed again from the previous checkpoint. A read
+    after the decompressed data resumes the decompression from the last
+    checkpoint before it.
+
+    checkpoints is the list of the checkpoints, it can be shared by the
+    pipes of the same compressed data. It is None if the decompressor
+    doesn't support checkpoints: the pipe behaves like an InputPipe.
+    """
+    checkpoint_interval = 1 << 22
+
+    def __init__(self, input, checkpoints=None, **args):
+        InputPipe.__init__(self, input, **args)
+        if not checkpoints:
+            checkpoint = input.checkpoint()
+            if checkpoint is not None:
+                if checkpoints is None:
+                    checkpoints = []
+                checkpoints.append(checkpoint)
+            else:
+                checkpoints = None
+        self.checkpoints = checkpoints
+        self._interval = max(self.checkpoint_interval >> self.buffer_size, 1)
+        # [index of the next block, CompressedStream] used by _load()
+        self._reader = None
+
+    def close(self):
+        self._reader = None
+        InputPipe.close(self)
+
+    def _fill(self, count):
+        checkpoints = self.checkpoints
+        if checkpoints is None:
+            InputPipe._fill(self, count)
+            return
+        interval = self._interval
+        # Skip the blocks before the last known checkpoint before count
+        index = min((count - 1) // interval, len(checkpoints) - 1)
+        if self.nb_blocks < index * interval and self.size is None:
+            self._input = self._input.resume(checkpoints[index])
+            self.nb_blocks = index * interval
+        while self.nb_blocks < count and self.size is None:
+            index, remainder = divmod(self.nb_blocks, interval)
+            if not remainder and len(checkpoints) == index:
+                checkpoints.append(self._input.checkpoint())
+            InputPipe._fill(self, min(count, (index + 1) * interval))
+
+    def _evict(self, index, data):
+        if self.checkpoints is None:
+            InputPipe._evict(self, index, data)
+        # else: the block will be decompressed again if needed
+
+    def _load(self, index):
+        if self.checkpoints is None:
+            return InputPipe._load(self, index)
+        interval = self._interval
+        reader = self._reader
+        if reader is None or not (reader[0] <= index < reader[0] + interval):
+            start = index - index % interval
+            reader = [start, self._input.resume(self.checkpoints[start // interval])]
+            self._reader = reader
+        # Decompress until the block, keep the blocks decompressed before it
+        block_size = 1 << self.buffer_size
+        while True:
+            data = reader[1].read(block_size)
+            reader[0] += 1
+            if reader[0] > index:
+                return data
+            self._store(reader[0] - 1, data)
+
+
+# Checkpoints of the last compressed fields: (weak reference to the stream
+# of the parent, address of the field) => checkpoints
+_checkpoints = OrderedDict()
+MAX_CHECKPOINT_INDEXES = 16
+
+
+def _getCheckpoints(stream, address):
+    key = (weakref_ref(stream), address)
+    checkpoints = _checkpoints.get(key)
+    if checkpoints is None:
+        checkpoints = _checkpoints[key] = []
+        if len(_checkpoints) > MAX_CHECKPOINT_INDEXES:
+            _checkpoints.popitem(False)
+    else:
+        _checkpoints.move_to_end(key)
+    return checkpoints
+
+
 def CompressedField(field, decompressor):
     def createInputStream(cis, source=None, **args):
         if field._parent:
             stream = cis(source=source)
             args.setdefault("tags", []).extend(stream.tags)
+            checkpoints = _getCheckpoints(field._parent.stream,
+                                          field.absolute_address)
         else:
             stream = field.stream
-        input = CompressedStream(stream, decompressor)
+            checkpoints = _getCheckpoints(stream, 0)
+        input = CompressedPipe(CompressedStream(stream, decompressor),
+                               checkpoints)
         if source is None:
             source = "Compressed source: '%s' (offset=%s)" % (
                 stream.source, field.absolute_address)
@@ -1,4 +1,10 @@
-from hachoir.field import Field, FieldSet, ParserError
+from hachoir.field import (Field, FieldSet, ParserError, GenericInteger,
+                           createRawField, createOrphanField)
+from hachoir.core.endian import BIG_ENDIAN, LITTLE_ENDIAN
+from array import array
+from sys import byteorder
+
+NATIVE_ENDIAN = LITTLE_ENDIAN if byteorder == "little" else BIG_ENDIAN
 
 
 class GenericVector(FieldSet):
@@ -39,3 +45,125 @@ class UserVector(GenericVector):
     def __init__(self, parent, name, nb_items, description=None):
         GenericVector.__init__(self, parent, name, nb_items,
                                self.item_class, self.item_name, description)
+
+
+def arrayTypecode(size, signed):
+    """
+    Smallest array typecode able to store an integer of size bits.
+    """
+    for typecode in ("bhilq" if signed else "BHILQ"):
+        if size <= array(typecode).itemsize * 8:
+            return typecode
+    raise ParserError("No array type for %s-bit integers" % size)
+
+
+class PackedVector(GenericVector):
+    """
+    Vector of integers of fixed size (eg. a table of offsets).
+
+    The values attribute decodes the whole vector at once into an array.array
+    without creating fields. An item field is only created when the item is
+    requested by its name (eg. vector["item[42]"] or getItem(42)) or when
+    the vector is iterated.
+
+    Items are named "item_name[first_index]", "item_name[first_index+1]",
+    etc. If size is bigger than the items, the end is a raw field.
+
+    signed tells if the items are signed integers, default:
+    item_class.static_signed.
+    """
+
+    def __init__(self, parent, name, nb_items, item_class, item_name="item",
+                 description=None, first_index=0, size=None, signed=None):
+        assert issubclass(item_class, GenericInteger)
+        if signed is None:
+            signed = item_class.static_signed
+            assert signed is not None
+        GenericVector.__init__(self, parent, name, nb_items, item_class,
+                               item_name, description)
+        self._signed = signed
+        if size is not None:
+            assert self._size <= size
+            self._size = size
+        self._first_index = first_index
+        self._items = {}
+        self._values = None
+
+    def _itemName(self, index):
+        return "%s[%u]" % (self._item_name, self._first_index + index)
+
+    def _itemIndex(self, name):
+        prefix = self._item_name + "["
+        if not (name.startswith(prefix) and name.endswith("]")):
+            return None
+        try:
+            index = int(name[len(prefix):-1]) - self._first_index
+        except ValueError:
+            return None
+        if not (0 <= index < len(self)):
+            return None
+        return index
+
+    def getItem(self, index):
+        """
+        Get the field of the item index (starting at 0), create it if needed.
+        """
+        if not (0 <= index < len(self)):
+            raise IndexError("Invalid item index: %s" % index)
+        name = self._itemName(index)
+        if name in self._fields:
+            return self._fields[name]
+        try:
+            return self._items[index]
+        except KeyError:
+            pass
+        field = createOrphanField(self, index * self._item_class.static_size,
+                                  self._item_class, name)
+        self._items[index] = field
+        return field
+
+    def _getField(self, name, const):
+        index = self._itemIndex(name)
+        if index is None:
+            return GenericVector._getField(self, name, const)
+        return self.getItem(index)
+
+    def createFields(self):
+        items = self._items
+        parser = self._item_class
+        for index in range(len(self)):
+            field = items.pop(index, None)
+            if field is None:
+                field = parser(self, self._itemName(index))
+            yield field
+        if self._current_size < self._size:
+            yield createRawField(self, self._size - self._current_size, "raw[]")
+
+    def _createValues(self):
+        item_size = self._item_class.static_size
+        # The vector may have been truncated
+        count = min(len(self), self._size // item_size)
+        signed = self._signed
+        typecode = arrayTypecode(item_size, signed)
+        values = array(typecode)
+        address = self.absolute_address
+        stream = self.stream
+        if (values.itemsize * 8 == item_size and not address & 7
+                and self.endian in (BIG_ENDIAN, LITTLE_ENDIAN)):
+            values.frombytes(stream.readBytes(address, count * values.itemsize))
+            if 1 < values.itemsize and self.endian != NATIVE_ENDIAN:
+                values.byteswap()
+        else:
+            endian = self.endian
+            values.extend(
+                stream.readInteger(address + index * item_size, signed,
+                                   item_size, endian)
+                for index in range(count))
+        return values
+
+    @property
+    def values(self):
+        """array.array: Values of all items, decoded at once. Cached."""
+        if self._values is None:
+            self._values = self._createValues()
+        return self._values
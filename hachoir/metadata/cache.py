@@ -0,0 +1,167 @@
+"""
+Persistent cache of hachoir-metadata results, stored in a SQLite database.
+
+An entry stores the parser identifier, description and MIME type, the
+layout of the top-level fields parsed to extract metadata and the
+metadata (see Metadata.exportState()). Unchanged files are answered from
+the cache without parsing them.
+"""
+
+from hachoir import __version__
+from hachoir.metadata.metadata import importMetadata
+from hashlib import sha1
+import json
+import os
+import sqlite3
+import zlib
+
+# Default maximum size of the cache entries in bytes
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# Number of bytes hashed at the start and at the end of a file
+HASH_SIZE = 64 * 1024
+
+
+def fileKey(filename, parser_id=None, options=()):
+    """
+    Compute the cache key of a file: hash of the file size, modification
+    time, content of the head and the tail of the file, parser identifier
+    (None when the parser is guessed), hachoir version and extraction
+    options.
+
+    Return None if the file cannot be read.
+    """
+    try:
+        stat = os.stat(filename)
+        content = sha1()
+        with open(filename, "rb") as fp:
+            content.update(fp.read(HASH_SIZE))
+            if HASH_SIZE < stat.st_size:
+                fp.seek(max(stat.st_size - HASH_SIZE, HASH_SIZE))
+                content.update(fp.read(HASH_SIZE))
+    except OSError:
+        return None
+    key = (__version__, stat.st_size, stat.st_mtime_ns, content.hexdigest(),
+           parser_id or "", tuple(options))
+    return sha1(repr(key).encode("utf-8")).hexdigest()
+
+
+def createEntry(parser, metadata=None):
+    """
+    Create a cache entry of a parser: its identifier, description, MIME
+    type, the (name, class, address, size) of the top-level fields already
+    parsed, and the metadata (if any).
+    """
+    fields = []
+    for index in range(parser.current_length):
+        field = parser.getField(index)
+        fields.append((field.name, field.__class__.__name__,
+                       field.address, field.size))
+    if metadata is not None:
+        metadata = metadata.exportState()
+    return {
+        "parser": parser.getParserTags()["id"],
+        "description": parser.description,
+        "mime_type": parser.mime_type,
+        "fields": fields,
+        "metadata": metadata,
+    }
+
+
+def entryMetadata(entry, quality):
+    """
+    Metadata object of a cache entry, or None if metadata were not stored.
+    """
+    if entry["metadata"] is None:
+        return None
+    return importMetadata(entry["metadata"], quality)
+
+
+class MetadataCache:
+    """
+    Cache entries are compressed JSON documents. When the total size of the
+    entries exceeds max_size bytes, the least recently used entries are
+    evicted.
+
+    hits and misses count the lookups.
+    """
+
+    def __init__(self, filename, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.db = sqlite3.connect(filename)
+        self.db.execute("CREATE TABLE IF NOT EXISTS entry ("
+                        "key TEXT PRIMARY KEY, "
+                        "data BLOB NOT NULL, "
+                        "size INTEGER NOT NULL, "
+                        "atime INTEGER NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS entry_atime "
+                        "ON entry (atime)")
+        self.db.commit()
+        # Logical clock of the accesses, used to evict the least recently
+        # used entries
+        self.clock = self.db.execute(
+            "SELECT COALESCE(MAX(atime), 0) FROM entry").fetchone()[0]
+
+    def _tick(self):
+        self.clock += 1
+        return self.clock
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        if self.db is not None:
+            self.db.commit()
+            self.db.close()
+            self.db = None
+
+    def get(self, key):
+        """
+        Get the entry of key, or None if the key is not cached.
+        """
+        row = self.db.execute("SELECT data FROM entry WHERE key=?",
+                              (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.db.execute("UPDATE entry SET atime=? WHERE key=?",
+                        (self._tick(), key))
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def set(self, key, entry):
+        data = json.dumps(entry, separators=(",", ":")).encode("utf-8")
+        data = zlib.compress(data)
+        self.db.execute("INSERT OR REPLACE INTO entry (key, data, size, atime) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, data, len(data), self._tick()))
+        self.evict()
+        self.db.commit()
+
+    @property
+    def size(self):
+        """Total size of the entries in bytes"""
+        return self.db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entry").fetchone()[0]
+
+    def evict(self):
+        """
+        Delete the least recently used entries until the total size of the
+        entries is lower or equal than max_size.
+        """
+        size = self.size
+        if size <= self.max_size:
+            return
+        evicted = []
+        for key, entry_size in self.db.execute(
+                "SELECT key, size FROM entry ORDER BY atime"):
+            if size <= self.max_size:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        self.db.executemany("DELETE FROM entry WHERE key=?", evicted)
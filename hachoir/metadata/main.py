@@ -4,14 +4,29 @@ from hachoir.core.benchmark import Benchmark
 from hachoir.stream import InputStreamError
 from hachoir.core.tools import makePrintable
 from hachoir.core.cmd_line import displayVersion
+from hachoir.core.memory import limitedMemory
+from hachoir.core.timeout import limitedTime, Timeout
 from hachoir.parser import createParser, ParserList
 import hachoir.core.config as hachoir_config
 from hachoir.metadata import config
 from optparse import OptionParser
 from hachoir.metadata import extractMetadata
-from hachoir.metadata.metadata import extractors as metadata_extractors
+from hachoir.metadata.metadata import (extractors as metadata_extractors,
+                                       importMetadata)
+from hachoir.metadata.cache import (MetadataCache, DEFAULT_MAX_SIZE,
+                                    fileKey, createEntry, entryMetadata)
+from collections import deque
+from concurrent.futures import (ProcessPoolExecutor, Future, FIRST_COMPLETED,
+                                wait as futures_wait)
+from concurrent.futures.process import BrokenProcessPool
+import os
 import sys
 
+# Default time (in seconds) and memory (in MB) limits to parse a file when
+# files are processed in parallel (--jobs)
+BATCH_TIMEOUT = 60
+BATCH_MAX_MEMORY = 1024
+
 
 def displayParserList(*args):
     parser_list = ParserList()
@@ -47,6 +62,27 @@ def parseOptions():
                       action="store", type="float", default="0.5")
     parser.add_option("--maxlen", help="Maximum string length in characters, 0 means unlimited (default: %s)" % config.MAX_STR_LENGTH,
                       type="int", default=config.MAX_STR_LENGTH)
+    parser.add_option("--cache", help="Cache the results in a SQLite database, "
+                      "unchanged files are not parsed again",
+                      type="str", metavar="FILENAME")
+    parser.add_option("--cache-size", help="Maximum size of the cache in MB (default: %s)"
+                      % (DEFAULT_MAX_SIZE // (1024 * 1024)),
+                      type="int", default=DEFAULT_MAX_SIZE // (1024 * 1024))
+    parser.add_option("--jobs", "-j", help="Number of processes used to "
+                      "parse files in parallel (default: 1)",
+                      type="int", default=1)
+    parser.add_option("--recursive", "-r", help="Process the files of "
+                      "directories recursively",
+                      action="store_true", default=False)
+    parser.add_option("--unordered", help="With --jobs, display results "
+                      "as soon as they are ready, not in the order of files",
+                      action="store_true", default=False)
+    parser.add_option("--timeout", help="Maximum time in seconds to parse "
+                      "a file (default: %s with --jobs, unlimited otherwise)"
+                      % BATCH_TIMEOUT, type="float")
+    parser.add_option("--max-memory", help="Maximum memory in MB to parse "
+                      "a file (default: %s with --jobs, unlimited otherwise)"
+                      % BATCH_MAX_MEMORY, type="int")
     parser.add_option("--verbose", help="Verbose mode",
                       default=False, action="store_true")
     parser.add_option("--debug", help="Debug mode",
@@ -56,19 +92,39 @@ def parseOptions():
     if len(filename) == 0:
         parser.print_help()
         sys.exit(1)
+    if values.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if 1 < values.jobs:
+        if values.timeout is None:
+            values.timeout = BATCH_TIMEOUT
+        if values.max_memory is None:
+            values.max_memory = BATCH_MAX_MEMORY
+    return values, filename
 
+
+def configure(values):
+    """
+    Configure Hachoir from the options.
+    """
     # Update limits
     config.MAX_STR_LENGTH = values.maxlen
     if values.raw:
         config.RAW_OUTPUT = True
 
-    return values, filename
-
+    if values.debug:
+        hachoir_config.debug = True
+    elif values.verbose:
+        hachoir_config.verbose = True
+    else:
+        hachoir_config.quiet = True
 
-def processFile(values, filename,
-                display_filename=False, priority=None, human=True, display=True):
-    charset = getTerminalCharset()
 
+def parseFile(values, filename, extract_metadata, store=False):
+    """
+    Parse filename: return (result, entry) where result is its metadata,
+    or its description (--type) or MIME type (--mime), and entry is its
+    cache entry if store is true (None otherwise). result is None on error.
+    """
     # Create parser
     try:
         if values.force_parser:
@@ -78,14 +134,13 @@ def processFile(values, filename,
         parser = createParser(filename, tags=tags)
     except InputStreamError as err:
         error(str(err))
-        return False
+        return None, None
     if not parser:
         error("Unable to parse file: %s" % filename)
-        return False
+        return None, None
 
     with parser:
         # Extract metadata
-        extract_metadata = not (values.mime or values.type)
         if extract_metadata:
             try:
                 metadata = extractMetadata(parser, values.quality)
@@ -95,45 +150,322 @@ def processFile(values, filename,
             if not metadata:
                 parser.error("Hachoir can't extract metadata, but is able to parse: %s"
                              % filename)
-                return False
+                return None, None
+            result = metadata
         else:
+            metadata = None
             if values.type:
                 result = parser.description
             else:
                 result = parser.mime_type
+        if store:
+            entry = createEntry(parser, metadata)
+        else:
+            entry = None
+    return result, entry
+
+
+def limitedParseFile(values, filename, extract_metadata, store=False):
+    """
+    Call parseFile() with the time and memory limits of the options
+    (--timeout and --max-memory).
+    """
+    func = parseFile
+    args = (values, filename, extract_metadata, store)
+    try:
+        if values.max_memory:
+            args = (values.max_memory * 1024 * 1024, func) + args
+            func = limitedMemory
+        if values.timeout:
+            args = (values.timeout, func) + args
+            func = limitedTime
+        return func(*args)
+    except Timeout:
+        error("Timeout while parsing %s" % filename)
+    except MemoryError:
+        error("Memory limit exceeded while parsing %s" % filename)
+    return None, None
+
+
+def readCache(values, filename, cache, extract_metadata):
+    """
+    Lookup filename in the cache: return (key, entry). entry is None if the
+    file is not cached (or if metadata are required but were not stored),
+    key is None if the file cannot be cached.
+    """
+    key = fileKey(filename, values.force_parser,
+                  (values.quality, config.MAX_STR_LENGTH, config.RAW_OUTPUT))
+    if key is None:
+        return None, None
+    entry = cache.get(key)
+    if entry is not None and extract_metadata and entry["metadata"] is None:
+        entry = None
+    return key, entry
+
+
+def entryResult(values, entry, extract_metadata):
+    """
+    Result of a cache entry: see parseFile().
+    """
+    if extract_metadata:
+        return entryMetadata(entry, values.quality)
+    elif values.type:
+        return entry["description"]
+    else:
+        return entry["mime_type"]
+
+
+def formatResult(filename, result, extract_metadata,
+                 display_filename, priority, human):
+    """
+    Format the result of parseFile() as a list of printable lines.
+    """
+    charset = getTerminalCharset()
+    if extract_metadata:
+        text = result.exportPlaintext(priority=priority, human=human)
+        if not text:
+            text = ["(no metadata, priority may be too small)"]
+        if display_filename:
+            text = ["%s: %s" % (filename, line) for line in text]
+        return [makePrintable(line, charset) for line in text]
+    else:
+        text = result
+        if display_filename:
+            text = "%s: %s" % (filename, text)
+        return [text]
+
+
+def processFile(values, filename,
+                display_filename=False, priority=None, human=True, display=True,
+                cache=None):
+    extract_metadata = not (values.mime or values.type)
+
+    if cache is not None:
+        key, entry = readCache(values, filename, cache, extract_metadata)
+    else:
+        key = entry = None
+    if entry is None:
+        result, entry = limitedParseFile(values, filename, extract_metadata,
+                                         key is not None)
+        if result is None:
+            return False
+        if key is not None:
+            cache.set(key, entry)
+    else:
+        result = entryResult(values, entry, extract_metadata)
 
     if display:
         # Display metadatas on stdout
-        if extract_metadata:
-            text = metadata.exportPlaintext(priority=priority, human=human)
-            if not text:
-                text = ["(no metadata, priority may be too small)"]
-            if display_filename:
-                for line in text:
-                    line = "%s: %s" % (filename, line)
-                    print(makePrintable(line, charset))
-            else:
-                for line in text:
-                    print(makePrintable(line, charset))
-        else:
-            text = result
-            if display_filename:
-                text = "%s: %s" % (filename, text)
-            print(text)
+        for line in formatResult(filename, result, extract_metadata,
+                                 display_filename, priority, human):
+            print(line)
     return True
 
 
+def iterFilenames(filenames, recursive):
+    """
+    Generate filenames. If recursive is true, directories are walked
+    (in sorted order).
+    """
+    for filename in filenames:
+        if recursive and os.path.isdir(filename):
+            for dirpath, dirnames, names in os.walk(filename):
+                dirnames.sort()
+                for name in sorted(names):
+                    yield os.path.join(dirpath, name)
+        else:
+            yield filename
+
+
 def processFiles(values, filenames, display=True):
     human = not values.raw
-    ok = True
     priority = int(values.level) * 100 + 99
-    display_filename = (1 < len(filenames))
-    for filename in filenames:
-        ok &= processFile(values, filename, display_filename,
-                          priority, human, display)
+    display_filename = (1 < len(filenames)) \
+        or (values.recursive and any(os.path.isdir(filename)
+                                     for filename in filenames))
+    filenames = iterFilenames(filenames, values.recursive)
+    if values.cache:
+        cache = MetadataCache(values.cache, values.cache_size * 1024 * 1024)
+    else:
+        cache = None
+    try:
+        if 1 < values.jobs:
+            return processFilesParallel(values, filenames, display_filename,
+                                        priority, human, display, cache)
+        ok = True
+        for filename in filenames:
+            ok &= processFile(values, filename, display_filename,
+                              priority, human, display, cache)
+        return ok
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+class Task:
+    """
+    File processed by processFilesParallel(): result is the result of
+    parseFile() once future is done, executor is the pool running future.
+    retry is true if the file has to be parsed again in its own process.
+    """
+    __slots__ = ("filename", "key", "retry", "executor", "future", "result")
+
+    def __init__(self, filename, key=None):
+        self.filename = filename
+        self.key = key
+        self.retry = False
+        self.executor = None
+        self.future = None
+        self.result = None
+
+
+def processFilesParallel(values, filenames, display_filename, priority,
+                         human, display, cache):
+    """
+    Process files in a pool of values.jobs processes. Results are displayed
+    in the order of filenames, or when they are ready with --unordered.
+
+    If a worker process dies (crash, killed by the kernel), the pool is
+    replaced and each file of the broken pool is parsed again alone in a new
+    process, to report only the file killing its process as an error.
+    """
+    extract_metadata = not (values.mime or values.type)
+    window = values.jobs * 4
+    pending = deque()
+    executor = None
+    ok = True
+
+    def createExecutor(jobs):
+        return ProcessPoolExecutor(jobs, initializer=_initWorker,
+                                   initargs=(values,))
+
+    def submit(task):
+        nonlocal executor
+        if executor is None:
+            executor = createExecutor(values.jobs)
+        task.executor = executor
+        try:
+            task.future = executor.submit(_parseFile, task.filename,
+                                          extract_metadata,
+                                          task.key is not None)
+        except BrokenProcessPool as err:
+            task.future = Future()
+            task.future.set_exception(err)
+
+    def restart(broken):
+        nonlocal executor
+        if executor is broken:
+            executor.shutdown(wait=False)
+            executor = None
+        for task in pending:
+            if task.executor is broken:
+                task.executor = task.future = None
+                task.retry = True
+
+    def retry(task):
+        task.retry = False
+        with createExecutor(1) as isolated:
+            task.future = isolated.submit(_parseFile, task.filename,
+                                          extract_metadata,
+                                          task.key is not None)
+            try:
+                task.future.result()
+            except BrokenProcessPool:
+                error("Worker process died while parsing %s" % task.filename)
+                task.future = None
+
+    def wait(task):
+        if task.retry:
+            retry(task)
+        while task.future is not None:
+            try:
+                result, entry = task.future.result()
+            except BrokenProcessPool:
+                restart(task.executor)
+                if task.retry:
+                    retry(task)
+                continue
+            except Exception as err:
+                error("Error while parsing %s: %s" % (task.filename, err))
+                result = entry = None
+            if extract_metadata and result is not None:
+                result = importMetadata(result, values.quality)
+            if result is not None and task.key is not None:
+                cache.set(task.key, entry)
+            task.result = result
+            task.future = None
+
+    def nextTask():
+        if values.unordered:
+            futures = [task.future for task in pending]
+            if None not in futures:
+                futures_wait(futures, return_when=FIRST_COMPLETED)
+            for task in pending:
+                if task.future is None or task.future.done():
+                    break
+        else:
+            task = pending[0]
+        wait(task)
+        pending.remove(task)
+        return task
+
+    def output(task):
+        nonlocal ok
+        if task.result is None:
+            ok = False
+        elif display:
+            for line in formatResult(task.filename, task.result,
+                                     extract_metadata, display_filename,
+                                     priority, human):
+                print(line)
+
+    try:
+        for filename in filenames:
+            if cache is not None:
+                key, entry = readCache(values, filename, cache,
+                                       extract_metadata)
+            else:
+                key = entry = None
+            task = Task(filename, key)
+            pending.append(task)
+            if entry is not None:
+                task.result = entryResult(values, entry, extract_metadata)
+            else:
+                submit(task)
+            while window < len(pending):
+                output(nextTask())
+        while pending:
+            output(nextTask())
+    finally:
+        if executor is not None:
+            for task in pending:
+                if task.future is not None:
+                    task.future.cancel()
+            executor.shutdown()
     return ok
 
 
+_worker_values = None
+
+
+def _initWorker(values):
+    global _worker_values
+    _worker_values = values
+    configure(values)
+
+
+def _parseFile(filename, extract_metadata, store):
+    """
+    Parse a file in a worker process: see limitedParseFile(). Metadata are
+    returned as their state (see Metadata.exportState()).
+    """
+    result, entry = limitedParseFile(_worker_values, filename,
+                                     extract_metadata, store)
+    if extract_metadata and result is not None:
+        result = result.exportState()
+    return result, entry
+
+
 def benchmarkMetadata(values, filenames):
     bench = Benchmark()
     bench.run(processFiles, values, filenames, display=False)
@@ -148,13 +480,7 @@ def main():
     try:
         # Parser options and initialize Hachoir
         values, filenames = parseOptions()
-
-        if values.debug:
-            hachoir_config.debug = True
-        elif values.verbose:
-            hachoir_config.verbose = True
-        else:
-            hachoir_config.quiet = True
+        configure(values)
 
         if values.profiler:
             ok = profile(values, filenames)
@@ -4,7 +4,7 @@ from hachoir.core.dict import Dict
 from hachoir.core.error import error
 from hachoir.core.log import Logger
 from hachoir.metadata.metadata_item import (
-    MIN_PRIORITY, MAX_PRIORITY, QUALITY_NORMAL)
+    MIN_PRIORITY, MAX_PRIORITY, QUALITY_NORMAL, DataValue)
 from hachoir.metadata.register import registerAllItems
 
 extractors = {}
@@ -221,6 +221,27 @@ class Metadata(Logger):
     def __bool__(self):
         return any(item for item in self.__data.values())
 
+    def exportState(self):
+        """
+        Export metadata to a structure of lists, dictionaries and strings
+        (eg. to serialize it as JSON) which can be restored by
+        importMetadata(). Values are exported as text.
+        """
+        items = []
+        for data in self:
+            if not data.values:
+                continue
+            values = [(makeUnicode(item.value), item.text)
+                      for item in data.values]
+            items.append((data.key, values))
+        return {"header": self.header, "items": items}
+
+    def _importState(self, state):
+        self.setHeader(state["header"])
+        for key, values in state["items"]:
+            self.getItems(key).values.extend(
+                DataValue(value, text) for value, text in values)
+
 
 class RootMetadata(Metadata):
 
@@ -307,6 +328,30 @@ class MultipleMetadata(RootMetadata):
                 text.update(value)
         return text
 
+    def exportState(self):
+        state = RootMetadata.exportState(self)
+        state["groups"] = [(key, metadata.exportState())
+                           for key, metadata in self.__groups.items()]
+        return state
+
+    def _importState(self, state):
+        RootMetadata._importState(self, state)
+        for key, group in state["groups"]:
+            self.addGroup(key, importMetadata(group, self.quality))
+
+
+def importMetadata(state, quality=QUALITY_NORMAL):
+    """
+    Create a metadata object from a state created by
+    Metadata.exportState(). Values are restored as text.
+    """
+    if "groups" in state:
+        metadata = MultipleMetadata(quality)
+    else:
+        metadata = RootMetadata(quality)
+    metadata._importState(state)
+    return metadata
+
 
 def registerExtractor(parser, extractor):
     assert parser not in extractors
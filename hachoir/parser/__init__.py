@@ -1,6 +1,12 @@
 from hachoir.parser.parser import ValidateError, HachoirParser, Parser  # noqa
 from hachoir.parser.parser_list import ParserList, HachoirParserList  # noqa
 from hachoir.parser.guess import QueryParser, guessParser, createParser  # noqa
-from hachoir.parser import (archive, audio, container,  # noqa
-                            file_system, image, game, misc, network, program,
-                            video)
+from hachoir.parser.parser_list import PARSER_PACKAGES
+from importlib import import_module
+
+
+def __getattr__(name):
+    # Parser packages are imported on demand
+    if name in PARSER_PACKAGES:
+        return import_module("hachoir.parser." + name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -1,16 +1,21 @@
-from hachoir.parser.archive.ace import AceFile  # noqa
-from hachoir.parser.archive.ar import ArchiveFile  # noqa
-from hachoir.parser.archive.arj import ArjParser  # noqa
-from hachoir.parser.archive.bomstore import BomFile  # noqa
-from hachoir.parser.archive.bzip2_parser import Bzip2Parser  # noqa
-from hachoir.parser.archive.cab import CabFile  # noqa
-from hachoir.parser.archive.gzip_parser import GzipParser  # noqa
-from hachoir.parser.archive.tar import TarFile  # noqa
-from hachoir.parser.archive.zip import ZipFile  # noqa
-from hachoir.parser.archive.rar import RarFile  # noqa
-from hachoir.parser.archive.rpm import RpmFile  # noqa
-from hachoir.parser.archive.sevenzip import SevenZipParser  # noqa
-from hachoir.parser.archive.mar import MarFile  # noqa
-from hachoir.parser.archive.mozilla_ar import MozillaArchive  # noqa
-from hachoir.parser.archive.zlib import ZlibData  # noqa
-from hachoir.parser.archive.prs_pak import PRSPakFile  # noqa
+from hachoir.parser.parser_list import lazyPackage
+
+# Parser classes, their module is imported on first access
+__getattr__, __dir__ = lazyPackage(__name__, {
+    "AceFile": "ace",
+    "ArchiveFile": "ar",
+    "ArjParser": "arj",
+    "BomFile": "bomstore",
+    "Bzip2Parser": "bzip2_parser",
+    "CabFile": "cab",
+    "GzipParser": "gzip_parser",
+    "TarFile": "tar",
+    "ZipFile": "zip",
+    "RarFile": "rar",
+    "RpmFile": "rpm",
+    "SevenZipParser": "sevenzip",
+    "MarFile": "mar",
+    "MozillaArchive": "mozilla_ar",
+    "ZlibData": "zlib",
+    "PRSPakFile": "prs_pak",
+})
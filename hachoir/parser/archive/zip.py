@@ -466,10 +466,9 @@ class ZipFile(Parser):
             return "application/zip"
 
     def createFilenameSuffix(self):
-        if self["file[0]/filename"].value == "mimetype":
-            mime = self["file[0]/compressed_data"].value
-            if mime in self.MIME_TYPES:
-                return "." + self.MIME_TYPES[mime]
+        mime = self.mime_type
+        if mime in self.MIME_TYPES:
+            return "." + self.MIME_TYPES[mime]
         return ".zip"
 
     def createContentSize(self):
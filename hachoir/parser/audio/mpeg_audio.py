@@ -187,28 +187,17 @@ def findSynchronizeBits(parser, start, max_size):
     """
     address0 = parser.absolute_address
     end = start + max_size
-    size = 0
-    while start < end:
-        # Fast search: search 0xFF (first byte of sync frame field)
-        length = parser.stream.searchBytesLength(b"\xff", False, start, end)
-        if length is None:
-            return None
-        size += length
-        start += length * 8
-
+    # Fast search: search 0xFF (first byte of sync frame field)
+    for address in parser.stream.iterSearchBytes(b"\xff", start, end):
         # Strong validation of frame: create the frame
         # and call method isValid()
         try:
-            frame = createOrphanField(parser, start - address0, Frame, "frame")
+            frame = createOrphanField(parser, address - address0, Frame, "frame")
             valid = frame.isValid()
         except Exception:
             valid = False
         if valid:
-            return size
-
-        # Invalid frame: continue
-        start += 8
-        size += 1
+            return (address - start) // 8
     return None
 
 
@@ -1,4 +1,5 @@
 from hachoir.field import CompressedField
+from copy import copy
 
 try:
     from zlib import decompressobj, MAX_WBITS
@@ -16,6 +17,11 @@ try:
                 data = b''
             return self.gzip.decompress(self.gzip.unconsumed_tail + data, size)
 
+        def copy(self):
+            decompressor = copy(self)
+            decompressor.gzip = self.gzip.copy()
+            return decompressor
+
     class DeflateStreamWbits(DeflateStream):
 
         def __init__(self, stream):
@@ -23,7 +23,7 @@ from hachoir.field import (ParserError, FieldSet, MissingField,
                            Enum,
                            Bit, NullBits, Bits, UInt8, Int16, UInt16, UInt24, Int32, UInt32, Int64, UInt64, TimestampMac32,
                            String, PascalString8, PascalString16, CString,
-                           RawBytes, NullBytes, PaddingBits)
+                           RawBytes, NullBytes, PaddingBits, PackedVector)
 from hachoir.field.timestamp import timestampFactory
 from hachoir.core.endian import BIG_ENDIAN
 from hachoir.core.text_handler import textHandler
@@ -797,8 +797,9 @@ class ChunkOffsetTable(FieldSet):
         yield UInt8(self, "version")
         yield NullBits(self, "flags", 24)
         yield UInt32(self, "count", description="Total entries in offset table")
-        for i in range(self['count'].value):
-            yield UInt32(self, "chunk_offset[]")
+        if self['count'].value:
+            yield PackedVector(self, "chunk_offsets", self['count'].value,
+                               UInt32, "chunk_offset")
 
 
 class ChunkOffsetTable64(FieldSet):
@@ -807,8 +808,9 @@ class ChunkOffsetTable64(FieldSet):
         yield UInt8(self, "version")
         yield NullBits(self, "flags", 24)
         yield UInt32(self, "count", description="Total entries in offset table")
-        for i in range(self['count'].value):
-            yield UInt64(self, "chunk_offset[]")
+        if self['count'].value:
+            yield PackedVector(self, "chunk_offsets", self['count'].value,
+                               UInt64, "chunk_offset")
 
 
 # ISO/IEC 14496-14:2003 5.6
@@ -1158,9 +1160,9 @@ class SampleSizeTable(FieldSet):
         yield NullBits(self, "flags", 24)
         yield UInt32(self, "uniform_size", description="Uniform size of each sample (0 if non-uniform)")
         yield UInt32(self, "count", description="Number of samples")
-        if self['uniform_size'].value == 0:
-            for i in range(self['count'].value):
-                yield UInt32(self, "sample_size[]")
+        if self['uniform_size'].value == 0 and self['count'].value:
+            yield PackedVector(self, "sample_sizes", self['count'].value,
+                               UInt32, "sample_size")
 
 
 class CompactSampleSizeTable(FieldSet):
@@ -2,7 +2,7 @@ from hachoir.parser import Parser
 from hachoir.field import (FieldSet, StaticFieldSet,
                            RawBytes, PaddingBytes, createPaddingField, Link, Fragment,
                            Bit, Bits, UInt8, UInt16, UInt32,
-                           String, Bytes, NullBytes)
+                           String, Bytes, NullBytes, PackedVector)
 from hachoir.field.integer import GenericInteger
 from hachoir.core.endian import LITTLE_ENDIAN
 from hachoir.core.text_handler import textHandler, hexadecimal
@@ -62,30 +62,54 @@ class FSInfo(StaticFieldSet):
     )
 
 
-class FAT(FieldSet):
+class FatEntry(GenericInteger):
+    """
+    FAT entry, static_size is the FAT version (12, 16 or 32 bits)
+    """
+    static_signed = False
 
-    def createFields(self):
-        version = self.parent.version
-        max_entry = 1 << min(28, version)
-
-        def FatEntry(chunk):
-            i = chunk.value
-            j = (1 - i) % max_entry
-            if j == 0:
-                return "reserved cluster"
-            elif j == 1:
-                return "free cluster"
-            elif j < 10:
-                return "end of a chain"
-            elif j == 10:
-                return "bad cluster"
-            elif j < 18:
-                return "reserved value"
-            else:
-                return str(i)
+    def __init__(self, parent, name, description=None):
+        GenericInteger.__init__(self, parent, name, False,
+                                self.static_size, description)
 
-        while self.current_size < self._size:
-            yield textHandler(GenericInteger(self, 'entry[]', False, version), FatEntry)
+    def createDisplay(self):
+        i = self.value
+        j = (1 - i) % (1 << min(28, self.static_size))
+        if j == 0:
+            return "reserved cluster"
+        elif j == 1:
+            return "free cluster"
+        elif j < 10:
+            return "end of a chain"
+        elif j == 10:
+            return "bad cluster"
+        elif j < 18:
+            return "reserved value"
+        else:
+            return str(i)
+
+
+class FatEntry12(FatEntry):
+    static_size = 12
+
+
+class FatEntry16(FatEntry):
+    static_size = 16
+
+
+class FatEntry32(FatEntry):
+    static_size = 32
+
+
+FAT_ENTRY = {12: FatEntry12, 16: FatEntry16, 32: FatEntry32}
+
+
+class FAT(PackedVector):
+
+    def __init__(self, parent, name, description, size):
+        entry = FAT_ENTRY[parent.version]
+        PackedVector.__init__(self, parent, name, size // entry.static_size,
+                              entry, "entry", description, size=size)
 
 
 class Date(FieldSet):
@@ -344,10 +368,14 @@ class FAT_FS(Parser):
         max_entry = (1 << min(28, self.version)) - 16
         cluster = cluster_func()
         if 1 < cluster < max_entry:
+            fat = self.fat.values
             clus_nb = 1
             next = cluster
             while True:
-                next = self.fat[next / 1000][next % 1000].value
+                try:
+                    next = fat[next]
+                except IndexError:
+                    break
                 if not 1 < next < max_entry:
                     break
                 if cluster + clus_nb == next:
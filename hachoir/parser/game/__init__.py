@@ -1,4 +1,10 @@
-from hachoir.parser.game.zsnes import ZSNESFile  # noqa
-from hachoir.parser.game.spider_man_video import SpiderManVideoFile  # noqa
-from hachoir.parser.game.laf import LafFile  # noqa
-from hachoir.parser.game.blp import BLP1File, BLP2File  # noqa
+from hachoir.parser.parser_list import lazyPackage
+
+# Parser classes, their module is imported on first access
+__getattr__, __dir__ = lazyPackage(__name__, {
+    "ZSNESFile": "zsnes",
+    "SpiderManVideoFile": "spider_man_video",
+    "LafFile": "laf",
+    "BLP1File": "blp",
+    "BLP2File": "blp",
+})
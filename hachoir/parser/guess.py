@@ -6,13 +6,60 @@ Parser list managment:
 import os
 from hachoir.core.error import warning, info
 from hachoir.parser import ValidateError, HachoirParserList
+from hachoir.parser.parser_list import parserClass
 from hachoir.stream import FileInputStream
+from hachoir.stream.input import SnapshotStream
+from threading import Lock
+from time import perf_counter
 import weakref
 
 
+class ValidationStats(object):
+    """
+    Validation statistics of the parser classes: number of validations,
+    number of valid streams and time in seconds. It can be updated by
+    several threads.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counters = {}
+
+    def add(self, parser, valid, seconds):
+        with self._lock:
+            counters = self._counters.get(parser)
+            if counters is None:
+                counters = self._counters[parser] = [0, 0, 0.0]
+            counters[0] += 1
+            counters[1] += valid
+            counters[2] += seconds
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+    def items(self):
+        """
+        List of (parser class, number of validations, number of valid
+        streams, time in seconds), slowest first.
+        """
+        with self._lock:
+            stats = [(parser,) + tuple(counters)
+                     for parser, counters in self._counters.items()]
+        stats.sort(key=lambda item: item[3], reverse=True)
+        return stats
+
+
 class QueryParser(object):
     fallback = None
     other = None
+    # Size in bytes of the start and of the end of the stream read at once
+    # to validate the parsers
+    snapshot_head = 1 << 16
+    snapshot_tail = 0
+    # ValidationStats updated by the validations, None to disable them
+    # (see enableValidationStats())
+    validation_stats = None
 
     def __init__(self, tags):
         self.validate = True
@@ -27,10 +74,11 @@ class QueryParser(object):
             parsers += self._getByTag(tag)
             if self.fallback is None:
                 self.fallback = len(parsers) == 1
+        # Number of parsers selected by tags
+        self.tagged = len(parsers)
         if self.parsers:
-            other = len(parsers)
             parsers += list(self.parsers)
-            self.other = parsers[other]
+            self.other = parsers[self.tagged]
         self.parsers = parsers
 
     def __iter__(self):
@@ -85,19 +133,64 @@ class QueryParser(object):
         else:
             parser = None
         if parser is not None:
-            if parser.__class__ in self.parsers:
+            # Only import the parsers having the name of the parser class
+            cls = parser.__class__
+            if any(parserClass(candidate) is cls
+                   for candidate in self.parsers
+                   if candidate.__name__ == cls.__name__):
                 return parser
         parser = self.doparse(stream, fallback)
         if parser is not None:
             stream._cached_parser = weakref.ref(parser)
         return parser
 
+    def _candidates(self, stream):
+        """
+        Order the parsers to validate: the parsers selected by tags, then
+        the parsers whose magic matches the start of the stream, the
+        parsers without magic, and the other parsers (the magic tags don't
+        list all the variants of a format).
+        """
+        db = self.db
+        other = self.parsers[self.tagged:]
+        if not other or not db.magic_index:
+            return self.parsers
+        data = stream.readBytes(0, min(stream.size >> 3, db.magic_size))
+        matched = db.matchMagic(data)
+        magic_parsers = db.magic_parsers
+        candidates = [parser for parser in other if parser in matched]
+        candidates += [parser for parser in other
+                       if parser not in magic_parsers]
+        candidates += [parser for parser in other
+                       if parser in magic_parsers and parser not in matched]
+        return self.parsers[:self.tagged] + candidates
+
     def doparse(self, stream, fallback=True):
         fb = None
         warn = warning
-        for parser in self.parsers:
+        probe = stream
+        parsers = self.parsers
+        if self.validate and 1 < len(parsers) and stream.size:
+            # Serve the validation reads from a snapshot of the stream
+            probe = SnapshotStream(stream, self.snapshot_head,
+                                   self.snapshot_tail)
+            parsers = self._candidates(probe)
+        other = parsers[self.tagged] if self.tagged < len(parsers) else None
+        stats = self.validation_stats if self.validate else None
+        for parser in parsers:
+            if stats is not None:
+                start = perf_counter()
+            valid = False
+            # Statistics are keyed by parser class, not by LazyParser
+            cls = parser
             try:
-                parser_obj = parser(stream, validate=self.validate)
+                cls = parserClass(parser)
+                parser_obj = cls(probe, validate=self.validate)
+                valid = True
+                if probe is not stream:
+                    # The snapshot has the content of the stream: don't
+                    # validate the parser again
+                    parser_obj = cls(stream)
                 if self.parser_args:
                     for key, value in self.parser_args.items():
                         setattr(parser_obj, key, value)
@@ -105,19 +198,47 @@ class QueryParser(object):
             except ValidateError as err:
                 if fallback and self.fallback:
                     fb = parser
-                if parser == self.other:
+                if parser == other:
                     warn = info
                 warn("Skip parser '%s': %s" % (parser.__name__, err))
             except Exception as err:
-                if parser == self.other:
+                if parser == other:
                     warn = info
                 warn("Skip parser '%s': %s" % (parser.__name__, err))
+            finally:
+                if stats is not None:
+                    stats.add(cls, valid, perf_counter() - start)
             fallback = False
         if self.use_fallback and fb:
             warning("Force use of parser '%s'" % fb.__name__)
             return fb(stream)
 
 
+def enableValidationStats(enable=True):
+    """
+    Enable (or disable) the validation statistics of QueryParser. They are
+    reset when enabled.
+    """
+    QueryParser.validation_stats = ValidationStats() if enable else None
+
+
+def resetValidationStats():
+    if QueryParser.validation_stats is not None:
+        QueryParser.validation_stats.reset()
+
+
+def validationStats():
+    """
+    Validation statistics of the parsers, slowest first: list of
+    (parser class, number of validations, number of valid streams, time
+    in seconds). The list is empty if the statistics are disabled (see
+    enableValidationStats()).
+    """
+    if QueryParser.validation_stats is None:
+        return []
+    return QueryParser.validation_stats.items()
+
+
 def guessParser(stream):
     return QueryParser(stream.tags).parse(stream)
 
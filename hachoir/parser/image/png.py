@@ -21,6 +21,7 @@ from hachoir.core.text_handler import textHandler, hexadecimal
 from hachoir.core.endian import NETWORK_ENDIAN
 from hachoir.core.tools import humanFilesize
 from datetime import datetime
+from copy import copy
 
 MAX_FILESIZE = 500 * 1024 * 1024  # 500 MB
 
@@ -37,6 +38,11 @@ try:
                 data = self.gzip.unconsumed_tail
             return self.gzip.decompress(data, size)
 
+        def copy(self):
+            decompressor = copy(self)
+            decompressor.gzip = self.gzip.copy()
+            return decompressor
+
     has_deflate = True
 except ImportError:
     has_deflate = False
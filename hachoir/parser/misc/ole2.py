@@ -24,7 +24,7 @@ from hachoir.parser import HachoirParser
 from hachoir.field import (
     FieldSet, ParserError, SeekableFieldSet, RootSeekableFieldSet,
     UInt8, UInt16, UInt32, UInt64, TimestampWin64, Enum,
-    Bytes, NullBytes, String, CustomFragment)
+    Bytes, NullBytes, String, CustomFragment, PackedVector)
 from hachoir.core.text_handler import filesizeHandler
 from hachoir.core.endian import LITTLE_ENDIAN
 from hachoir.parser.common.win32 import GUID
@@ -156,17 +156,14 @@ class Header(FieldSet):
 HEADER_SIZE = 64 + Header.static_size + NB_DIFAT * SECT.static_size
 
 
-class SectFat(FieldSet):
+class SectFat(PackedVector):
 
     def __init__(self, parent, name, start, count, description=None):
-        FieldSet.__init__(self, parent, name, description, size=count * 32)
+        PackedVector.__init__(self, parent, name, count, SECT, "index",
+                              description, first_index=start)
         self.count = count
         self.start = start
 
-    def createFields(self):
-        for i in range(self.start, self.start + self.count):
-            yield SECT(self, "index[%u]" % i)
-
 
 class OLE2_File(HachoirParser, RootSeekableFieldSet):
     PARSER_TAGS = {
@@ -334,7 +331,7 @@ class OLE2_File(HachoirParser, RootSeekableFieldSet):
             previous = block
             index = block // items_per_fat
             try:
-                block = fat[index]["index[%u]" % block].value
+                block = fat[index].values[block - fat[index].start]
             except LookupError:
                 break
 
@@ -375,8 +372,7 @@ class OLE2_File(HachoirParser, RootSeekableFieldSet):
     def createContentSize(self):
         max_block = 0
         for fat in self.array("bbfat"):
-            for entry in fat:
-                block = entry.value
+            for block in fat.values:
                 if block not in SECT.SPECIALS:
                     max_block = max(block, max_block)
         if max_block in SECT.SPECIALS:
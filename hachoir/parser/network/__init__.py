@@ -1 +1,6 @@
-from hachoir.parser.network.tcpdump import TcpdumpFile  # noqa
+from hachoir.parser.parser_list import lazyPackage
+
+# Parser classes, their module is imported on first access
+__getattr__, __dir__ = lazyPackage(__name__, {
+    "TcpdumpFile": "tcpdump",
+})
@@ -1,6 +1,6 @@
 from hachoir.field import FieldSet, Field, Bits
 from hachoir.core.bits import str2hex
-from hachoir.parser.network.ouid import REGISTERED_OUID
+from hachoir.parser.network.ouid import lookupOUID
 from hachoir.core.endian import BIG_ENDIAN
 from socket import gethostbyaddr, herror as socket_host_error
 
@@ -73,9 +73,9 @@ class OrganizationallyUniqueIdentifier(Bits):
 
     def createDisplay(self, human=True):
         if human:
-            key = self.value
-            if key in REGISTERED_OUID:
-                return REGISTERED_OUID[key]
+            name = lookupOUID(self.value)
+            if name is not None:
+                return name
             else:
                 return self.raw_display
         else:
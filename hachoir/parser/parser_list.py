@@ -1,9 +1,117 @@
 import re
-import types
 from hachoir.core.error import error
 from hachoir.parser import Parser, HachoirParser
+from hachoir.parser.parser_manifest import PARSERS
+from importlib import import_module
 import sys
 
+# Packages of the parser modules
+PARSER_PACKAGES = ("archive", "audio", "container", "file_system", "game",
+                   "image", "misc", "network", "program", "video")
+
+
+class LazyParser(object):
+    """
+    Parser class of the parser manifest, imported when it is first called:
+    calling a LazyParser creates a parser. Its tags are read from the
+    manifest.
+
+    A LazyParser is only equal to a LazyParser of the same class: use
+    parserClass() to compare it to a parser class.
+    """
+
+    def __init__(self, module, name, tags):
+        self.module = module
+        self.__name__ = name
+        self.PARSER_TAGS = tags
+        self._parser = None
+
+    def load(self):
+        """
+        Import the parser class.
+        """
+        if self._parser is None:
+            self._parser = getattr(import_module(self.module), self.__name__)
+        return self._parser
+
+    def __call__(self, *args, **kw):
+        return self.load()(*args, **kw)
+
+    def getParserTags(self):
+        return dict(self.PARSER_TAGS)
+
+    def print_(self, out, verbose):
+        HachoirParser.print_.__func__(self, out, verbose)
+
+    def __eq__(self, other):
+        if not isinstance(other, LazyParser):
+            return NotImplemented
+        return (other.module, other.__name__) == (self.module, self.__name__)
+
+    def __hash__(self):
+        return hash((self.module, self.__name__))
+
+    def __reduce__(self):
+        return (LazyParser, (self.module, self.__name__, self.PARSER_TAGS))
+
+    def __repr__(self):
+        return "<LazyParser %s.%s>" % (self.module, self.__name__)
+
+
+def parserClass(parser):
+    """
+    Parser class of a parser of the parser list (import it if needed).
+    """
+    if isinstance(parser, LazyParser):
+        return parser.load()
+    return parser
+
+
+def lazyPackage(package, exports):
+    """
+    Create the __getattr__() and __dir__() functions of a parser package
+    importing its parser classes on first access: exports maps a class
+    name to the name of its module in the package.
+    """
+    def __getattr__(name):
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError("module %r has no attribute %r"
+                                 % (package, name)) from None
+        value = getattr(import_module(package + "." + module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+    return __getattr__, __dir__
+
+
+def scanParsers():
+    """
+    Import all parser modules: return the list of the parser classes.
+    """
+    parsers = []
+    for package in PARSER_PACKAGES:
+        module = import_module("hachoir.parser." + package)
+        for name in dir(module):
+            attr = getattr(module, name)
+            if isinstance(attr, type) \
+                    and issubclass(attr, HachoirParser) \
+                    and attr not in (Parser, HachoirParser):
+                parsers.append(attr)
+    return parsers
+
+
+def manifestEntries():
+    """
+    Entries of the parser manifest: list of (module, class name, tags)
+    of all parsers (see tools/make_parser_manifest.py).
+    """
+    return [(parser.__module__, parser.__name__, parser.getParserTags())
+            for parser in scanParsers()]
+
 # Parser list ################################################################
 
 
@@ -15,6 +123,13 @@ class ParserList(object):
     def __init__(self):
         self.parser_list = []
         self.bytag = {"id": {}, "category": {}}
+        # Index of the magics: (offset, length) => {magic: [parser, ...]},
+        # offset and length in bytes
+        self.magic_index = {}
+        # Parsers of the index and number of bytes needed to match all
+        # the magics
+        self.magic_parsers = set()
+        self.magic_size = 0
 
     def translate(self, name, value):
         if name in ("magic",):
@@ -82,6 +197,27 @@ class ParserList(object):
             for value in values:
                 byname.setdefault(value, []).append(parser)
 
+        magics = tags.get("magic")
+        if magics and all(offset % 8 == 0 for magic, offset in magics):
+            for magic, offset in magics:
+                key = (offset // 8, len(magic))
+                self.magic_index.setdefault(key, {}) \
+                    .setdefault(magic, []).append(parser)
+                self.magic_size = max(self.magic_size, sum(key))
+            self.magic_parsers.add(parser)
+
+    def matchMagic(self, data):
+        """
+        Return the set of parsers having a magic matching data, the start
+        of a file.
+        """
+        parsers = set()
+        for (offset, length), magics in self.magic_index.items():
+            found = magics.get(data[offset:offset + length])
+            if found:
+                parsers.update(found)
+        return parsers
+
     def __iter__(self):
         return iter(self.parser_list)
 
@@ -193,7 +329,8 @@ class HachoirParserList(ParserList):
 
     def _load(self):
         """
-        Load all parsers from "hachoir.parser" module.
+        Register the parsers of the parser manifest: the parser modules
+        are imported on demand.
 
         Return the list of loaded parsers.
         """
@@ -201,19 +338,7 @@ class HachoirParserList(ParserList):
         if self.parser_list:
             return self.parser_list
 
-        todo = []
-        module = __import__("hachoir.parser").parser
-        for attrname in dir(module):
-            attr = getattr(module, attrname)
-            if isinstance(attr, types.ModuleType):
-                todo.append(attr)
-
-        for module in todo:
-            for name in dir(module):
-                attr = getattr(module, name)
-                if isinstance(attr, type) \
-                        and issubclass(attr, HachoirParser) \
-                        and attr not in (Parser, HachoirParser):
-                    self.add(attr)
+        for module, name, tags in PARSERS:
+            self.add(LazyParser(module, name, tags))
         assert 1 <= len(self.parser_list)
         return self.parser_list
@@ -1,8 +1,14 @@
-from hachoir.parser.program.elf import ElfFile  # noqa
-from hachoir.parser.program.exe import ExeFile  # noqa
-from hachoir.parser.program.macho import MachoFile, MachoFatFile  # noqa
-from hachoir.parser.program.python import PythonCompiledFile  # noqa
-from hachoir.parser.program.java import JavaCompiledClassFile  # noqa
-from hachoir.parser.program.prc import PRCFile  # noqa
-from hachoir.parser.program.nds import NdsFile  # noqa
-from hachoir.parser.program.java_serialized import JavaSerializedFile  # noqa
+from hachoir.parser.parser_list import lazyPackage
+
+# Parser classes, their module is imported on first access
+__getattr__, __dir__ = lazyPackage(__name__, {
+    "ElfFile": "elf",
+    "ExeFile": "exe",
+    "MachoFile": "macho",
+    "MachoFatFile": "macho",
+    "PythonCompiledFile": "python",
+    "JavaCompiledClassFile": "java",
+    "PRCFile": "prc",
+    "NdsFile": "nds",
+    "JavaSerializedFile": "java_serialized",
+})
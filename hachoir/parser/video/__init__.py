@@ -1,4 +1,9 @@
-from hachoir.parser.video.asf import AsfFile  # noqa
-from hachoir.parser.video.flv import FlvFile  # noqa
-from hachoir.parser.video.mpeg_video import MPEGVideoFile  # noqa
-from hachoir.parser.video.mpeg_ts import MPEG_TS  # noqa
+from hachoir.parser.parser_list import lazyPackage
+
+# Parser classes, their module is imported on first access
+__getattr__, __dir__ = lazyPackage(__name__, {
+    "AsfFile": "asf",
+    "FlvFile": "flv",
+    "MPEGVideoFile": "mpeg_video",
+    "MPEG_TS": "mpeg_ts",
+})
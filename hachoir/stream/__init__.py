@@ -2,8 +2,10 @@ from hachoir.core.endian import BIG_ENDIAN, LITTLE_ENDIAN  # noqa
 from hachoir.stream.stream import StreamError  # noqa
 from hachoir.stream.input import (InputStreamError,  # noqa
                                   InputStream, InputIOStream, StringInputStream,
-                                  InputSubStream, InputFieldStream,
-                                  FragmentedStream, ConcatStream)
-from hachoir.stream.input_helper import FileInputStream, guessStreamCharset  # noqa
+                                  MmapInputStream, InputSubStream, InputFieldStream,
+                                  FragmentedStream, ConcatStream,
+                                  RangeInputStream)
+from hachoir.stream.input_helper import (FileInputStream, FileConcatStream,  # noqa
+                                         URLInputStream, guessStreamCharset)
 from hachoir.stream.output import (OutputStreamError,  # noqa
                                    FileOutputStream, StringOutputStream, OutputStream)
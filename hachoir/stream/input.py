@@ -2,10 +2,17 @@ from hachoir.core.endian import BIG_ENDIAN, LITTLE_ENDIAN, MIDDLE_ENDIAN
 from hachoir.core.error import info
 from hachoir.core.log import Logger
 from hachoir.core.bits import str2long
-from hachoir.core.tools import lowerBound
 from hachoir.core.tools import alignValue
 from errno import ESPIPE
-from weakref import ref as weakref_ref
+from weakref import finalize, ref as weakref_ref
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from tempfile import TemporaryFile
+from queue import Queue
+from threading import Lock, Thread
+import mmap
+import re
 from hachoir.stream import StreamError
 
 
@@ -128,6 +135,9 @@ class FileFromInputStream:
 class InputStream(Logger):
     _set_size = None
     _current_size = 0
+    cache = None
+    # Maximum size in bytes of the data read at once by searchBytes()
+    search_window = 1 << 20
 
     def __init__(self, source=None, size=None, packets=None, **args):
         self.source = source
@@ -246,172 +256,578 @@ class InputStream(Logger):
         be aligned to byte. Returns the address of the bytes if found,
         None else.
         """
+        for address, found in self._iterSearch((needle,), start_address,
+                                               end_address):
+            return address
+        return None
+
+    def searchBytesAny(self, needles, start_address=0, end_address=None):
+        """
+        Search the first occurrence of any of the needles in
+        [start_address;end_address[. Returns (address, needle), or None if
+        no needle can be found. If several needles are found at the same
+        address, the longest one is returned.
+        """
+        for match in self._iterSearch(needles, start_address, end_address):
+            return match
+        return None
+
+    def iterSearchBytes(self, needle, start_address=0, end_address=None):
+        """
+        Generate the addresses of the non-overlapping occurrences of needle
+        in [start_address;end_address[, like re.finditer().
+        """
+        for address, found in self._iterSearch((needle,), start_address,
+                                               end_address):
+            yield address
+
+    def _iterSearch(self, needles, start_address, end_address):
         if start_address % 8:
             raise InputStreamError(
                 "Unable to search bytes with address with bit granularity")
-        length = len(needle)
-        size = max(3 * length, 4096)
-        buffer = b''
-
-        if self._size and (end_address is None or self._size < end_address):
-            end_address = self._size
-
+        needles = sorted(set(needles), key=len, reverse=True)
+        if len(needles) == 1:
+            needle = needles[0]
+            regex = None
+        else:
+            regex = re.compile(b"|".join(re.escape(needle) for needle in needles))
+        start = start_address >> 3
+        if end_address is not None:
+            end_address >>= 3
+        for address, data, lo, hi, stop in self._searchWindows(
+                start, end_address, len(needles[0]) - 1):
+            # Skip the end of a match reported in the previous window
+            lo = max(lo, start - address)
+            while True:
+                if regex is None:
+                    found = data.find(needle, lo, stop)
+                    if found < 0:
+                        break
+                else:
+                    match = regex.search(data, lo, stop)
+                    if match is None:
+                        break
+                    found = match.start()
+                    needle = match.group()
+                if hi <= found:
+                    break
+                yield 8 * (address + found), needle
+                lo = found + len(needle)
+                start = address + lo
+
+    def _searchWindows(self, start, end, overlap):
+        """
+        Generate the windows searched by searchBytes(): (address, data, lo,
+        hi, stop) where data[0] is the byte at address (in bytes). Needles
+        are searched in data[lo:stop] and must start before data[hi]: the
+        next window starts at hi, the overlap bytes after hi are only used
+        to find needles crossing hi. The windows cover [start;end[, or
+        until the end of the stream if end is None.
+
+        The size of the windows grows from 4 KB to search_window bytes, so
+        that a needle close to start is found without reading much data.
+        """
+        size = max(3 * overlap, 4096)
         while True:
-            if end_address is not None:
-                todo = (end_address - start_address) >> 3
-                if todo < size:
-                    if todo <= 0:
-                        return None
-                    size = todo
-            data = self.readBytes(start_address, size)
-            if end_address is None and self._size:
-                end_address = self._size
-                size = (end_address - start_address) >> 3
-                assert size > 0
-                data = data[:size]
-            start_address += 8 * size
-            buffer = buffer[len(buffer) - length + 1:] + data
-            found = buffer.find(needle)
-            if found >= 0:
-                return start_address + (found - len(buffer)) * 8
+            if self._size is not None and (end is None or self._size < 8 * end):
+                end = self._size >> 3
+            if end is not None:
+                size = min(size, end - start)
+                if size <= overlap:
+                    return
+            data, missing = self._searchRead(start, size)
+            if self._size is not None and self._size < 8 * (start + len(data)):
+                data = data[:(self._size >> 3) - start]
+            if missing or len(data) < size or start + len(data) == end:
+                yield start, data, 0, len(data), len(data)
+                return
+            hi = len(data) - overlap
+            yield start, data, 0, hi, len(data)
+            start += hi
+            size = min(2 * size, max(self.search_window, 3 * overlap))
+
+    def _searchRead(self, address, size):
+        """
+        Read a window of searchBytes(): return (data, missing).
+        """
+        shift, data, missing = self.read(8 * address, 8 * size)
+        return data, missing
 
     def file(self):
         return FileFromInputStream(self)
 
+    def getFileOffset(self, address):
+        """
+        If the data at 'address' (in bits, aligned to byte) are stored
+        as-is in a regular file, return (file descriptor, offset in bytes).
+        Return None otherwise.
+        """
+        return None
+
 
 class InputPipe(object):
     """
-    InputPipe makes input streams seekable by caching a certain
-    amount of data. The memory usage may be unlimited in worst cases.
-    A function (set_size) is called when the size of the stream is known.
+    InputPipe makes input streams seekable by keeping the data already
+    read. A function (set_size) is called when the size of the stream is
+    known.
 
     InputPipe sees the input stream as an array of blocks of
-    size = (2 ^ self.buffer_size) and self.buffers maps to this array.
-    It also maintains a circular ordered list of non-discarded blocks,
-    sorted by access time.
-
-    Each element of self.buffers is an array of 3 elements:
-     * self.buffers[i][0] is the data.
-       len(self.buffers[i][0]) == 1 << self.buffer_size
-       (except at the end: the length may be smaller)
-     * self.buffers[i][1] is the index of a more recently used block
-     * self.buffers[i][2] is the opposite of self.buffers[1],
-       in order to have a double-linked list.
-    For any discarded block, self.buffers[i] = None
-
-    self.last is the index of the most recently accessed block.
-    self.first is the first (= smallest index) non-discarded block.
-
-    How InputPipe discards blocks:
-     * Just before returning from the read method.
-     * Only if there are more than self.buffer_nb_min blocks in memory.
-     * While self.buffers[self.first] is that least recently used block.
-
-    Property: There is no hole in self.buffers, except at the beginning.
+    size = (2 ^ self.buffer_size). At most max_size bytes of blocks are
+    kept in memory: when the budget is exceeded, the least recently used
+    block is spilled to an anonymous temporary file (if it was not already
+    spilled) and dropped from memory. Spilled blocks are read back from the
+    temporary file, so seeking backward always works.
+
+    Statistics: resident_size is the number of bytes in memory, spilled_size
+    the number of bytes written to the temporary file, and spill_reads the
+    number of blocks read back from it.
     """
-    buffer_nb_min = 256
     buffer_size = 16
-    last = None
+    max_size = 1 << 24
     size = None
 
-    def __init__(self, input, set_size=None):
+    def __init__(self, input, set_size=None, max_size=None):
         self._input = input
-        self.first = self.address = 0
-        self.buffers = []
+        self.address = 0
         self.set_size = set_size
+        if max_size is not None:
+            self.max_size = max_size
+        self.max_blocks = max(self.max_size >> self.buffer_size, 1)
+        # Number of blocks read from the input
+        self.nb_blocks = 0
+        # Resident blocks: block index => data, sorted by access time
+        self._blocks = OrderedDict()
+        self._spill = None
+        self._spilled = set()
+        self.spilled_size = 0
+        self.spill_reads = 0
+
+    current_size = property(lambda self: self.nb_blocks << self.buffer_size)
+    resident_size = property(lambda self: sum(len(data) for data in self._blocks.values()),
+                             doc="Number of bytes held in memory")
 
-    current_size = property(lambda self: len(self.buffers) << self.buffer_size)
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        self._blocks.clear()
+        self._input.close()
 
-    def _append(self, data):
-        if self.last is None:
-            self.last = next = prev = 0
-        else:
-            prev = self.last
-            last = self.buffers[prev]
-            next = last[1]
-            self.last = self.buffers[next][2] = last[1] = len(self.buffers)
-        self.buffers.append([data, next, prev])
+    def _store(self, index, data):
+        blocks = self._blocks
+        blocks[index] = data
+        if len(blocks) > self.max_blocks:
+            self._evict(*blocks.popitem(False))
+
+    def _evict(self, index, data):
+        """
+        Block dropped from memory: spill it to the temporary file.
+        """
+        if index in self._spilled:
+            return
+        if self._spill is None:
+            self._spill = TemporaryFile()
+        info("Spilling buffer %u to disk." % index)
+        self._spill.seek(index << self.buffer_size)
+        self._spill.write(data)
+        self._spilled.add(index)
+        self.spilled_size += len(data)
 
     def _get(self, index):
-        if index >= len(self.buffers):
+        if index >= self.nb_blocks:
             return b''
-        buf = self.buffers[index]
-        if buf is None:
-            raise InputStreamError(
-                "Error: Buffers too small. Can't seek backward.")
-        if self.last != index:
-            next = buf[1]
-            prev = buf[2]
-            self.buffers[next][2] = prev
-            self.buffers[prev][1] = next
-            first = self.buffers[self.last][1]
-            buf[1] = first
-            buf[2] = self.last
-            self.buffers[first][2] = index
-            self.buffers[self.last][1] = index
-            self.last = index
-        return buf[0]
-
-    def _flush(self):
-        lim = len(self.buffers) - self.buffer_nb_min
-        while self.first < lim:
-            buf = self.buffers[self.first]
-            if buf[2] != self.last:
-                break
-            info("Discarding buffer %u." % self.first)
-            self.buffers[self.last][1] = buf[1]
-            self.buffers[buf[1]][2] = self.last
-            self.buffers[self.first] = None
-            self.first += 1
+        blocks = self._blocks
+        data = blocks.get(index)
+        if data is not None:
+            blocks.move_to_end(index)
+            return data
+        data = self._load(index)
+        self._store(index, data)
+        return data
+
+    def _load(self, index):
+        """
+        Load a block which is not in memory.
+        """
+        self.spill_reads += 1
+        self._spill.seek(index << self.buffer_size)
+        return self._spill.read(1 << self.buffer_size)
 
     def seek(self, address):
         assert 0 <= address
         self.address = address
 
-    def read(self, size):
-        end = self.address + size
-        for i in range(len(self.buffers), (end >> self.buffer_size) + 1):
+    def _fill(self, count):
+        """
+        Read blocks from the input until count blocks are read, or until
+        the end of the input.
+        """
+        while self.nb_blocks < count and self.size is None:
             data = self._input.read(1 << self.buffer_size)
             if len(data) < 1 << self.buffer_size:
-                self.size = (len(self.buffers) << self.buffer_size) + len(data)
+                self.size = (self.nb_blocks << self.buffer_size) + len(data)
                 if self.set_size:
                     self.set_size(self.size)
                 if data:
-                    self._append(data)
+                    self._store(self.nb_blocks, data)
+                    self.nb_blocks += 1
                 break
-            self._append(data)
+            self._store(self.nb_blocks, data)
+            self.nb_blocks += 1
+
+    def read(self, size):
+        end = self.address + size
+        self._fill((end >> self.buffer_size) + 1)
         block, offset = divmod(self.address, 1 << self.buffer_size)
         data = b''.join(self._get(index)
                         for index in range(block, (end - 1 >> self.buffer_size) + 1)
                         )[offset:offset + size]
-        self._flush()
         self.address += len(data)
         return data
 
 
-class InputIOStream(InputStream):
+class BlockCache:
+    """
+    Least recently used cache of fixed size blocks read from a seekable
+    file object, bounded by a budget in bytes.
+
+    Attributes hits and misses count the block lookups.
+    """
+
+    def __init__(self, input, block_size, max_size):
+        self._input = input
+        self._blocks = OrderedDict()
+        self.block_size = block_size
+        self.max_blocks = max(max_size // block_size, 1)
+        self.hits = 0
+        self.misses = 0
+
+    size = property(lambda self: sum(len(data) for data in self._blocks.values()),
+                    doc="Number of bytes held by the cache")
+
+    def clear(self):
+        self._blocks.clear()
+
+    def close(self):
+        self.clear()
+
+    def readInput(self, address, size):
+        """
+        Read size bytes at address (in bytes) from the file object,
+        bypassing the cache.
+        """
+        self._input.seek(address)
+        return self._input.read(size)
+
+    def _get(self, index):
+        blocks = self._blocks
+        data = blocks.get(index)
+        if data is None:
+            self.misses += 1
+            data = self.readInput(index * self.block_size, self.block_size)
+            blocks[index] = data
+            if len(blocks) > self.max_blocks:
+                blocks.popitem(False)
+        else:
+            self.hits += 1
+            blocks.move_to_end(index)
+        return data
+
+    def _cached(self, index):
+        """
+        Get a cached block, or None if it is not cached.
+        """
+        data = self._blocks.get(index)
+        if data is not None:
+            self.hits += 1
+            self._blocks.move_to_end(index)
+        return data
+
+    def _store(self, index, data):
+        blocks = self._blocks
+        blocks[index] = data
+        if len(blocks) > self.max_blocks:
+            blocks.popitem(False)
+
+    def _readBlocks(self, start, end):
+        """
+        Read the blocks start to end-1 at once and cache them. Return the
+        list of the blocks (shorter at the end of the file).
+        """
+        block_size = self.block_size
+        self.misses += end - start
+        data = self.readInput(start * block_size, (end - start) * block_size)
+        blocks = [data[offset:offset + block_size]
+                  for offset in range(0, len(data), block_size)]
+        for index, block in enumerate(blocks, start):
+            self._store(index, block)
+        return blocks
+
+    def read(self, address, size):
+        """
+        Read size bytes at address (in bytes). The result is shorter than
+        size at the end of the file.
+        """
+        block_size = self.block_size
+        index, offset = divmod(address, block_size)
+        end = offset + size
+        if end <= block_size:
+            return self._get(index)[offset:end]
+        count = (end + block_size - 1) // block_size
+        if 2 * count > self.max_blocks:
+            # Don't flush the whole cache for a large read
+            self.misses += 1
+            return self.readInput(address, size)
+        # Adjacent missing blocks are read at once
+        data = []
+        missing = None
+        for index in range(index, index + count):
+            block = self._cached(index)
+            if block is None:
+                if missing is None:
+                    missing = index
+                continue
+            if missing is not None:
+                data.extend(self._readBlocks(missing, index))
+                missing = None
+            data.append(block)
+        if missing is not None:
+            data.extend(self._readBlocks(missing, index + 1))
+        return b''.join(data)[offset:end]
+
+
+def _readAheadWorker(cache_ref, queue):
+    # Only hold a weak reference to the cache between requests, so that
+    # an unclosed stream can be garbage collected
+    while True:
+        request = queue.get()
+        try:
+            if request is None:
+                return
+            cache = cache_ref()
+            if cache is None:
+                return
+            cache._fetch(*request)
+            del cache
+        finally:
+            queue.task_done()
+
+
+def _stopReadAhead(queue, jobs):
+    for job in range(jobs):
+        queue.put(None)
+
+
+class ReadAheadCache(BlockCache):
+    """
+    BlockCache prefetching blocks on background threads: when the blocks
+    are read in sequence, the next window bytes are read ahead so that
+    parsing overlaps with the I/O latency. The window is split in jobs
+    requests read concurrently.
+
+    Prefetched blocks are kept aside until they are read (at most two
+    windows). prefetched counts the blocks read ahead and prefetch_hits
+    the misses answered by a prefetched block.
+    """
 
-    def __init__(self, input, size=None, **args):
-        if not hasattr(input, "seek"):
+    def __init__(self, input, block_size, max_size, window, jobs=1):
+        BlockCache.__init__(self, input, block_size, max_size)
+        self.window = window
+        self.window_blocks = max(window // block_size, 1) if window else 0
+        self.jobs = jobs
+        # Seek and read of the file object must not be interleaved
+        self._lock = Lock()
+        # Protect the prefetched blocks and counters updated by the threads
+        self._prefetch_lock = Lock()
+        self._prefetch = OrderedDict()
+        self._queue = None
+        self._threads = []
+        self._last_index = None
+        # Number of blocks read in sequence
+        self._sequential = 0
+        # Index following the last block requested to the threads
+        self._prefetch_end = 0
+        self.prefetched = 0
+        self.prefetch_hits = 0
+
+    @property
+    def prefetch_ratio(self):
+        """Ratio of the prefetched blocks which were read"""
+        if not self.prefetched:
+            return 0.0
+        return self.prefetch_hits / self.prefetched
+
+    def clear(self):
+        BlockCache.clear(self)
+        self._prefetch.clear()
+
+    def close(self):
+        if self._threads:
+            self._stop()
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+        self.clear()
+
+    def readInput(self, address, size):
+        with self._lock:
+            self._input.seek(address)
+            return self._input.read(size)
+
+    def wait(self):
+        """
+        Wait until the pending read-ahead requests are done.
+        """
+        if self._threads:
+            self._queue.join()
+
+    def _fetch(self, start, end):
+        block_size = self.block_size
+        prefetch = self._prefetch
+        index = start
+        while index < end:
+            if index in prefetch or index in self._blocks:
+                index += 1
+                continue
+            # Read the run of missing blocks at once
+            run = index + 1
+            while (run < end and run not in prefetch
+                   and run not in self._blocks):
+                run += 1
+            try:
+                data = self.readInput(index * block_size,
+                                      (run - index) * block_size)
+            except (OSError, ValueError):
+                # The main thread reports the error on its own read
+                return
+            with self._prefetch_lock:
+                for offset in range(0, len(data), block_size):
+                    prefetch[index + offset // block_size] = \
+                        data[offset:offset + block_size]
+                    self.prefetched += 1
+                while len(prefetch) > 2 * self.window_blocks:
+                    prefetch.popitem(False)
+            if len(data) < (run - index) * block_size:
+                return
+            index = run
+
+    def _readAhead(self, index):
+        start = max(index + 1, self._prefetch_end)
+        end = index + 1 + self.window_blocks
+        if start >= end:
+            return
+        if not self._threads:
+            self._queue = Queue()
+            # Stop the threads when the cache is closed or collected
+            self._stop = finalize(self, _stopReadAhead, self._queue,
+                                  self.jobs)
+            cache_ref = weakref_ref(self)
+            for job in range(self.jobs):
+                thread = Thread(target=_readAheadWorker,
+                                args=(cache_ref, self._queue), daemon=True,
+                                name="hachoir-readahead")
+                thread.start()
+                self._threads.append(thread)
+        step = -(-(end - start) // self.jobs)
+        for first in range(start, end, step):
+            self._queue.put((first, min(first + step, end)))
+        self._prefetch_end = end
+
+    def _track(self, index):
+        if self._last_index is not None and index == self._last_index + 1:
+            # Sequential access (a single step is not enough: it is common
+            # when probing headers): read ahead when half of the window was
+            # consumed
+            self._sequential += 1
+            if (2 <= self._sequential and self.window_blocks and
+                    self._prefetch_end <= index + self.window_blocks // 2):
+                self._readAhead(index)
+        else:
+            self._sequential = 0
+            self._prefetch_end = 0
+        self._last_index = index
+
+    def _cached(self, index):
+        if index != self._last_index:
+            self._track(index)
+        data = BlockCache._cached(self, index)
+        if data is None:
+            with self._prefetch_lock:
+                data = self._prefetch.pop(index, None)
+            if data is not None:
+                self.prefetch_hits += 1
+                self.hits += 1
+                self._store(index, data)
+        return data
+
+    def _get(self, index):
+        if index == self._last_index:
+            return BlockCache._get(self, index)
+        data = self._cached(index)
+        if data is None:
+            self.misses += 1
+            data = self.readInput(index * self.block_size, self.block_size)
+            self._store(index, data)
+        return data
+
+
+class InputIOStream(InputStream):
+    """
+    Input stream reading a file object. Reads from seekable inputs go
+    through a BlockCache of cache_size bytes (use cache_size=0 to disable
+    it). Non-seekable inputs are wrapped in an InputPipe keeping at most
+    cache_size bytes in memory, older data is spilled to a temporary file.
+    input can also be an InputPipe.
+
+    readahead enables the read-ahead of readahead bytes on a background
+    thread when the cached blocks are read sequentially (see
+    ReadAheadCache).
+    """
+    cache_block_size = 1 << 16
+    cache_size = 1 << 24
+    readahead = 0
+
+    def __init__(self, input, size=None, cache_size=None,
+                 cache_block_size=None, readahead=None, **args):
+        if cache_size is None:
+            cache_size = self.cache_size
+        if readahead is None:
+            readahead = self.readahead
+        if isinstance(input, InputPipe):
+            if size is None:
+                input.set_size = self._setSize
+        elif not hasattr(input, "seek"):
             if size is None:
-                input = InputPipe(input, self._setSize)
+                input = InputPipe(input, self._setSize, cache_size)
             else:
-                input = InputPipe(input)
+                input = InputPipe(input, max_size=cache_size)
         elif size is None:
             try:
                 input.seek(0, 2)
                 size = input.tell() * 8
             except IOError as err:
                 if err.errno == ESPIPE:
-                    input = InputPipe(input, self._setSize)
+                    input = InputPipe(input, self._setSize, cache_size)
                 else:
                     source = args.get("source", "<inputio:%r>" % input)
                     raise InputStreamError(
                         "Unable to get size of %s: %s" % (source, err))
         self._input = input
+        if cache_block_size is None:
+            cache_block_size = self.cache_block_size
+        if cache_size and not isinstance(input, InputPipe):
+            self.cache = self._createCache(input, cache_block_size,
+                                           cache_size, readahead)
         InputStream.__init__(self, size=size, **args)
 
+    def _createCache(self, input, block_size, cache_size, readahead):
+        if readahead:
+            return ReadAheadCache(input, block_size, cache_size, readahead)
+        return BlockCache(input, block_size, cache_size)
+
     def close(self):
+        if self.cache is not None:
+            self.cache.close()
         self._input.close()
 
     def __current_size(self):
@@ -428,15 +844,33 @@ class InputIOStream(InputStream):
         assert size > 0
         _size = self._size
         address, shift = divmod(address, 8)
-        self._input.seek(address)
         size = (size + shift + 7) >> 3
-        data = self._input.read(size)
+        if self.cache is not None:
+            data = self.cache.read(address, size)
+        else:
+            self._input.seek(address)
+            data = self._input.read(size)
         got = len(data)
         missing = size != got
         if missing and _size == self._size:
             raise ReadStreamError(8 * size, 8 * address, 8 * got)
         return shift, data, missing
 
+    def _searchRead(self, address, size):
+        if self.cache is None or size <= self.cache.block_size:
+            return InputStream._searchRead(self, address, size)
+        # Don't fill the cache with the data of large windows
+        data = self.cache.readInput(address, size)
+        return data, len(data) < size
+
+    def getFileOffset(self, address):
+        if address % 8 or isinstance(self._input, InputPipe):
+            return None
+        try:
+            return self._input.fileno(), address >> 3
+        except (AttributeError, OSError, ValueError):
+            return None
+
     def file(self):
         if hasattr(self._input, "fileno"):
             from os import dup, fdopen
@@ -447,6 +881,104 @@ class InputIOStream(InputStream):
         return InputStream.file(self)
 
 
+class RangeFile:
+    """
+    Read-only file object of a remote file of size bytes, read by byte
+    ranges with fetcher(offset, size) (see RangeInputStream).
+
+    requests counts the calls to the fetcher and transferred the number
+    of bytes it returned.
+    """
+
+    def __init__(self, fetcher, size):
+        self.fetcher = fetcher
+        self.size = size
+        self.position = 0
+        self.requests = 0
+        self.transferred = 0
+        self._lock = Lock()
+
+    def fetch(self, offset, size):
+        """
+        Read size bytes at offset. This method can be called by several
+        threads at once.
+        """
+        size = min(size, self.size - offset)
+        if size <= 0:
+            return b''
+        data = self.fetcher(offset, size)
+        with self._lock:
+            self.requests += 1
+            self.transferred += len(data)
+        return data
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.position
+        elif whence == 2:
+            offset += self.size
+        self.position = offset
+        return offset
+
+    def tell(self):
+        return self.position
+
+    def read(self, size=-1):
+        if size < 0:
+            size = self.size - self.position
+        data = self.fetch(self.position, size)
+        self.position += len(data)
+        return data
+
+    def close(self):
+        close = getattr(self.fetcher, "close", None)
+        if close is not None:
+            close()
+
+
+class RangeCache(ReadAheadCache):
+    """
+    ReadAheadCache of a RangeFile: byte ranges are fetched without
+    serializing the requests.
+    """
+
+    def readInput(self, address, size):
+        return self._input.fetch(address, size)
+
+
+class RangeInputStream(InputIOStream):
+    """
+    Input stream of a remote file (HTTP server, object store) of file_size
+    bytes, read by byte ranges: fetcher(offset, size) returns the size
+    bytes at offset. The fetcher is called by several threads at once
+    and may have a close() method.
+
+    Reads go through a cache of blocks of cache_block_size bytes: adjacent
+    missing blocks are fetched with a single request. Sequential reads
+    prefetch readahead bytes with at most jobs concurrent requests.
+
+    requests and transferred count the requests and the fetched bytes.
+    """
+    cache_block_size = 1 << 16
+    cache_size = 1 << 24
+    readahead = 1 << 18
+    jobs = 4
+
+    def __init__(self, fetcher, file_size, jobs=None, **args):
+        if jobs is not None:
+            self.jobs = jobs
+        args.setdefault("source", "<range:%r>" % fetcher)
+        InputIOStream.__init__(self, RangeFile(fetcher, file_size),
+                               size=8 * file_size, **args)
+
+    requests = property(lambda self: self._input.requests)
+    transferred = property(lambda self: self._input.transferred)
+
+    def _createCache(self, input, block_size, cache_size, readahead):
+        return RangeCache(input, block_size, cache_size, readahead,
+                          self.jobs)
+
+
 class StringInputStream(InputStream):
 
     def __init__(self, data, source="<string>", **args):
@@ -466,6 +998,86 @@ class StringInputStream(InputStream):
             raise ReadStreamError(8 * size, 8 * address, 8 * got)
         return shift, data, False
 
+    def _searchWindows(self, start, end, overlap):
+        # Search directly in the data
+        if end is None or len(self.data) < end:
+            end = len(self.data)
+        if start < end:
+            yield 0, self.data, start, end, end
+
+
+class MmapInputStream(InputStream):
+    """
+    Input stream of a regular file mapped in memory: reads are served
+    from the mapping, without any seek() or read() system call.
+    """
+
+    def __init__(self, input, **args):
+        self._input = input
+        self._mmap = mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        InputStream.__init__(self, size=8 * len(self._mmap), **args)
+        self._current_size = self._size
+
+    def close(self):
+        if self._mmap is None:
+            return
+        self._view.release()
+        self._mmap.close()
+        self._mmap = self._view = None
+        self._input.close()
+
+    def read(self, address, size):
+        address, shift = divmod(address, 8)
+        size = (size + shift + 7) >> 3
+        data = self._mmap[address:address + size]
+        got = len(data)
+        if got != size:
+            raise ReadStreamError(8 * size, 8 * address, 8 * got)
+        return shift, data, False
+
+    def readBits(self, address, nbits, endian):
+        if endian is MIDDLE_ENDIAN:
+            return InputStream.readBits(self, address, nbits, endian)
+        start, shift = divmod(address, 8)
+        end = start + ((nbits + shift + 7) >> 3)
+        if end > len(self._mmap):
+            raise ReadStreamError(nbits, address)
+        # Convert directly from the mapping, without creating a bytes object
+        value = str2long(self._view[start:end], endian)
+        if endian is BIG_ENDIAN:
+            value >>= (end - start) * 8 - shift - nbits
+        else:
+            value >>= shift
+        return value & (1 << nbits) - 1
+
+    def readBytes(self, address, nb_bytes):
+        if address % 8:
+            raise InputStreamError("TODO: handle non-byte-aligned data")
+        address >>= 3
+        data = self._mmap[address:address + nb_bytes]
+        if len(data) != nb_bytes:
+            raise ReadStreamError(8 * nb_bytes, 8 * address)
+        return data
+
+    def _searchWindows(self, start, end, overlap):
+        # Search directly in the mapping
+        if end is None or len(self._mmap) < end:
+            end = len(self._mmap)
+        if start < end:
+            yield 0, self._mmap, start, end, end
+
+    def getFileOffset(self, address):
+        if address % 8:
+            return None
+        return self._input.fileno(), address >> 3
+
+    def file(self):
+        from os import dup, fdopen
+        new_file = fdopen(dup(self._input.fileno()), "rb")
+        new_file.seek(0)
+        return new_file
+
 
 class InputSubStream(InputStream):
 
@@ -486,6 +1098,8 @@ class InputSubStream(InputStream):
 
     _current_size = property(lambda self: min(
         self._size, max(0, self.stream._current_size - self._offset)))
+    cache = property(lambda self: self.stream.cache,
+                     doc="Block cache shared with the parent stream")
 
     def close(self):
         self.stream = None
@@ -493,6 +1107,58 @@ class InputSubStream(InputStream):
     def read(self, address, size):
         return self.stream.read(self._offset + address, size)
 
+    def _searchWindows(self, start, end, overlap):
+        if self._offset % 8 or self._size is None:
+            yield from InputStream._searchWindows(self, start, end, overlap)
+            return
+        # Search in the windows of the parent stream
+        offset = self._offset >> 3
+        if end is None or self._size < 8 * end:
+            end = self._size >> 3
+        for address, data, lo, hi, stop in self.stream._searchWindows(
+                offset + start, offset + end, overlap):
+            yield address - offset, data, lo, hi, stop
+
+    def getFileOffset(self, address):
+        return self.stream.getFileOffset(self._offset + address)
+
+
+class SnapshotStream(InputStream):
+    """
+    View of a stream of known size: reads of its first head_size bytes and
+    of its last tail_size bytes are served from a copy read at once, other
+    reads are forwarded to the stream. It is used to validate many parsers
+    against the same stream (see QueryParser).
+    """
+
+    def __init__(self, stream, head_size, tail_size=0):
+        self.stream = stream
+        end = stream.size >> 3
+        self._head = stream.readBytes(0, min(head_size, end))
+        self._tail_start = max(end - tail_size, len(self._head))
+        self._tail = stream.readBytes(8 * self._tail_start,
+                                      end - self._tail_start)
+        self._end = end
+        InputStream.__init__(self, source=stream.source, size=stream.size,
+                             packets=stream.packets, tags=stream.tags)
+        self._current_size = self._size
+
+    def close(self):
+        self.stream = None
+
+    def read(self, address, size):
+        start, shift = divmod(address, 8)
+        end = start + ((size + shift + 7) >> 3)
+        if end <= len(self._head):
+            return shift, self._head[start:end], False
+        tail_start = self._tail_start
+        if tail_start <= start and end <= self._end:
+            return shift, self._tail[start - tail_start:end - tail_start], False
+        return self.stream.read(address, size)
+
+    def getFileOffset(self, address):
+        return self.stream.getFileOffset(address)
+
 
 def InputFieldStream(field, **args):
     if not field.parent:
@@ -504,11 +1170,22 @@ def InputFieldStream(field, **args):
 
 
 class FragmentedStream(InputStream):
+    """
+    Input stream of a chain of fragments (see hachoir.field.link).
+
+    Fragments are read lazily. Physically adjacent fragments are merged in
+    extents. The addresses of the extents in the stream (in bits, sorted)
+    are stored in an array to find an extent with bisect, their addresses
+    in the parent stream and their sizes in parallel lists. A read issues
+    one read of the parent stream per extent.
+    """
 
     def __init__(self, field, **args):
         self.stream = field.parent.stream
         data = field.getData()
-        self.fragments = [(0, data.absolute_address, data.size)]
+        self._starts = array("Q", (0,))
+        self._addresses = [data.absolute_address]
+        self._sizes = [data.size]
         self.next = field.next
         args.setdefault("source", "%s%s" % (self.stream.source, field.path))
         InputStream.__init__(self, **args)
@@ -519,11 +1196,21 @@ class FragmentedStream(InputStream):
     def close(self):
         self.stream = None
 
+    def _addFragment(self, address, stream_address, size):
+        if self._addresses[-1] + self._sizes[-1] == stream_address:
+            self._sizes[-1] += size
+        else:
+            self._starts.append(address)
+            self._addresses.append(stream_address)
+            self._sizes.append(size)
+
     def _feed(self, end):
         if self._current_size < end:
             if self.checked:
                 raise ReadStreamError(end - self._size, self._size)
-            a, fa, fs = self.fragments[-1]
+            a = self._starts[-1]
+            fa = self._addresses[-1]
+            fs = self._sizes[-1]
             while self.stream.sizeGe(fa + min(fs, end - a)):
                 a += fs
                 f = self.next
@@ -541,7 +1228,11 @@ class FragmentedStream(InputStream):
                     return True
                 fa = f.absolute_address
                 fs = f.size
-                self.fragments += [(a, fa, fs)]
+                self._addFragment(a, fa, fs)
+                # Continue with the (merged) last extent
+                a = self._starts[-1]
+                fa = self._addresses[-1]
+                fs = self._sizes[-1]
             self._current_size = a + max(0, self.stream.size - fa)
             self._setSize()
             return True
@@ -554,66 +1245,139 @@ class FragmentedStream(InputStream):
             size = self._size - address
             if size <= 0:
                 return 0, b'', True
-        d = []
-        i = lowerBound(self.fragments, lambda x: x[0] <= address)
-        a, fa, fs = self.fragments[i - 1]
-        a -= address
-        fa -= a
-        fs += a
-        s = None
-        while True:
-            n = min(fs, size)
-            u, v, w = self.stream.read(fa, n)
+        index = bisect_right(self._starts, address) - 1
+        offset = address - self._starts[index]
+        addresses = self._addresses
+        sizes = self._sizes
+        read = self.stream.read
+        length = sizes[index] - offset
+        if size <= length:
+            # Read in a single extent
+            shift, data, w = read(addresses[index] + offset, size)
             assert not w
-            if s is None:
-                s = u
-            else:
-                assert not u
-            d += [v]
-            size -= n
-            if not size:
-                return s, b''.join(d), missing
-            a, fa, fs = self.fragments[i]
-            i += 1
+            return shift, data, missing
+        shift, data, w = read(addresses[index] + offset, length)
+        assert not w
+        data = [data]
+        size -= length
+        while size:
+            index += 1
+            length = min(sizes[index], size)
+            u, v, w = read(addresses[index], length)
+            assert not w and not u
+            data.append(v)
+            size -= length
+        data = b''.join(data)
+        return shift, data, missing
 
 
 class ConcatStream(InputStream):
-    # TODO: concatene any number of any type of stream
-
-    def __init__(self, streams, **args):
-        if len(streams) > 2 or not streams[0].checked:
-            raise NotImplementedError
-        self.__size0 = streams[0].size
-        size1 = streams[1].askSize(self)
-        if size1 is not None:
-            args["size"] = self.__size0 + size1
-        self.__streams = streams
+    """
+    Concatenation of input streams.
+
+    A segment is an input stream, or a (size, open) tuple for a segment
+    opened on demand: size is its size in bits and open() returns its
+    input stream. At most max_open segments opened on demand are kept open,
+    the least recently used one is closed first. The size of the segments
+    must be known and a multiple of 8 bits, except for the size of the last
+    segment.
+    """
+    max_open = 32
+
+    def __init__(self, segments, max_open=None, **args):
+        if not segments:
+            raise ValueError("ConcatStream: no segment")
+        if max_open is not None:
+            self.max_open = max_open
+        self._segments = []
+        # Address of each segment in bits, sorted
+        self._starts = []
+        # Segments opened on demand: index => stream, sorted by access time
+        self._opened = OrderedDict()
+        address = 0
+        last = len(segments) - 1
+        for index, segment in enumerate(segments):
+            if isinstance(segment, InputStream):
+                stream, open = segment, None
+                if index < last or segment.checked:
+                    size = segment.size
+                else:
+                    size = segment.askSize(self)
+            else:
+                stream = None
+                size, open = segment
+            if (index < last or stream is None) and size is None:
+                raise InputStreamError(
+                    "ConcatStream: size of segment %u is unknown" % index)
+            if index < last and size % 8:
+                raise InputStreamError(
+                    "ConcatStream: size of segment %u is not aligned to byte"
+                    % index)
+            self._segments.append((stream, size, open))
+            self._starts.append(address)
+            if size is not None:
+                address += size
+        if size is not None:
+            args["size"] = address
         InputStream.__init__(self, **args)
 
-    _current_size = property(
-        lambda self: self.__size0 + self.__streams[1]._current_size)
+    def __current_size(self):
+        if self._size is not None:
+            return self._size
+        return self._starts[-1] + self._segments[-1][0]._current_size
+    _current_size = property(__current_size)
 
     def close(self):
-        self.__streams = None
+        for stream in self._opened.values():
+            stream.close()
+        self._opened.clear()
+        self._segments = None
+
+    def _getStream(self, index):
+        stream, size, open = self._segments[index]
+        if stream is not None:
+            return stream
+        opened = self._opened
+        stream = opened.get(index)
+        if stream is not None:
+            opened.move_to_end(index)
+            return stream
+        stream = opened[index] = open()
+        if len(opened) > self.max_open:
+            opened.popitem(False)[1].close()
+        return stream
 
     def read(self, address, size):
         _size = self._size
-        s = self.__size0 - address
-        shift, data, missing = None, b'', False
-        if s > 0:
-            s = min(size, s)
-            shift, data, w = self.__streams[0].read(address, s)
-            assert not w
-            a, s = 0, size - s
-        else:
-            a, s = -s, size
-        if s:
-            u, v, missing = self.__streams[1].read(a, s)
-            if missing and _size == self._size:
-                raise ReadStreamError(s, a)
+        starts = self._starts
+        index = bisect_right(starts, address) - 1
+        shift = None
+        missing = False
+        data = []
+        while size:
+            if len(starts) <= index:
+                missing = True
+                break
+            segment_size = self._segments[index][1]
+            offset = address - starts[index]
+            if segment_size is None:
+                length = size
+            else:
+                length = min(size, segment_size - offset)
+            u, v, missing = self._getStream(index).read(offset, length)
             if shift is None:
                 shift = u
-            else:
-                assert not u
-            data += v
-        return shift, data, missing
+            data.append(v)
+            if missing:
+                break
+            address += length
+            size -= length
+            index += 1
+        if missing and _size == self._size:
+            raise ReadStreamError(size, address)
+        if len(data) == 1:
+            # Read in a single segment: no copy
+            data = data[0]
+        else:
+            data = b''.join(data)
+        return shift or 0, data, missing
@@ -1,5 +1,28 @@
 from hachoir.core.i18n import guessBytesCharset
-from hachoir.stream import InputIOStream, InputSubStream, InputStreamError
+from hachoir.core import config
+from hachoir.stream import (InputIOStream, MmapInputStream, InputSubStream,
+                            ConcatStream, RangeInputStream, InputStreamError)
+from functools import partial
+import os
+import stat
+
+
+def _openStream(inputio, **args):
+    """
+    Map regular files in memory, use InputIOStream for anything else
+    (pipes, sockets, file-like objects, empty files).
+    """
+    if config.use_mmap:
+        try:
+            info = os.fstat(inputio.fileno())
+        except (AttributeError, OSError, ValueError):
+            info = None
+        if info is not None and stat.S_ISREG(info.st_mode) and info.st_size:
+            try:
+                return MmapInputStream(inputio, **args)
+            except (OSError, ValueError):
+                pass
+    return InputIOStream(inputio, **args)
 
 
 def FileInputStream(filename, real_filename=None, **args):
@@ -31,11 +54,76 @@ def FileInputStream(filename, real_filename=None, **args):
     if offset or size:
         if size:
             size = 8 * size
-        stream = InputIOStream(inputio, source=source, **args)
+        stream = _openStream(inputio, source=source, **args)
         return InputSubStream(stream, 8 * offset, size, **args)
     else:
         args.setdefault("tags", []).append(("filename", filename))
-        return InputIOStream(inputio, source=source, **args)
+        return _openStream(inputio, source=source, **args)
+
+
+def FileConcatStream(filenames, **args):
+    """
+    Create an input stream of the concatenation of files, eg. the parts of
+    a split disk image ('disk.001', 'disk.002', ...). The files are opened
+    on demand (see ConcatStream).
+    """
+    segments = []
+    for filename in filenames:
+        try:
+            size = os.path.getsize(filename)
+        except OSError as err:
+            raise InputStreamError(
+                "Unable to open file %s: %s" % (filename, err))
+        segments.append((8 * size, partial(FileInputStream, filename)))
+    if filenames:
+        args.setdefault("source", "file:" + filenames[0])
+        args.setdefault("tags", []).append(("filename", filenames[0]))
+    return ConcatStream(segments, **args)
+
+
+class HTTPRangeFetcher:
+    """
+    Fetcher of RangeInputStream sending HTTP range requests to url.
+    """
+
+    def __init__(self, url, headers=None, timeout=60):
+        self.url = url
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+
+    def __repr__(self):
+        return "<HTTPRangeFetcher %s>" % self.url
+
+    def __call__(self, offset, size):
+        from urllib.request import Request, urlopen
+        headers = dict(self.headers)
+        headers["Range"] = "bytes=%u-%u" % (offset, offset + size - 1)
+        request = Request(self.url, headers=headers)
+        with urlopen(request, timeout=self.timeout) as response:
+            if response.status == 206:
+                return response.read(size)
+            # The server ignored the range
+            return response.read(offset + size)[offset:]
+
+
+def URLInputStream(url, headers=None, timeout=60, **args):
+    """
+    Create an input stream of a file served over HTTP(S), read by range
+    requests (see RangeInputStream): only the parts of the file read by
+    the parser are downloaded.
+    """
+    from urllib.request import Request, urlopen
+    request = Request(url, headers=dict(headers or {}), method="HEAD")
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            size = response.headers.get("Content-Length")
+    except OSError as err:
+        raise InputStreamError("Unable to open %s: %s" % (url, err))
+    if size is None:
+        raise InputStreamError("Unable to get size of %s" % url)
+    args.setdefault("source", url)
+    return RangeInputStream(HTTPRangeFetcher(url, headers, timeout),
+                            int(size), **args)
 
 
 def guessStreamCharset(stream, address, size, default=None):
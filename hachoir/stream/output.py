@@ -4,8 +4,45 @@ from hachoir.core.bits import long2raw
 from hachoir.stream import StreamError
 from hachoir.core import config
 from errno import EBADF
+import os
 
 MAX_READ_NBYTES = 2 ** 16
+COPY_BUFFER_SIZE = 2 ** 20
+
+
+def copyFileRange(src_fd, offset, dst_fd, size):
+    """
+    Copy size bytes at offset (in bytes) of the file src_fd to the current
+    position of the file dst_fd, using copy_file_range() or sendfile() to
+    avoid copies in user space.
+
+    Return the number of copied bytes: it is smaller than size at the end
+    of the source file or if no system call is supported.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    sendfile = getattr(os, "sendfile", None)
+    copied = 0
+    while copied < size:
+        count = min(size - copied, 2 ** 30)
+        try:
+            if copy_file_range is not None:
+                count = copy_file_range(src_fd, dst_fd, count, offset + copied)
+            elif sendfile is not None:
+                count = sendfile(dst_fd, src_fd, offset + copied, count)
+            else:
+                break
+        except OSError:
+            # Unsupported by the kernel or the file systems: try the next
+            # system call
+            if copy_file_range is not None:
+                copy_file_range = None
+            else:
+                sendfile = None
+            continue
+        if not count:
+            break
+        copied += count
+    return copied
 
 
 class OutputStreamError(StreamError):
@@ -121,11 +158,63 @@ class OutputStream(object):
             data = input.readBits(address, nb_bits, endian)
             self.writeBits(nb_bits, data, endian)
 
+    def _copyFileRange(self, input, address, nb_bytes):
+        """
+        Copy bytes between two regular files without reading them in
+        Python. Return the number of copied bytes.
+        """
+        source = input.getFileOffset(address)
+        if source is None:
+            return 0
+        try:
+            fd = self._output.fileno()
+        except (AttributeError, OSError, ValueError):
+            return 0
+        self._output.flush()
+        copied = copyFileRange(source[0], source[1], fd, nb_bytes)
+        if copied:
+            # Synchronize the file object with the file descriptor position
+            self._output.seek(os.lseek(fd, 0, os.SEEK_CUR))
+        return copied
+
+    def copyFileBytes(self, src_fd, offset, nb_bytes):
+        """
+        Copy nb_bytes bytes at offset (in bytes) of the file descriptor
+        src_fd. Only positional system calls are used: the file position
+        of src_fd and the input stream reading it are not used, so it can
+        be called from another thread.
+        """
+        if self._bit_pos != 0:
+            raise NotImplementedError()
+        copied = 0
+        try:
+            fd = self._output.fileno()
+        except (AttributeError, OSError, ValueError):
+            pass
+        else:
+            self._output.flush()
+            copied = copyFileRange(src_fd, offset, fd, nb_bytes)
+            if copied:
+                self._output.seek(os.lseek(fd, 0, os.SEEK_CUR))
+        while copied < nb_bytes:
+            data = os.pread(src_fd, min(nb_bytes - copied, COPY_BUFFER_SIZE),
+                            offset + copied)
+            if not data:
+                raise OutputStreamError(
+                    "Unable to read %s bytes at offset %s"
+                    % (nb_bytes - copied, offset + copied))
+            self.writeBytes(data)
+            copied += len(data)
+
     def copyBytesFrom(self, input, address, nb_bytes):
         if (address % 8):
             raise OutputStreamError(
                 "Unable to copy bytes with address with bit granularity")
-        buffer_size = 1 << 12   # 8192 (8 KB)
+        if self._bit_pos == 0:
+            copied = self._copyFileRange(input, address, nb_bytes)
+            address += copied * 8
+            nb_bytes -= copied
+        buffer_size = COPY_BUFFER_SIZE
         while 0 < nb_bytes:
             # Compute buffer size
             if nb_bytes < buffer_size:
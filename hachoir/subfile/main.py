@@ -19,6 +19,11 @@ def parseOptions():
                       action="store", type='str', default=None)
     common.add_option("--parser", help="Parser identifier list (separated with a comma)",
                       action="store", type='str', default=None)
+    common.add_option("--jobs", help="Number of search processes (default: 1)",
+                      action="store", type='int', default=1)
+    common.add_option("--background-write",
+                      help="Write found files in a background thread",
+                      action="store_true", default=False)
     common.add_option("--version", help="Display version and exit",
                       action="callback", callback=displayVersion)
     common.add_option("--quiet", help="Be quiet",
@@ -41,22 +46,30 @@ def parseOptions():
 
 
 def displaySearchStat(subfile):
-    stats = [(parser.tags["id"], stats[0], stats[1])
-             for parser, stats in subfile.stats.items()]
+    hits = subfile.patterns.hits
+    stats = []
+    for parser in set(hits) | set(subfile.stats):
+        tried, valid = subfile.stats.get(parser, (0, 0))
+        stats.append((parser.getParserTags()["id"],
+                      hits.get(parser, 0), tried, valid))
     print()
     print("[ Match statistics ]")
     total_hit = 0
+    total_tried = 0
     total_valid = 0
     if stats:
         stats.sort(key=lambda values: values[1])
-        for parser_id, hit, valid in stats:
-            print(" - %s: %u hit/%u valid" % (parser_id, hit, valid))
+        for parser_id, hit, tried, valid in stats:
+            print(" - %s: %u hit/%u tried/%u valid"
+                  % (parser_id, hit, tried, valid))
             total_hit += hit
+            total_tried += tried
             total_valid += valid
         print()
     else:
         print("(no match)")
-    print("Total: %u hit/%u valid" % (total_hit, total_valid))
+    print("Total: %u hit/%u tried/%u valid"
+          % (total_hit, total_tried, total_valid))
 
 
 def runSearch(subfile, values):
@@ -87,8 +100,9 @@ def main():
         subfile = SearchSubfile(stream, values.offset, values.size)
         subfile.verbose = not values.quiet
         subfile.debug = values.debug
+        subfile.setJobs(values.jobs, filename)
         if output:
-            subfile.setOutput(output)
+            subfile.setOutput(output, values.background_write)
         if values.profiler:
             from hachoir.core.profiler import runProfiler
             ok = runProfiler(runSearch, (subfile, values))
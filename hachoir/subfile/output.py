@@ -2,17 +2,31 @@ from hachoir.stream import FileOutputStream, StreamError
 from hachoir.core.error import error
 from errno import EEXIST
 from os import mkdir, path
+from queue import Queue
+from threading import Thread
+
+QUEUE_SIZE = 64   # Maximum number of files waiting to be written
 
 
 class Output:
     """
     Store files found by search tool.
+
+    If background is True, files are written by a writer thread so that
+    the search is not blocked by disk writes. It is only used for streams
+    of regular files (see InputStream.getFileOffset()): the writer thread
+    copies the file descriptor with positional system calls and never reads
+    the stream. Other streams are copied synchronously.
+    Call close() to wait until all files are written.
     """
 
-    def __init__(self, directory):
+    def __init__(self, directory, background=False):
         self.directory = directory
         self.mkdir = False
         self.file_id = 1
+        self.background = background
+        self._queue = None
+        self._thread = None
 
     def createDirectory(self):
         try:
@@ -38,11 +52,52 @@ class Output:
 
         # Create output file
         filename = path.join(self.directory, filename)
-        output = FileOutputStream(filename)
+        source = None
+        if self.background:
+            source = stream.getFileOffset(offset)
+        if source is not None:
+            # The writer thread only gets the file descriptor: the stream
+            # and its cache are only used by the main thread
+            if self._thread is None:
+                self._queue = Queue(QUEUE_SIZE)
+                self._thread = Thread(target=self._writer, daemon=True)
+                self._thread.start()
+            self._queue.put((filename, source[0], source[1], size // 8))
+        else:
+            self._copy(filename, stream, offset, size)
+        return filename
 
+    def _copy(self, filename, stream, offset, size):
         # Write output
-        try:
-            output.copyBytesFrom(stream, offset, size // 8)
-        except StreamError as err:
-            error("copyBytesFrom() error: %s" % err)
-        return filename
+        with FileOutputStream(filename) as output:
+            try:
+                output.copyBytesFrom(stream, offset, size // 8)
+            except StreamError as err:
+                error("copyBytesFrom() error: %s" % err)
+
+    def _copyFile(self, filename, fd, offset, nbytes):
+        with FileOutputStream(filename) as output:
+            try:
+                output.copyFileBytes(fd, offset, nbytes)
+            except StreamError as err:
+                error("copyFileBytes() error: %s" % err)
+
+    def _writer(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                self._copyFile(*item)
+            except Exception as err:
+                error("Unable to write %s: %s" % (item[0], err))
+
+    def close(self):
+        """
+        Wait until all files are written.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
@@ -1,15 +1,71 @@
 from hachoir.parser import QueryParser
-from hachoir.regex import PatternMatching
+from hachoir.parser.parser_list import parserClass
+from hachoir.regex import parse
+from hachoir.core.tools import makePrintable
+import re
 
 
-# XXX hachoir.regex uses str but the rest of hachoir uses bytes,
-# which means we have to convert bytes to str using latin1 encoding
-# (the closest "raw bytes" encoding) in order for matching to work.
-class HachoirPatternMatching(PatternMatching):
+class MagicNode:
+    """
+    Node of the magic trie: children maps a byte value to the next node,
+    output lists the (offset, parser) of the magics ending at this node.
+    """
+    __slots__ = ("children", "output")
 
-    def __init__(self, categories=None, parser_ids=None):
-        PatternMatching.__init__(self)
+    def __init__(self):
+        self.children = {}
+        self.output = []
+
+
+def _trieRegex(node):
+    """
+    Compile the trie rooted at node to a bytes regex matching if and only if
+    a magic of the trie starts at the current position.
+    """
+    if node.output:
+        # Shortest magic found: longer magics don't need to be checked
+        return b''
+    alternatives = [re.escape(bytes((byte,))) + _trieRegex(child)
+                    for byte, child in sorted(node.children.items())]
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return b'(?:' + b'|'.join(alternatives) + b')'
+
+
+def _findAll(regex, data, limit):
+    """
+    Generate the start of all matches of regex in data starting before
+    limit, overlapping matches included.
+    """
+    search = regex.search
+    pos = 0
+    while True:
+        match = search(data, pos)
+        if match is None:
+            return
+        pos = match.start()
+        if pos >= limit:
+            return
+        yield pos
+        pos += 1
+
+
+class HachoirPatternMatching:
+    """
+    Search the magics of the parsers in raw data (bytes, memoryview, mmap).
+
+    Literal magics are stored in a trie (the goto function of an
+    Aho-Corasick automaton). The trie is compiled to a single bytes regex
+    which locates, at C speed, the positions where at least one magic
+    starts; the trie is then walked from each position to report every
+    magic matching there. Overlapping magics are reported. Regular
+    expression magics (magic_regex) are searched in a second pass.
+
+    hits counts the magics found for each parser class. The modules of
+    the parsers found are imported.
+    """
 
+    def __init__(self, categories=None, parser_ids=None):
         # Load parser list
         tags = []
         if categories:
@@ -20,17 +76,99 @@ class HachoirPatternMatching(PatternMatching):
             tags += [None]
         parser_list = QueryParser(tags)
 
+        self.root = MagicNode()
+        self.regex_patterns = []
+        self.hits = {}
+        self.max_length = 0
+
         # Create string patterns
         for parser in parser_list:
             for (magic, offset) in parser.getParserTags().get("magic", ()):
-                self.addString(magic.decode('latin1'), (offset, parser))
+                self.addString(magic, (offset, parser))
 
         # Create regex patterns
         for parser in parser_list:
             for (regex, offset) in parser.getParserTags().get("magic_regex", ()):
-                self.addRegex(regex.decode('latin1'), (offset, parser))
+                self.addRegex(regex, (offset, parser))
         self.commit()
 
-    def search(self, data):
-        for start, stop, item in PatternMatching.search(self, data.decode('latin1')):
-            yield (item.user[1], start * 8 - item.user[0])
+    def addString(self, magic, user):
+        node = self.root
+        for byte in magic:
+            child = node.children.get(byte)
+            if child is None:
+                child = node.children[byte] = MagicNode()
+            node = child
+        node.output.append(user)
+        self.max_length = max(self.max_length, len(magic))
+
+    def addRegex(self, regex, user):
+        length = parse(regex.decode('latin1')).maxLength()
+        if length is None:
+            raise ValueError(
+                "Regular expression with no maximum size is forbidden")
+        self.max_length = max(self.max_length, length)
+        compiled = re.compile(regex, re.DOTALL)
+        self.regex_patterns.append((compiled, user))
+
+    def commit(self):
+        """
+        Compile the trie of the literal magics.
+        """
+        if self.root.children:
+            self._magic_regex = re.compile(_trieRegex(self.root), re.DOTALL)
+        else:
+            self._magic_regex = None
+
+    def _searchStrings(self, data, limit):
+        root = self.root
+        size = len(data)
+        for start in _findAll(self._magic_regex, data, limit):
+            index = start
+            node = root
+            while True:
+                for user in node.output:
+                    yield (start, user)
+                if index == size:
+                    break
+                node = node.children.get(data[index])
+                if node is None:
+                    break
+                index += 1
+
+    def _searchRegex(self, data, limit):
+        for regex, user in self.regex_patterns:
+            for start in _findAll(regex, data, limit):
+                yield (start, user)
+
+    def search(self, data, limit=None):
+        """
+        Search magics in data. Return a list of (parser class, offset)
+        where offset is the address in bits of the beginning of the file,
+        sorted by position of the magic.
+
+        If limit is set, only magics starting in the first limit bytes of
+        data are reported: the remaining data is only used to match magics
+        crossing the limit.
+        """
+        if limit is None:
+            limit = len(data)
+        if self._magic_regex is not None:
+            matches = list(self._searchStrings(data, limit))
+        else:
+            matches = []
+        if self.regex_patterns:
+            matches.extend(self._searchRegex(data, limit))
+            matches.sort(key=lambda match: match[0])
+        hits = self.hits
+        found = []
+        for start, (offset, parser) in matches:
+            parser = parserClass(parser)
+            hits[parser] = hits.get(parser, 0) + 1
+            found.append((parser, start * 8 - offset))
+        return found
+
+    def __str__(self):
+        regex = [self._magic_regex.pattern] if self._magic_regex else []
+        regex += [compiled.pattern for compiled, user in self.regex_patterns]
+        return " | ".join(makePrintable(item, 'ASCII') for item in regex)
@@ -1,9 +1,11 @@
-from hachoir.stream import InputSubStream
+from hachoir.stream import InputSubStream, FileInputStream
 from hachoir.core.tools import humanFilesize, humanDuration
 from hachoir.core.memory import limitedMemory
 from hachoir.subfile.data_rate import DataRate
 from hachoir.subfile.output import Output
 from hachoir.subfile.pattern import HachoirPatternMatching as PatternMatching
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from sys import stderr
 from time import time
 
@@ -15,8 +17,33 @@ def skipSubfile(parser):
 
 FILE_MAX_SIZE = 100 * 1024 * 1024   # Max. file size in bytes (100 MB)
 SLICE_SIZE = 64 * 1024                # Slice size in bytes (64 KB)
+CHUNK_SIZE = 16 * 1024 * 1024         # Size in bytes of a job (16 MB)
 MEMORY_LIMIT = 50 * 1024 * 1024
 PROGRESS_UPDATE = 1.5   # Minimum number of second between two progress messages
+PENDING_CHUNKS = 2      # Number of chunks submitted per job of the process pool
+
+
+def describeParser(parser):
+    """
+    Description of a subfile displayed by SearchSubfile.processParser().
+    """
+    if not parser.content_size or parser.content_size // 8 < FILE_MAX_SIZE:
+        return parser.description
+    return parser.__class__.__name__
+
+
+class ParserResult:
+    """
+    Validated parser found by a worker process of
+    SearchSubfile.searchSubfilesParallel(), sent to the main process
+    instead of the parser.
+    """
+
+    def __init__(self, parser):
+        self.parser_class = parser.__class__
+        self.content_size = parser.content_size
+        self.description = describeParser(parser)
+        self.filename_suffix = parser.filename_suffix
 
 
 class SearchSubfile:
@@ -51,6 +78,7 @@ class SearchSubfile:
         self.start_offset = offset * 8
         self.current_offset = self.start_offset
         self.slice_size = SLICE_SIZE * 8   # 64 KB (in bits)
+        self.chunk_size = CHUNK_SIZE * 8   # 16 MB (in bits)
 
         # Statistics
         self.datarate = DataRate(self.start_offset)
@@ -58,16 +86,27 @@ class SearchSubfile:
 
         # Other flags and attributes
         self.patterns = None
+        self.parser_filter = (None, None)
+        self.jobs = 1
+        self.filename = None
         self.verbose = True
         self.debug = False
         self.output = None
         self.filter = None
 
-    def setOutput(self, directory):
-        self.output = Output(directory)
+    def setOutput(self, directory, background=False):
+        self.output = Output(directory, background)
+
+    def setJobs(self, jobs, filename):
+        """
+        Search with jobs processes, each one opening filename.
+        """
+        self.jobs = jobs
+        self.filename = filename
 
     def loadParsers(self, categories=None, parser_ids=None):
         before = time()
+        self.parser_filter = (categories, parser_ids)
         self.patterns = PatternMatching(categories, parser_ids)
         if self.debug:
             print("Regex compilation: %.1f ms" % ((time() - before) * 1000))
@@ -86,13 +125,18 @@ class SearchSubfile:
         main_error = False
         try:
             # Run search
-            limitedMemory(MEMORY_LIMIT, self.searchSubfiles)
+            if 1 < self.jobs:
+                self.searchSubfilesParallel()
+            else:
+                limitedMemory(MEMORY_LIMIT, self.searchSubfiles)
         except KeyboardInterrupt:
             print("[!] Program interrupted (CTRL+C)", file=stderr)
             main_error = True
         except MemoryError:
             main_error = True
             print("[!] Memory error!", file=stderr)
+        if self.output:
+            self.output.close()
         self.mainFooter()
         self.stream.close()
         return (not main_error)
@@ -143,16 +187,16 @@ class SearchSubfile:
 
     def processParser(self, offset, parser):
         """
-        Process a valid parser.
+        Process a valid parser (or a ParserResult).
         """
         text = "[+] File at %s" % (offset // 8)
         if parser.content_size is not None:
             text += " size=%s (%s)" % (parser.content_size //
                                        8, humanFilesize(parser.content_size // 8))
-        if not parser.content_size or parser.content_size // 8 < FILE_MAX_SIZE:
+        if isinstance(parser, ParserResult):
             text += ": " + parser.description
         else:
-            text += ": " + parser.__class__.__name__
+            text += ": " + describeParser(parser)
 
         if self.output and parser.content_size:
             if (offset == 0 and parser.content_size == self.size):
@@ -167,6 +211,43 @@ class SearchSubfile:
         print(text)
         self.next_progress = time() + PROGRESS_UPDATE
 
+    def searchMagic(self, start, end):
+        """
+        Find all 'magic_str' strings starting in the [start;end[ interval
+        (addresses in bits). Data is read up to patterns.max_length bytes
+        after end to find magics crossing end.
+
+        Returns a list of (parser class, offset) sorted by magic position,
+        where offset is beginning of a file (relative to stream begin), and
+        not the position of the magic.
+        """
+        stop = min(end + self.patterns.max_length * 8, self.size)
+        data = self.stream.readBytes(start, (stop - start) // 8)
+        found = []
+        for parser_cls, offset in self.patterns.search(data, (end - start) // 8):
+            offset += start
+            # Skip invalid offset
+            if 0 <= offset:
+                found.append((parser_cls, offset))
+        return found
+
+    def validate(self, offset, parser_cls):
+        """
+        Try the specified parser at stream offset 'offset' and update
+        statistics.
+
+        Return the parser object, or None on failure.
+        """
+        parser = self.guess(offset, parser_cls)
+
+        # Update statistics
+        if parser_cls not in self.stats:
+            self.stats[parser_cls] = [0, 0]
+        self.stats[parser_cls][0] += 1
+        if parser:
+            self.stats[parser_cls][1] += 1
+        return parser
+
     def findMagic(self, offset):
         """
         Find all 'magic_str' strings in stream in offset interval:
@@ -179,28 +260,16 @@ class SearchSubfile:
         start = offset
         end = start + self.slice_size
         end = min(end, self.size)
-        data = self.stream.readBytes(start, (end - start) // 8)
-        for parser_cls, offset in self.patterns.search(data):
-            offset += start
-            # Skip invalid offset
-            if offset < 0:
-                continue
+        for parser_cls, offset in self.searchMagic(start, end):
             if self.next_offset and offset < self.next_offset:
                 continue
 
             # Create parser at found offset
-            parser = self.guess(offset, parser_cls)
-
-            # Update statistics
-            if parser_cls not in self.stats:
-                self.stats[parser_cls] = [0, 0]
-            self.stats[parser_cls][0] += 1
+            parser = self.validate(offset, parser_cls)
             if not parser:
                 continue
 
             # Parser is valid, yield it with the offset
-            self.stats[parser_cls][1] += 1
-
             if self.debug:
                 print("Found %s at offset %s" % (
                     parser.__class__.__name__, offset // 8), file=stderr)
@@ -213,6 +282,90 @@ class SearchSubfile:
                 if end <= self.next_offset:
                     break
 
+    def searchRange(self, start, end):
+        """
+        Find and validate all subfiles with a magic in the [start;end[
+        interval (addresses in bits), without skipping subfiles of
+        "subfile: skip" parsers (see searchSubfilesParallel()).
+
+        Returns a list of (offset, ParserResult, skip) where skip is the
+        file size if the next files should be skipped, None otherwise.
+        """
+        found = []
+        while start < end:
+            stop = min(start + self.slice_size, end)
+            for parser_cls, offset in self.searchMagic(start, stop):
+                parser = self.validate(offset, parser_cls)
+                if not parser:
+                    continue
+                skip = None
+                if parser.content_size is not None and skipSubfile(parser):
+                    skip = parser.content_size
+                found.append((offset, ParserResult(parser), skip))
+            start = stop
+        return found
+
+    def searchSubfilesParallel(self):
+        """
+        Search all subfiles using a pool of self.jobs processes: the stream
+        is split in chunks which are searched and validated in parallel,
+        then results are merged in offset order.
+
+        Workers don't know the subfiles found in previous chunks, so files
+        hidden by a "subfile: skip" parser are skipped during the merge.
+        Each worker process has its own memory limit. At most
+        PENDING_CHUNKS chunks per job are submitted at once.
+
+        Workers send a ParserResult of the subfiles found: the parser is
+        only created again in the main process if filter is set.
+        """
+        self.next_offset = None
+        self.next_progress = time() + PROGRESS_UPDATE
+        chunk_size = max(self.chunk_size, self.slice_size)
+        ranges = ((start, min(start + chunk_size, self.size))
+                  for start in range(self.current_offset, self.size, chunk_size))
+        initargs = (self.filename, self.size, self.slice_size,
+                    self.parser_filter)
+        with ProcessPoolExecutor(self.jobs, initializer=_initWorker,
+                                 initargs=initargs) as executor:
+            pending = deque()
+            while True:
+                while len(pending) < self.jobs * PENDING_CHUNKS:
+                    interval = next(ranges, None)
+                    if interval is None:
+                        break
+                    pending.append(
+                        (interval[1], executor.submit(_searchRange, interval)))
+                if not pending:
+                    break
+                end, future = pending.popleft()
+                found, stats, hits = future.result()
+                self.mergeStats(stats, hits)
+                for offset, result, skip in found:
+                    if self.next_offset and offset < self.next_offset:
+                        continue
+                    if self.filter:
+                        result = self.guess(offset, result.parser_class)
+                        if not result:
+                            continue
+                    self.processParser(offset, result)
+                    if skip is not None:
+                        self.next_offset = offset + skip
+                self.current_offset = end
+                self.datarate.update(self.current_offset)
+                if self.verbose and self.next_progress <= time():
+                    self.displayProgress()
+
+    def mergeStats(self, stats, hits):
+        for parser_cls, (tried, valid) in stats.items():
+            if parser_cls not in self.stats:
+                self.stats[parser_cls] = [0, 0]
+            self.stats[parser_cls][0] += tried
+            self.stats[parser_cls][1] += valid
+        for parser_cls, count in hits.items():
+            self.patterns.hits[parser_cls] = \
+                self.patterns.hits.get(parser_cls, 0) + count
+
     def guess(self, offset, parser_cls):
         """
         Try the specified parser at stream offset 'offset'.
@@ -249,3 +402,26 @@ class SearchSubfile:
 
         # Display message
         print(message, file=stderr)
+
+
+# Search tool of a worker process of SearchSubfile.searchSubfilesParallel()
+_worker = None
+
+
+def _initWorker(filename, size, slice_size, parser_filter):
+    global _worker
+    _worker = SearchSubfile(FileInputStream(filename))
+    _worker.size = size
+    _worker.slice_size = slice_size
+    _worker.loadParsers(*parser_filter)
+
+
+def _searchRange(interval):
+    """
+    Search subfiles in the interval (start, end) in a worker process.
+    Returns (found, stats, hits): see SearchSubfile.searchRange().
+    """
+    _worker.stats = {}
+    _worker.patterns.hits = {}
+    found = limitedMemory(MEMORY_LIMIT, _worker.searchRange, *interval)
+    return found, _worker.stats, _worker.patterns.hits
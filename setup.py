@@ -81,7 +81,8 @@ def main():
         "classifiers": CLASSIFIERS,
         "license": 'GNU GPL v2',
         "packages": find_packages(),
-        "package_data": {"hachoir.wx.resource": ['hachoir_wx.xrc']},
+        "package_data": {"hachoir.parser.network": ['ouid.dat'],
+                         "hachoir.wx.resource": ['hachoir_wx.xrc']},
         "entry_points": ENTRY_POINTS,
         "extras_require": {
             "urwid": [
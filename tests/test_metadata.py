@@ -6,12 +6,16 @@ Test hachoir-metadata using the testcase.
 from hachoir.parser import createParser
 from hachoir.core.language import Language
 from hachoir.metadata import extractMetadata
+from hachoir.metadata.cache import (MetadataCache, fileKey, createEntry,
+                                    entryMetadata)
 from hachoir.metadata.timezone import createTimezone
 from hachoir.test import setup_tests
 from datetime import date, timedelta, datetime
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 import unittest
 
 DATADIR = os.path.join(os.path.dirname(__file__), 'files')
@@ -548,6 +552,137 @@ class TestMetadataCommandLine(unittest.TestCase):
 - Endianness: Big endian""")
 
 
+class TestMetadataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.db = os.path.join(self.tmpdir, "cache.db")
+
+    def test_entry(self):
+        filename = os.path.join(DATADIR, "flashmob.mkv")
+        with createParser(filename) as parser:
+            metadata = extractMetadata(parser)
+            entry = createEntry(parser, metadata)
+        self.assertEqual(entry["parser"], "matroska")
+        self.assertEqual(entry["mime_type"], "video/x-matroska")
+        self.assertEqual(entry["fields"][0][:3], ("EBML[0]", "EBML", 0))
+
+        key = fileKey(filename)
+        with MetadataCache(self.db) as cache:
+            self.assertIsNone(cache.get(key))
+            cache.set(key, entry)
+        with MetadataCache(self.db) as cache:
+            cached = entryMetadata(cache.get(key), 0.5)
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+        for human in (True, False):
+            self.assertEqual(cached.exportPlaintext(human=human),
+                             metadata.exportPlaintext(human=human))
+            self.assertEqual(cached.exportDictionary(human=human),
+                             metadata.exportDictionary(human=human))
+        self.assertEqual(cached["video[1]"].get("width"), "384")
+
+    def test_key(self):
+        filename = os.path.join(self.tmpdir, "data")
+        with open(filename, "wb") as fp:
+            fp.write(b"a" * 200000)
+        key = fileKey(filename)
+        self.assertEqual(fileKey(filename), key)
+        self.assertNotEqual(fileKey(filename, "jpeg"), key)
+        self.assertNotEqual(fileKey(filename, options=(1.0,)), key)
+        with open(filename, "r+b") as fp:
+            fp.seek(199999)
+            fp.write(b"b")
+        os.utime(filename, ns=(0, 0))
+        self.assertNotEqual(fileKey(filename), key)
+        self.assertIsNone(fileKey(os.path.join(self.tmpdir, "missing")))
+
+    def test_eviction(self):
+        with MetadataCache(self.db, max_size=100) as cache:
+            for index in range(3):
+                cache.set("key%s" % index, {"data": "x" * index})
+            cache.get("key0")
+            cache.set("key3", {"data": os.urandom(40).hex()})
+            self.assertLessEqual(cache.size, 100)
+            self.assertIsNotNone(cache.get("key0"))
+            self.assertIsNone(cache.get("key1"))
+            self.assertIsNotNone(cache.get("key3"))
+
+    def test_command_line(self):
+        args = [sys.executable, PROGRAM, "--cache", self.db,
+                os.path.join(DATADIR, "flashmob.mkv"),
+                os.path.join(DATADIR, "gps.jpg")]
+        outputs = [subprocess.check_output(args) for index in range(2)]
+        self.assertEqual(outputs[0], outputs[1])
+        with MetadataCache(self.db) as cache:
+            self.assertEqual(
+                cache.db.execute("SELECT COUNT(*) FROM entry").fetchone()[0],
+                2)
+
+    def test_raw(self):
+        # --raw changes the stored values: raw and normal runs don't share
+        # their entries
+        filename = os.path.join(DATADIR, "gps.jpg")
+        args = [sys.executable, PROGRAM, filename]
+        normal = subprocess.check_output(args)
+        raw = subprocess.check_output(args + ["--raw"])
+        self.assertNotEqual(raw, normal)
+        args += ["--cache", self.db]
+        self.assertEqual(subprocess.check_output(args), normal)
+        self.assertEqual(subprocess.check_output(args + ["--raw"]), raw)
+        self.assertEqual(subprocess.check_output(args), normal)
+        with MetadataCache(self.db) as cache:
+            self.assertEqual(
+                cache.db.execute("SELECT COUNT(*) FROM entry").fetchone()[0],
+                2)
+
+
+class TestMetadataJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def run_metadata(self, *args):
+        args = [sys.executable, PROGRAM] + list(args)
+        proc = subprocess.Popen(args,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL)
+        stdout, _ = proc.communicate()
+        return proc.returncode, stdout.decode('utf-8', 'replace')
+
+    def test_jobs(self):
+        filenames = [os.path.join(DATADIR, name)
+                     for name in ("gps.jpg", "flashmob.mkv", "cross.xcf",
+                                  "sheep_on_drugs.mp3")]
+        serial = self.run_metadata(*filenames)
+        self.assertEqual(serial[0], 0)
+        self.assertEqual(self.run_metadata("--jobs", "2", *filenames), serial)
+
+        unordered = self.run_metadata("--jobs", "2", "--unordered",
+                                      *filenames)
+        self.assertEqual(unordered[0], 0)
+        self.assertEqual(sorted(unordered[1].splitlines()),
+                         sorted(serial[1].splitlines()))
+
+    def test_recursive(self):
+        subdir = os.path.join(self.tmpdir, "sub")
+        os.mkdir(subdir)
+        shutil.copy(os.path.join(DATADIR, "gps.jpg"), subdir)
+        shutil.copy(os.path.join(DATADIR, "cross.xcf"), self.tmpdir)
+        with open(os.path.join(self.tmpdir, "corrupt.jpg"), "wb") as fp:
+            fp.write(b"\xff\xd8\xff\xe0" + b"\0" * 100)
+
+        code, stdout = self.run_metadata("--mime", "--jobs", "2",
+                                         "--recursive", self.tmpdir)
+        # The corrupt file is reported as an error, other files are processed
+        self.assertEqual(code, 1)
+        self.assertEqual(stdout.splitlines(), [
+            "%s: image/x-xcf" % os.path.join(self.tmpdir, "cross.xcf"),
+            "%s: image/jpeg" % os.path.join(subdir, "gps.jpg"),
+        ])
+
+
 if __name__ == "__main__":
     setup_tests()
     unittest.main()
@@ -3,16 +3,29 @@
 Test hachoir-parser using the testcase.
 """
 
+from hachoir.core.endian import BIG_ENDIAN, LITTLE_ENDIAN
 from hachoir.core.error import error
+from hachoir.field import (FieldSet, GenericInteger, Int16, MissingField,
+                           PackedVector, Parser, ParserError, RawBytes, UInt8,
+                           UInt16)
 from hachoir.stream import StringInputStream
-from hachoir.parser import createParser, HachoirParserList, ValidateError
+from hachoir.stream.input import SnapshotStream
+from hachoir.parser import (createParser, guessParser, HachoirParserList,
+                            QueryParser, ValidateError)
+from hachoir.parser.guess import (ValidationStats, enableValidationStats,
+                                  resetValidationStats, validationStats)
+from hachoir.parser.parser_list import (LazyParser, manifestEntries,
+                                        parserClass)
+from hachoir.parser.parser_manifest import PARSERS
 from hachoir.test import setup_tests
 from array import array
 from datetime import datetime
 import random
 import os
+import subprocess
 import sys
 import unittest
+from unittest import mock
 
 DATADIR = os.path.join(os.path.dirname(__file__), 'files')
 
@@ -665,6 +678,25 @@ class TestParsers(unittest.TestCase):
         self.checkDesc(
             parser, "/root[0]/entry[2]/modify", "2005-07-26 00:48:26")
         self.checkValue(parser, "/root[0]/entry[2]/size", 29690)
+        self.assertEqual(parser["/fat[0]"].values[2:5].tolist(), [3, 4, 5])
+
+    def test_mp4_packed_vector(self):
+        parser = self.parse("quicktime.mp4")
+        stbl = "/atom[1]/movie/atom[1]/track/atom[2]/media/atom[2]/minf/atom[2]/stbl"
+        offsets = parser[stbl + "/atom[4]/stco/chunk_offsets"]
+        self.assertEqual(len(offsets.values), 20)
+        self.assertEqual(offsets.values[:3].tolist(), [3110, 3187, 8290])
+        self.checkValue(parser, stbl + "/atom[4]/stco/chunk_offsets/chunk_offset[19]",
+                        234487)
+        # Items are created on demand
+        self.assertEqual(offsets.current_length, 0)
+        field = offsets["chunk_offset[19]"]
+        self.assertEqual(field.address, 19 * 32)
+        self.assertIs(list(offsets)[19], field)
+        self.assertEqual(offsets.current_length, 20)
+        sizes = parser[stbl + "/atom[3]/stsz/sample_sizes"]
+        self.assertEqual(sizes.values.typecode, "I")
+        self.assertEqual(sum(sizes.values), sum(field.value for field in sizes))
 
     def test_xm(self):
         parser = self.parse("dontyou.xm")
@@ -728,6 +760,13 @@ class TestParsers(unittest.TestCase):
         self.checkDisplay(parser, "/dir/itsp/lang_id", "English United States")
         self.checkValue(parser, "/dir/pmgl[0]/entry[1]/name", "/#IDXHDR")
 
+    def test_ouid(self):
+        from hachoir.parser.network.ouid import lookupOUID, REGISTERED_OUID
+        self.assertEqual(lookupOUID(0x00000A), "OMRON TATEISI ELECTRONICS CO.")
+        self.assertEqual(lookupOUID(0xACDE48), "PRIVATE")
+        self.assertIsNone(lookupOUID(0xFFFFFF))
+        self.assertEqual(len(REGISTERED_OUID), 10096)
+
     def test_blp(self):
         parser = self.parse("swat.blp")
         self.checkValue(parser, "flags", 8)
@@ -985,6 +1024,244 @@ class TestParserRandomStream(unittest.TestCase):
                     continue
 
 
+class TestParserList(unittest.TestCase):
+
+    def test_manifest(self):
+        self.assertEqual(list(PARSERS), manifestEntries(),
+                         "parser manifest is outdated: "
+                         "run tools/make_parser_manifest.py")
+
+    def test_lazy_import(self):
+        code = ("import sys, hachoir.parser; "
+                "print(' '.join(sorted(sys.modules)))")
+        root = os.path.join(os.path.dirname(__file__), "..")
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.abspath(root)
+        modules = subprocess.check_output([sys.executable, "-c", code],
+                                          env=env).decode("ascii").split()
+        parsers = [name for name in modules
+                   if name.startswith("hachoir.parser.")]
+        self.assertEqual(sorted(parsers),
+                         ["hachoir.parser.guess",
+                          "hachoir.parser.parser",
+                          "hachoir.parser.parser_list",
+                          "hachoir.parser.parser_manifest"])
+
+    def test_lazy_parser(self):
+        from hachoir.parser.image import XcfFile
+        db = HachoirParserList.getInstance()
+        parser = db.bytag["id"]["xcf"][0]
+        self.assertIsInstance(parser, LazyParser)
+        self.assertNotEqual(parser, XcfFile)
+        self.assertIs(parserClass(parser), XcfFile)
+        other = LazyParser(parser.module, parser.__name__, {})
+        self.assertEqual(other, parser)
+        self.assertEqual(hash(other), hash(parser))
+        self.assertEqual(len({parser, other, XcfFile}), 2)
+        self.assertEqual(parser.getParserTags(), XcfFile.getParserTags())
+        self.assertIs(parser.load(), XcfFile)
+
+
+class Header(FieldSet):
+    static_size = 16
+
+    def createFields(self):
+        yield UInt8(self, "type")
+        yield UInt8(self, "flags")
+
+
+class HeaderParser(Parser):
+    endian = BIG_ENDIAN
+
+    def createFields(self):
+        yield UInt16(self, "magic")
+        yield Header(self, "header[]")
+        yield RawBytes(self, "data", 4)
+
+
+class TestFieldSet(unittest.TestCase):
+
+    def test_cache(self):
+        parser = HeaderParser(StringInputStream(b"\x12\x34\x01\x02abcd"))
+        field = parser["header[0]/flags"]
+        self.assertEqual(field.path, "/header[0]/flags")
+        self.assertEqual(field.absolute_address, 24)
+        self.assertEqual(parser["data"].absolute_address, 32)
+
+        # Fields created before being written in "data": their cached
+        # address is updated
+        header = Header(parser, "header[]")
+        self.assertEqual(header["type"].absolute_address, 64)
+        self.assertEqual(header["type"].path, "/header[]/type")
+        parser.writeFieldsIn(parser["data"], 40, [header])
+        self.assertEqual(header.name, "header[1]")
+        self.assertEqual(header["type"].absolute_address, 40)
+        self.assertEqual(header["type"].path, "/header[1]/type")
+        self.assertEqual(header["type"].value, 0x62)
+        self.assertEqual(parser["padding[1]"].absolute_address, 56)
+
+    def test_path_cache(self):
+        parser = HeaderParser(StringInputStream(b"\x12\x34\x01\x02abcd"))
+        field = parser["/header[0]/type"]
+        self.assertIs(parser["header[0]/type"], field)
+        self.assertIs(parser["magic"]["../header[0]/type"], field)
+        self.assertIn("/header[0]/type", parser._path_cache)
+
+        # Replaced fields are not returned by the cache
+        parser.replaceField("header[0]", [Header(parser, "header[0]")])
+        self.assertIsNot(parser["/header[0]/type"], field)
+        self.assertIs(parser["/header[0]/type"].parent, parser["header[0]"])
+
+    def test_packed_vector(self):
+        class Entry12(GenericInteger):
+            static_size = 12
+
+            def __init__(self, parent, name, description=None):
+                GenericInteger.__init__(self, parent, name, False, 12,
+                                        description)
+
+        class VectorParser(Parser):
+            endian = LITTLE_ENDIAN
+
+            def createFields(self):
+                yield PackedVector(self, "signed", 2, Int16)
+                yield PackedVector(self, "narrow", 2, Entry12, signed=False)
+
+        data = b"\xff\xff\x02\x00\x21\x43\x65"
+        parser = VectorParser(StringInputStream(data))
+        vector = parser["signed"]
+        self.assertEqual(vector.values.tolist(), [-1, 2])
+        # The values are read without creating the items
+        self.assertEqual(vector.current_length, 0)
+        self.assertEqual(vector._items, {})
+        vector = parser["narrow"]
+        self.assertEqual(vector.values.tolist(),
+                         [field.value for field in vector])
+        self.assertEqual(vector.values.typecode, "H")
+        self.assertRaises(AssertionError, PackedVector, parser, "vector", 2,
+                          Entry12)
+
+    def test_array(self):
+        parser = HeaderParser(StringInputStream(b"\x12\x34\x01\x02abcd"))
+        headers = parser.array("header")
+        self.assertIs(headers[0], parser["header[0]"])
+        self.assertEqual(len(headers), 1)
+        self.assertEqual(list(headers), [parser["header[0]"]])
+        self.assertNotIn(1, headers)
+        self.assertRaises(MissingField, headers.__getitem__, 1)
+
+        parser.writeFieldsIn(parser["data"], 48, [Header(parser, "header[]")])
+        self.assertEqual(list(headers),
+                         [parser["header[0]"], parser["header[1]"]])
+        self.assertEqual(headers[1].absolute_address, 48)
+
+    def test_projection(self):
+        filename = os.path.join(DATADIR, "flashmob.mkv")
+        full = createParser(filename)
+        parser = createParser(filename)
+        parser.setProjection(["/Segment[*]/Info[*]/**", "/EBML[*]/DocType"])
+        path = "/Segment[0]/Info[0]/MuxingApp/unicode"
+        self.assertEqual(parser[path].value, full[path].value)
+        self.assertEqual(parser["/EBML[0]/DocType/string"].value, "matroska")
+
+        # Field sets without selected field are skipped: only the fields
+        # created by their constructor exist
+        cluster = parser["/Segment[0]/Cluster[0]"]
+        self.assertTrue(cluster.done)
+        self.assertLess(len(cluster), len(full["/Segment[0]/Cluster[0]"]))
+        self.assertEqual(cluster.size, full["/Segment[0]/Cluster[0]"].size)
+        self.assertEqual(len(parser["/EBML[0]/DocTypeVersion"]), 2)
+        self.assertEqual(len(parser["/Segment[0]"]), len(full["/Segment[0]"]))
+        self.assertRaises(ParserError, cluster.setProjection, ["/"])
+        full.close()
+        parser.close()
+
+
+class TestQueryParser(unittest.TestCase):
+
+    def test_snapshot(self):
+        with open(os.path.join(DATADIR, "cross.xcf"), "rb") as fp:
+            data = fp.read()
+        stream = StringInputStream(data)
+        reads = []
+
+        def read(address, size):
+            reads.append((address, size))
+            return StringInputStream.read(stream, address, size)
+        stream.read = read
+        parser = guessParser(stream)
+        self.assertEqual(parser.__class__.__name__, "XcfFile")
+        self.assertIs(parser.stream, stream)
+        # The validation reads are served from a single read
+        self.assertEqual(reads[0],
+                         (0, 8 * min(len(data), QueryParser.snapshot_head)))
+        self.assertLess(len(reads), 10)
+
+    def test_magic(self):
+        db = HachoirParserList.getInstance()
+        with open(os.path.join(DATADIR, "cross.xcf"), "rb") as fp:
+            data = fp.read(db.magic_size)
+        self.assertEqual([parser.__name__ for parser in db.matchMagic(data)],
+                         ["XcfFile"])
+        # The parser matching the magic is validated first
+        self.enableStats()
+        parser = guessParser(StringInputStream(data))
+        self.assertEqual(parser.__class__.__name__, "XcfFile")
+        self.assertEqual([item[:3] for item in validationStats()],
+                         [(parser.__class__, 1, 1)])
+
+    def enableStats(self):
+        enableValidationStats()
+        self.addCleanup(enableValidationStats, False)
+
+    def test_validate_once(self):
+        from hachoir.parser.image import XcfFile
+        with open(os.path.join(DATADIR, "cross.xcf"), "rb") as fp:
+            data = fp.read()
+        streams = []
+
+        def validate(parser):
+            streams.append(parser.stream)
+            return validate.orig(parser)
+        validate.orig = XcfFile.validate
+        with mock.patch.object(XcfFile, "validate", validate):
+            stream = StringInputStream(data, tags=[("file_ext", "bin")])
+            stream.packets = [len(data)]
+            parser = guessParser(stream)
+        self.assertIs(parser.stream, stream)
+        # The parser is only validated on the snapshot, which has the
+        # packets and the tags of the stream
+        self.assertEqual(len(streams), 1)
+        self.assertIsInstance(streams[0], SnapshotStream)
+        self.assertEqual(streams[0].packets, stream.packets)
+        self.assertEqual(streams[0].tags, stream.tags)
+
+    def test_validation_stats(self):
+        stream = StringInputStream(b"\0" * 512)
+        self.assertIsNone(guessParser(stream))
+        self.assertEqual(validationStats(), [])
+        self.enableStats()
+        self.assertIsNone(guessParser(stream))
+        stats = validationStats()
+        parsers = [item[0] for item in stats]
+        self.assertEqual(len(parsers), len(set(parsers)))
+        for parser, count, valid, seconds in stats:
+            self.assertGreaterEqual(count, 1)
+            self.assertLessEqual(valid, count)
+            self.assertGreaterEqual(seconds, 0.0)
+        self.assertEqual([item[3] for item in stats],
+                         sorted((item[3] for item in stats), reverse=True))
+        resetValidationStats()
+        self.assertEqual(validationStats(), [])
+
+        # Statistics of a single query
+        query = QueryParser(stream.tags)
+        query.validation_stats = ValidationStats()
+        self.assertIsNone(query.parse(stream))
+        self.assertEqual(len(query.validation_stats.items()), len(stats))
+        self.assertEqual(validationStats(), [])
+
+
 if __name__ == "__main__":
     setup_tests()
     unittest.main()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Test hachoir.stream input streams.
+"""
+
+from hachoir.core.endian import BIG_ENDIAN, LITTLE_ENDIAN, MIDDLE_ENDIAN
+from hachoir.stream import (FileInputStream, InputIOStream, MmapInputStream,
+                            StringInputStream, InputSubStream, OutputStream,
+                            FileOutputStream, ConcatStream, FileConcatStream,
+                            FragmentedStream, RangeInputStream)
+from hachoir.field import Parser, Fragment
+from hachoir.field.sub_file import CompressedPipe
+from hachoir.metadata import extractMetadata
+from hachoir.parser import guessParser
+from hachoir.stream.input import InputPipe, ReadStreamError
+from hachoir.test import setup_tests
+from functools import partial
+from io import BytesIO
+import gc
+import gzip
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import weakref
+
+DATADIR = os.path.join(os.path.dirname(__file__), 'files')
+
+
+class TestMmapInputStream(unittest.TestCase):
+    filename = os.path.join(DATADIR, 'yellowdude.3ds')
+
+    def openStreams(self):
+        stream = FileInputStream(self.filename)
+        self.addCleanup(stream.close)
+        with open(self.filename, 'rb') as fp:
+            data = fp.read()
+        return stream, StringInputStream(data)
+
+    def test_regular_file(self):
+        stream, _ = self.openStreams()
+        self.assertIsInstance(stream, MmapInputStream)
+
+    def test_file_object(self):
+        stream = FileInputStream(BytesIO(b'abc'))
+        self.assertIsInstance(stream, InputIOStream)
+        self.assertEqual(stream.readBytes(8, 2), b'bc')
+
+    def test_read(self):
+        stream, ref = self.openStreams()
+        self.assertEqual(stream.size, ref.size)
+        for address, size in ((0, 8), (3, 13), (8 * 100, 8 * 1000)):
+            self.assertEqual(stream.read(address, size),
+                             ref.read(address, size))
+        self.assertEqual(stream.readBytes(800, 37), ref.readBytes(800, 37))
+        self.assertRaises(ReadStreamError,
+                          stream.readBytes, stream.size - 8, 2)
+
+    def test_read_bits(self):
+        stream, ref = self.openStreams()
+        for endian in (BIG_ENDIAN, LITTLE_ENDIAN, MIDDLE_ENDIAN):
+            for address, nbits in ((0, 16), (5, 3), (13, 27), (64, 64)):
+                self.assertEqual(stream.readBits(address, nbits, endian),
+                                 ref.readBits(address, nbits, endian))
+        self.assertRaises(ReadStreamError,
+                          stream.readBits, stream.size - 4, 8, BIG_ENDIAN)
+
+    def test_search_bytes(self):
+        stream, ref = self.openStreams()
+        needle = ref.readBytes(8 * 5000, 4)
+        self.assertEqual(stream.searchBytes(needle, 8 * 10),
+                         ref.searchBytes(needle, 8 * 10))
+        self.assertEqual(stream.searchBytes(needle, 0, 8 * 5003), None)
+
+
+class TestBlockCache(unittest.TestCase):
+    data = bytes(range(256)) * 64
+
+    def test_small_reads(self):
+        stream = InputIOStream(BytesIO(self.data),
+                               cache_size=4096, cache_block_size=1024)
+        for address in range(0, 8 * len(self.data) - 32, 12):
+            self.assertEqual(stream.readBits(address, 20, BIG_ENDIAN),
+                             StringInputStream(self.data).readBits(
+                                 address, 20, BIG_ENDIAN))
+        cache = stream.cache
+        self.assertEqual(cache.misses, len(self.data) // 1024)
+        self.assertLessEqual(cache.size, 4096)
+
+    def test_cross_block_read(self):
+        stream = InputIOStream(BytesIO(self.data),
+                               cache_size=8192, cache_block_size=1024)
+        self.assertEqual(stream.readBytes(8 * 1000, 2000),
+                         self.data[1000:3000])
+        self.assertRaises(ReadStreamError,
+                          stream.readBytes, 8 * (len(self.data) - 10), 20)
+
+    def test_substream(self):
+        stream = InputIOStream(BytesIO(self.data))
+        sub = InputSubStream(stream, 8 * 100, 8 * 50)
+        self.assertIs(sub.cache, stream.cache)
+        self.assertEqual(sub.readBytes(0, 4), self.data[100:104])
+        self.assertEqual(stream.readBytes(8 * 104, 4), self.data[104:108])
+        self.assertEqual(stream.cache.hits, 1)
+
+    def test_disabled(self):
+        stream = InputIOStream(BytesIO(self.data), cache_size=0)
+        self.assertIsNone(stream.cache)
+        self.assertEqual(stream.readBytes(8, 3), self.data[1:4])
+
+
+class TestReadAheadCache(unittest.TestCase):
+    data = bytes(range(256)) * 256
+
+    def openStream(self, **args):
+        stream = InputIOStream(BytesIO(self.data), cache_size=8192,
+                               cache_block_size=1024, readahead=4096, **args)
+        self.addCleanup(stream.close)
+        return stream
+
+    def test_sequential(self):
+        stream = self.openStream()
+        cache = stream.cache
+        for address in range(0, len(self.data) - 100, 100):
+            self.assertEqual(stream.readBytes(8 * address, 100),
+                             self.data[address:address + 100])
+            cache.wait()
+        self.assertGreater(cache.prefetched, 0)
+        self.assertEqual(cache.prefetch_hits, cache.prefetched)
+        self.assertEqual(cache.prefetch_ratio, 1.0)
+        self.assertEqual(cache.misses, 3)
+        self.assertLessEqual(cache.size, 8192)
+
+    def test_random(self):
+        stream = self.openStream()
+        for address in (50000, 3, 20000, 20100, 63000, 1025, 40000):
+            self.assertEqual(stream.readBytes(8 * address, 1500),
+                             self.data[address:address + 1500])
+        self.assertRaises(ReadStreamError,
+                          stream.readBytes, 8 * (len(self.data) - 10), 20)
+        self.assertLessEqual(stream.cache.prefetch_hits,
+                             stream.cache.prefetched)
+
+    def test_disabled(self):
+        stream = InputIOStream(BytesIO(self.data))
+        self.assertFalse(hasattr(stream.cache, "prefetched"))
+
+    def test_collect(self):
+        # The threads don't keep an unclosed stream alive
+        stream = InputIOStream(BytesIO(self.data), cache_size=8192,
+                               cache_block_size=1024, readahead=4096)
+        for address in range(0, 8000, 100):
+            stream.readBytes(8 * address, 100)
+        cache = stream.cache
+        cache.wait()
+        threads = cache._threads
+        self.assertTrue(threads)
+        ref = weakref.ref(stream)
+        del stream, cache
+        gc.collect()
+        self.assertIsNone(ref())
+        for thread in threads:
+            thread.join(5.0)
+            self.assertFalse(thread.is_alive())
+
+
+class TestRangeInputStream(unittest.TestCase):
+    data = bytes(range(256)) * 256
+
+    def openStream(self, data=None, **args):
+        if data is None:
+            data = self.data
+        requests = []
+
+        def fetch(offset, size):
+            requests.append((offset, size))
+            return data[offset:offset + size]
+        stream = RangeInputStream(fetch, len(data), **args)
+        self.addCleanup(stream.close)
+        return stream, requests
+
+    def test_read(self):
+        stream, requests = self.openStream(cache_block_size=1024,
+                                           readahead=0)
+        self.assertEqual(stream.size, 8 * len(self.data))
+        self.assertEqual(stream.readBytes(8 * 1500, 10),
+                         self.data[1500:1510])
+        self.assertEqual(requests, [(1024, 1024)])
+        # Adjacent missing blocks are fetched at once
+        self.assertEqual(stream.readBytes(8 * 100, 4000),
+                         self.data[100:4100])
+        self.assertEqual(requests[1:], [(0, 1024), (2048, 3072)])
+        self.assertEqual(stream.requests, 3)
+        self.assertEqual(stream.transferred, 5120)
+        self.assertRaises(ReadStreamError,
+                          stream.readBytes, 8 * (len(self.data) - 10), 20)
+
+    def test_prefetch(self):
+        stream, requests = self.openStream(cache_block_size=1024,
+                                           readahead=4096, jobs=2)
+        cache = stream.cache
+        for address in range(0, 20000, 100):
+            self.assertEqual(stream.readBytes(8 * address, 100),
+                             self.data[address:address + 100])
+            cache.wait()
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(cache.prefetch_hits, 17)
+        self.assertLessEqual(stream.transferred, 24 * 1024)
+
+    def test_moov_at_end(self):
+        # MP4 file with the moov atom after 8 MB of media data
+        with open(os.path.join(DATADIR, "quicktime.mp4"), "rb") as fp:
+            data = fp.read(3070)
+        mdat_size = 8 << 20
+        data = (data[:24] + struct.pack(">I4s", 8 + mdat_size, b"mdat")
+                + bytes(mdat_size) + data[24:])
+        stream, requests = self.openStream(data)
+        parser = guessParser(stream)
+        self.assertEqual(parser.__class__.__name__, "MP4File")
+        metadata = extractMetadata(parser)
+        self.assertEqual(metadata.get("width"), 190)
+        self.assertLess(stream.transferred, 256 * 1024)
+
+
+class Pipe:
+    """Non-seekable file object"""
+
+    def __init__(self, data):
+        self._input = BytesIO(data)
+
+    def read(self, size):
+        return self._input.read(size)
+
+    def close(self):
+        self._input.close()
+
+
+class TestInputPipe(unittest.TestCase):
+    data = os.urandom(10 * 65536 + 1000)
+
+    def test_spill(self):
+        stream = InputIOStream(Pipe(self.data), cache_size=4 * 65536)
+        self.addCleanup(stream.close)
+        pipe = stream._input
+        self.assertIsInstance(pipe, InputPipe)
+        self.assertEqual(stream.readBytes(8 * 100, 10), self.data[100:110])
+        self.assertEqual(pipe.spilled_size, 0)
+
+        # Read the whole input: older blocks are spilled to disk
+        self.assertFalse(stream.sizeGe(8 * len(self.data) + 8))
+        self.assertEqual(stream.size, 8 * len(self.data))
+        self.assertLessEqual(pipe.resident_size, 4 * 65536)
+        self.assertEqual(pipe.spilled_size, 7 * 65536)
+
+        # Seek backward, across the spilled blocks
+        for address in (0, 65530, 3 * 65536 + 17, 10 * 65536 + 900):
+            self.assertEqual(stream.readBytes(8 * address, 100),
+                             self.data[address:address + 100])
+        self.assertEqual(pipe.spill_reads, 3)
+        self.assertLessEqual(pipe.resident_size, 4 * 65536)
+        self.assertEqual(stream.readBytes(0, len(self.data)), self.data)
+        self.assertRaises(ReadStreamError,
+                          stream.readBytes, 8 * (len(self.data) - 10), 20)
+
+    def test_small_budget(self):
+        stream = InputIOStream(Pipe(self.data), cache_size=0)
+        self.addCleanup(stream.close)
+        for address in range(len(self.data) - 10, 0, -50000):
+            self.assertEqual(stream.readBytes(8 * address, 10),
+                             self.data[address:address + 10])
+        self.assertEqual(stream._input.resident_size, 65536)
+
+
+class TestSearchBytes(unittest.TestCase):
+    data = (b"x" * 5000 + b"PK\5\6" + b"y" * 10000 + b"PK\3\4"
+            + b"\xff\xd9" * 3 + b"z" * 3)
+
+    def streams(self):
+        stream = InputIOStream(BytesIO(self.data), cache_block_size=1024)
+        # Small windows: needles cross the window boundaries
+        stream.search_window = 4099
+        yield stream
+        yield InputIOStream(Pipe(self.data))
+        yield StringInputStream(self.data)
+        yield InputSubStream(StringInputStream(b"abc" + self.data),
+                             8 * 3, 8 * len(self.data))
+
+    def test_search(self):
+        for stream in self.streams():
+            self.assertEqual(stream.searchBytes(b"PK\5\6"), 8 * 5000)
+            self.assertEqual(stream.searchBytes(b"PK", 8 * 5001), 8 * 15004)
+            self.assertIsNone(stream.searchBytes(b"PK\3\4", 0, 8 * 15007))
+            self.assertEqual(stream.searchBytes(b"PK\3\4", 0, 8 * 15008),
+                             8 * 15004)
+            self.assertIsNone(stream.searchBytes(b"missing"))
+            self.assertEqual(stream.searchBytesLength(b"PK", True, 8 * 10),
+                             4992)
+
+    def test_search_any(self):
+        for stream in self.streams():
+            self.assertEqual(stream.searchBytesAny((b"\xff", b"PK\3\4")),
+                             (8 * 15004, b"PK\3\4"))
+            self.assertEqual(stream.searchBytesAny((b"P", b"PK\5")),
+                             (8 * 5000, b"PK\5"))
+            self.assertIsNone(stream.searchBytesAny((b"a", b"b")))
+
+    def test_iter(self):
+        for stream in self.streams():
+            self.assertEqual(list(stream.iterSearchBytes(b"\xff\xd9")),
+                             [8 * 15008, 8 * 15010, 8 * 15012])
+            self.assertEqual(list(stream.iterSearchBytes(b"zz")), [8 * 15014])
+            self.assertEqual(list(stream.iterSearchBytes(b"\xff", 8 * 15009,
+                                                         8 * 15012)),
+                             [8 * 15010])
+
+
+class TestConcatStream(unittest.TestCase):
+    data = os.urandom(10000)
+
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.filenames = []
+        for index, start in enumerate(range(0, len(self.data), 1000)):
+            filename = os.path.join(tmpdir, "data.%03u" % (index + 1))
+            with open(filename, "wb") as fp:
+                fp.write(self.data[start:start + 1000])
+            self.filenames.append(filename)
+
+    def test_read(self):
+        stream = FileConcatStream(self.filenames, max_open=2)
+        self.addCleanup(stream.close)
+        ref = StringInputStream(self.data)
+        self.assertEqual(stream.size, 8 * len(self.data))
+        for address, size in ((0, 8), (8 * 999, 16), (8 * 500 + 3, 8 * 3000),
+                              (8 * 9990, 80), (0, 8 * len(self.data))):
+            self.assertEqual(stream.read(address, size),
+                             ref.read(address, size))
+        self.assertEqual(stream.readBits(8 * 1000 - 4, 8, BIG_ENDIAN),
+                         ref.readBits(8 * 1000 - 4, 8, BIG_ENDIAN))
+        self.assertLessEqual(len(stream._opened), 2)
+        self.assertRaises(ReadStreamError,
+                          stream.readBytes, 8 * (len(self.data) - 10), 20)
+
+        needle = self.data[1998:2004]
+        self.assertEqual(stream.searchBytes(needle), ref.searchBytes(needle))
+
+    def test_streams(self):
+        # Last segment of unknown size
+        stream = ConcatStream((StringInputStream(self.data[:3000]),
+                               InputIOStream(Pipe(self.data[3000:]))))
+        self.assertIsNone(stream.size)
+        self.assertEqual(stream.readBytes(8 * 2990, 20),
+                         self.data[2990:3010])
+        self.assertFalse(stream.sizeGe(8 * len(self.data) + 8))
+        self.assertEqual(stream.size, 8 * len(self.data))
+
+
+class FragmentParser(Parser):
+    """Chain of 100 bytes fragments in the order of CHAIN"""
+    CHAIN = (0, 1, 2, 5, 6, 7, 3, 9)
+    endian = BIG_ENDIAN
+
+    def createFields(self):
+        chain = self.CHAIN
+        for index in range(10):
+            fragment = Fragment(self, "chunk[%u]" % index, size=800)
+            if index in chain:
+                pos = chain.index(index)
+                if pos + 1 < len(chain):
+                    next = partial(self.__getitem__,
+                                   "chunk[%u]" % chain[pos + 1])
+                else:
+                    next = None
+                fragment.setLinks(self["chunk[0]"] if index else None, next)
+            yield fragment
+
+
+class TestFragmentedStream(unittest.TestCase):
+    data = os.urandom(1000)
+
+    def test_read(self):
+        parser = FragmentParser(StringInputStream(self.data))
+        stream = parser["chunk[0]"].getSubIStream()
+        self.assertIsInstance(stream, FragmentedStream)
+        ref = b"".join(self.data[index * 100:index * 100 + 100]
+                       for index in FragmentParser.CHAIN)
+        self.assertEqual(stream.readBytes(8 * 250, 300), ref[250:550])
+        self.assertFalse(stream.sizeGe(8 * len(ref) + 8))
+        self.assertEqual(stream.size, 8 * len(ref))
+        self.assertEqual(stream.readBytes(0, len(ref)), ref)
+        self.assertEqual(stream.readBits(8 * 300 - 4, 8, BIG_ENDIAN),
+                         StringInputStream(ref).readBits(8 * 300 - 4, 8,
+                                                         BIG_ENDIAN))
+        # Adjacent fragments are merged in extents
+        self.assertEqual(list(stream._starts), [0, 2400, 4800, 5600])
+        self.assertEqual(list(stream._sizes), [2400, 2400, 800, 800])
+
+
+class TestCompressedPipe(unittest.TestCase):
+    data = b"".join(b"%08u\n" % index for index in range(200000))
+
+    def setUp(self):
+        # Small memory budget and checkpoint interval
+        for name, value in (("max_size", 1 << 17),
+                            ("checkpoint_interval", 1 << 18)):
+            self.addCleanup(setattr, CompressedPipe, name,
+                            getattr(CompressedPipe, name))
+            setattr(CompressedPipe, name, value)
+        compressed = gzip.compress(self.data, mtime=0)
+        self.parser = guessParser(StringInputStream(compressed))
+
+    def test_random_access(self):
+        stream = self.parser["file"].getSubIStream()
+        pipe = stream._input
+        self.assertIsInstance(pipe, CompressedPipe)
+        for address in (1500000, 10, 800000, 1799990, 300000, 5):
+            self.assertEqual(stream.readBytes(8 * address, 10),
+                             self.data[address:address + 10])
+        self.assertEqual(len(pipe.checkpoints), 7)
+        self.assertLessEqual(pipe.resident_size, 1 << 17)
+        self.assertEqual(pipe.spilled_size, 0)
+        self.assertFalse(stream.sizeGe(8 * len(self.data) + 8))
+        self.assertEqual(stream.size, 8 * len(self.data))
+
+    def test_shared_checkpoints(self):
+        field = self.parser["file"]
+        stream = field.getSubIStream()
+        self.assertEqual(stream.readBytes(8 * 1500000, 10),
+                         self.data[1500000:1500010])
+        checkpoints = stream._input.checkpoints
+        del stream
+        # A new stream of the field resumes from the known checkpoints
+        stream = field.getSubIStream()
+        self.assertIs(stream._input.checkpoints, checkpoints)
+        self.assertEqual(stream.readBytes(8 * 1700000, 10),
+                         self.data[1700000:1700010])
+        self.assertEqual(len(checkpoints), 7)
+
+
+class TestCopyBytes(unittest.TestCase):
+    filename = os.path.join(DATADIR, 'yellowdude.3ds')
+
+    def setUp(self):
+        with open(self.filename, 'rb') as fp:
+            self.data = fp.read()
+
+    def copy(self, input, offset, size):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "copy")
+            with FileOutputStream(filename) as output:
+                output.writeBytes(b"head")
+                output.copyBytesFrom(input, 8 * offset, size)
+                output.writeBytes(b"tail")
+            with open(filename, 'rb') as fp:
+                return fp.read()
+
+    def test_file_to_file(self):
+        stream = FileInputStream(self.filename)
+        self.addCleanup(stream.close)
+        sub = InputSubStream(stream, 8 * 10)
+        self.assertEqual(sub.getFileOffset(8 * 5), (stream._input.fileno(), 15))
+        self.assertEqual(self.copy(sub, 5, 30000),
+                         b"head" + self.data[15:30015] + b"tail")
+
+    def test_buffered(self):
+        stream = StringInputStream(self.data)
+        self.assertIsNone(stream.getFileOffset(0))
+        self.assertEqual(self.copy(stream, 100, 20000),
+                         b"head" + self.data[100:20100] + b"tail")
+        output = BytesIO()
+        OutputStream(output).copyBytesFrom(stream, 8, 3)
+        self.assertEqual(output.getvalue(), self.data[1:4])
+
+
+if __name__ == "__main__":
+    setup_tests()
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test hachoir-subfile.
+"""
+
+from hachoir.parser.archive import RarFile, ZipFile
+from hachoir.parser.image import PngFile
+from hachoir.stream import StringInputStream, FileInputStream
+from hachoir.subfile.pattern import HachoirPatternMatching
+from hachoir.subfile.search import (PENDING_CHUNKS, ParserResult,
+                                    SearchSubfile)
+from hachoir.subfile import search
+from hachoir.test import setup_tests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+import io
+import os
+import tempfile
+import unittest
+from threading import current_thread, main_thread
+from unittest import mock
+
+DATADIR = os.path.join(os.path.dirname(__file__), 'files')
+
+
+def readFile(filename):
+    with open(os.path.join(DATADIR, filename), 'rb') as fp:
+        return fp.read()
+
+
+class TestPatternMatching(unittest.TestCase):
+
+    def test_search(self):
+        patterns = HachoirPatternMatching(parser_ids=("zip", "png", "rar"))
+        data = b"xxPK\3\4" + b"\0" * 10 + b"\x89PNG\r\n\x1a\n" + b"PK\3\4"
+        found = patterns.search(memoryview(data))
+        self.assertEqual(found, [(ZipFile, 2 * 8),
+                                 (PngFile, 16 * 8),
+                                 (ZipFile, 24 * 8)])
+        self.assertEqual(patterns.hits, {ZipFile: 2, PngFile: 1})
+        self.assertEqual(patterns.search(b"PK\3"), [])
+
+    def test_search_subfiles(self):
+        data = b"\0" * 100 + readFile("hachoir-core.rar")
+        subfile = SearchSubfile(StringInputStream(data))
+        subfile.verbose = False
+        subfile.loadParsers(parser_ids=("rar",))
+        found = []
+        subfile.processParser = lambda offset, parser: found.append(
+            (offset, parser.__class__))
+        subfile.mainHeader()
+        subfile.searchSubfiles()
+        self.assertEqual(found, [(100 * 8, RarFile)])
+        self.assertEqual(subfile.stats[RarFile], [1, 1])
+
+    def test_output(self):
+        data = b"\0" * 100 + readFile("logo-kubuntu.png")
+        with tempfile.TemporaryDirectory() as directory:
+            input_name = os.path.join(directory, "input")
+            with open(input_name, "wb") as fp:
+                fp.write(data)
+            for background in (False, True):
+                output = os.path.join(directory, "output%s" % background)
+                subfile = SearchSubfile(FileInputStream(input_name))
+                subfile.verbose = False
+                subfile.loadParsers(parser_ids=("png",))
+                subfile.setOutput(output, background)
+                with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                    self.assertTrue(subfile.main())
+                with open(os.path.join(output, "file-0001.png"), "rb") as fp:
+                    self.assertEqual(fp.read(), data[100:])
+
+    def test_output_short_copy(self):
+        # copyFileRange() copying nothing: the writer thread reads the
+        # file descriptor, not the stream used by the search
+        data = b"\0" * 100 + readFile("logo-kubuntu.png")
+        with tempfile.TemporaryDirectory() as directory:
+            input_name = os.path.join(directory, "input")
+            with open(input_name, "wb") as fp:
+                fp.write(data)
+            output = os.path.join(directory, "output")
+            stream = FileInputStream(input_name)
+            subfile = SearchSubfile(stream)
+            subfile.verbose = False
+            subfile.loadParsers(parser_ids=("png",))
+            subfile.setOutput(output, True)
+
+            threads = set()
+            readBytes = stream.readBytes
+
+            def readBytesThread(address, nbytes):
+                threads.add(current_thread())
+                return readBytes(address, nbytes)
+            stream.readBytes = readBytesThread
+            with mock.patch("hachoir.stream.output.copyFileRange",
+                            return_value=0) as copy:
+                with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                    self.assertTrue(subfile.main())
+            self.assertTrue(copy.called)
+            self.assertEqual(threads, {main_thread()})
+            with open(os.path.join(output, "file-0001.png"), "rb") as fp:
+                self.assertEqual(fp.read(), data[100:])
+
+    def searchFile(self, filename, jobs):
+        stream = FileInputStream(filename)
+        self.addCleanup(stream.close)
+        subfile = SearchSubfile(stream)
+        subfile.verbose = False
+        subfile.setJobs(jobs, filename)
+        subfile.slice_size = 4096 * 8
+        subfile.chunk_size = 8192 * 8
+        subfile.loadParsers(parser_ids=("zip", "rar", "png"))
+        found = []
+
+        def processParser(offset, parser):
+            if isinstance(parser, ParserResult):
+                found.append((offset, parser.parser_class))
+            else:
+                found.append((offset, parser.__class__))
+        subfile.processParser = processParser
+        subfile.mainHeader()
+        if 1 < jobs:
+            subfile.searchSubfilesParallel()
+        else:
+            subfile.searchSubfiles()
+        return found
+
+    def test_search_parallel(self):
+        data = (b"\0" * 5000 + readFile("hachoir.org.sxw")
+                + b"\0" * 100 + readFile("logo-kubuntu.png")
+                + readFile("hachoir-core.rar"))
+        with tempfile.NamedTemporaryFile(suffix=".bin") as fp:
+            fp.write(data)
+            fp.flush()
+            found = self.searchFile(fp.name, 1)
+            self.assertEqual([parser for offset, parser in found],
+                             [ZipFile, PngFile, RarFile])
+            self.assertEqual(self.searchFile(fp.name, 3), found)
+
+    def test_search_parallel_window(self):
+        # The chunks are submitted through a window of PENDING_CHUNKS
+        # chunks per job
+        counts = {"submitted": 0, "done": 0, "pending": 0}
+
+        class Executor(ThreadPoolExecutor):
+            def __init__(self, jobs, **kw):
+                # A single thread: the worker state is global
+                ThreadPoolExecutor.__init__(self, 1, **kw)
+
+            def submit(self, func, *args):
+                counts["submitted"] += 1
+                counts["pending"] = max(counts["pending"],
+                                        counts["submitted"] - counts["done"])
+                future = ThreadPoolExecutor.submit(self, func, *args)
+                result = future.result
+
+                def getResult():
+                    counts["done"] += 1
+                    return result()
+                future.result = getResult
+                return future
+
+        data = b"\0" * 100000 + readFile("logo-kubuntu.png")
+        with tempfile.NamedTemporaryFile(suffix=".bin") as fp:
+            fp.write(data)
+            fp.flush()
+            with mock.patch("hachoir.subfile.search.ProcessPoolExecutor",
+                            Executor):
+                found = self.searchFile(fp.name, 2)
+            # The worker state of the thread
+            search._worker.stream.close()
+            search._worker = None
+        self.assertEqual(found, [(100000 * 8, PngFile)])
+        self.assertGreater(counts["submitted"], 8)
+        self.assertEqual(counts["pending"], 2 * PENDING_CHUNKS)
+
+
+if __name__ == "__main__":
+    setup_tests()
+    unittest.main()
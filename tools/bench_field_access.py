@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark of field attributes on deeply nested formats: parse files (MKV
+EBML elements, MP4 atoms, ...), then measure the time to read the
+absolute_address and path attributes of all fields, to get all fields by
+their absolute path from the root (parser["/a/b/c"]), to get the length and
+iterate on all arrays (fieldset.array("item")), and the time to parse again
+and read all values (which reads absolute_address).
+
+Usage: bench_field_access.py [filename ...]
+"""
+from hachoir.parser import createParser
+from hachoir.test import setup_tests
+from sys import argv
+import os
+import time
+
+TESTCASE = os.path.join(os.path.dirname(__file__), "..", "tests", "files")
+FILENAMES = ("flashmob.mkv", "10min.mkv", "quicktime.mp4",
+             "pentax_320x240.mov")
+LOOPS = 5
+
+
+def walk(fieldset, depth=1):
+    fields = []
+    max_depth = depth
+    for field in fieldset:
+        fields.append(field)
+        if field.is_field_set:
+            subfields, subdepth = walk(field, depth + 1)
+            fields.extend(subfields)
+            max_depth = max(max_depth, subdepth)
+    return fields, max_depth
+
+
+def readValues(fieldset):
+    for field in fieldset:
+        field.value
+        if field.is_field_set:
+            readValues(field)
+
+
+def best(func, *args):
+    timings = []
+    for loop in range(LOOPS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def readAddresses(fields):
+    for field in fields:
+        field.absolute_address
+
+
+def readPaths(fields):
+    for field in fields:
+        field.path
+
+
+def getFields(parser, paths):
+    for path in paths:
+        parser[path]
+
+
+def readArrays(filename):
+    """
+    Time to get the length and iterate on all arrays of a parsed file, for
+    the first time.
+    """
+    parser = createParser(filename)
+    fields, depth = walk(parser)
+    arrays = []
+    for fieldset in fields:
+        if fieldset.is_field_set:
+            names = set(field.name[:field.name.rfind("[")]
+                        for field in fieldset if field.name.endswith("]"))
+            arrays.extend((fieldset, name) for name in names)
+    start = time.perf_counter()
+    for fieldset, name in arrays:
+        array = fieldset.array(name)
+        len(array)
+        for item in array:
+            pass
+    dt = time.perf_counter() - start
+    parser.close()
+    return dt
+
+
+def parse(filename):
+    parser = createParser(filename)
+    readValues(parser)
+    parser.close()
+
+
+def measure(filename):
+    parser = createParser(filename)
+    if parser is None:
+        print("Unable to parse %s" % filename)
+        return
+    fields, depth = walk(parser)
+    print("%s: %u fields, depth %u" % (os.path.basename(filename),
+                                       len(fields), depth))
+    print("  absolute_address: %.1f ms"
+          % (best(readAddresses, fields) * 1e3))
+    print("  path: %.1f ms" % (best(readPaths, fields) * 1e3))
+    paths = [field.path for field in fields]
+    print("  getField(path): %.1f ms" % (best(getFields, parser, paths) * 1e3))
+    print("  array(): %.1f ms"
+          % (min(readArrays(filename) for loop in range(LOOPS)) * 1e3))
+    parser.close()
+    print("  parse and read values: %.1f ms" % (best(parse, filename) * 1e3))
+
+
+def main():
+    setup_tests()
+    filenames = argv[1:] or [os.path.join(TESTCASE, name)
+                             for name in FILENAMES]
+    for filename in filenames:
+        measure(filename)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark of field objects: parse files, create all fields, read
+their value and display, and report the memory allocated per field.
+
+Usage: bench_field_memory.py [filename ...]
+"""
+from hachoir.parser import createParser
+from hachoir.test import setup_tests
+from sys import argv
+import gc
+import os
+import tracemalloc
+
+TESTCASE = os.path.join(os.path.dirname(__file__), "..", "tests", "files")
+FILENAMES = ("arp_dns_ping_dns.tcpdump", "quicktime.mp4",
+             "08lechat_hq_fr.mp3", "bsize-1024-isize-1024.ext2")
+
+
+def walk(fieldset):
+    count = 0
+    for field in fieldset:
+        count += 1
+        field.value
+        field.display
+        if field.is_field_set:
+            count += walk(field)
+    return count
+
+
+def measure(filename):
+    parser = createParser(filename)
+    if parser is None:
+        print("Unable to parse %s" % filename)
+        return
+    # Warm up: import modules and fill caches used by the parser
+    walk(parser)
+    parser.close()
+
+    parser = createParser(filename)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    count = walk(parser)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print("%s: %u fields, %u bytes, %.1f bytes/field"
+          % (os.path.basename(filename), count, size, size / count))
+    parser.close()
+
+
+def main():
+    setup_tests()
+    filenames = argv[1:] or [os.path.join(TESTCASE, name)
+                             for name in FILENAMES]
+    for filename in filenames:
+        measure(filename)
+
+
+if __name__ == "__main__":
+    main()
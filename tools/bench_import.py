@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: measure the import time of hachoir with
+"python -X importtime" in new processes.
+
+For each scenario, report the total import time (best of RUNS runs), the
+number of imported modules and parser modules, and the slowest hachoir
+modules. Bytecode is cached in a temporary directory, warmed up by a
+first run.
+
+Usage: bench_import.py [filename]
+"""
+from sys import argv, executable
+import os
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+FILENAME = os.path.join(ROOT, "tests", "files", "cross.xcf")
+RUNS = 5
+SCENARIOS = (
+    ("import hachoir.parser", "import hachoir.parser"),
+    ("createParser()",
+     "from hachoir.core import config; config.quiet = True; "
+     "from hachoir.parser import createParser; createParser(%r)"),
+    ("import hachoir.metadata", "import hachoir.metadata"),
+)
+
+
+def importTimes(code, pycache):
+    """
+    Run code in a new process: return a dict of the imported modules
+    (name => import time in microseconds, without submodules).
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (ROOT, env.get("PYTHONPATH")) if path)
+    proc = subprocess.run([executable, "-X", "importtime",
+                           "-X", "pycache_prefix=" + pycache, "-c", code],
+                          env=env, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, name = line[12:].split("|")
+        try:
+            modules[name.strip()] = int(self_time)
+        except ValueError:
+            # Header line
+            pass
+    return modules
+
+
+def bench(title, code, pycache):
+    importTimes(code, pycache)
+    best = None
+    for run in range(RUNS):
+        modules = importTimes(code, pycache)
+        if best is None or sum(modules.values()) < sum(best.values()):
+            best = modules
+    parsers = [name for name in best if name.startswith("hachoir.parser.")]
+    print("%s: %.1f ms, %u modules (%u hachoir.parser modules)"
+          % (title, sum(best.values()) / 1000, len(best), len(parsers)))
+    slowest = sorted((name for name in best if name.startswith("hachoir")),
+                     key=best.get, reverse=True)
+    for name in slowest[:5]:
+        print("  %s: %.1f ms" % (name, best[name] / 1000))
+
+
+def main():
+    filename = argv[1] if 1 < len(argv) else FILENAME
+    with tempfile.TemporaryDirectory() as pycache:
+        for title, code in SCENARIOS:
+            if "%r" in code:
+                code %= os.path.abspath(filename)
+            bench(title, code, pycache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of integer field decoding.
+
+Compare GenericInteger.createValue(), which uses precompiled struct
+unpackers for byte-aligned 8/16/32/64-bit integers, with the generic
+InputStream.readInteger() path, on the integers of integer-heavy field
+sets (mp4 SampleSizeTable, ext2 Inode).
+
+Usage: bench_integer.py [filename ...]
+"""
+from hachoir.core.benchmark import Benchmark
+from hachoir.field import GenericInteger
+from hachoir.parser import createParser
+from hachoir.parser.container.mp4 import SampleSizeTable
+from hachoir.parser.file_system.ext2 import Inode
+from hachoir.test import setup_tests
+from sys import argv
+import os
+
+TESTCASE = os.path.join(os.path.dirname(__file__), "..", "tests", "files")
+FILENAMES = ("quicktime.mp4", "pentax_320x240.mov",
+             "bsize-1024-isize-1024.ext2", "my60k.ext2")
+FIELD_SETS = (SampleSizeTable, Inode)
+
+
+def collectIntegers(fieldset, integers):
+    for field in fieldset:
+        if field.is_field_set:
+            collectIntegers(field, integers)
+        elif (isinstance(field, GenericInteger)
+              and isinstance(field.parent, FIELD_SETS)):
+            integers.append(field)
+
+
+def structPath(integers):
+    for field in integers:
+        field.createValue()
+
+
+def genericPath(integers):
+    for field in integers:
+        field.parent.stream.readInteger(
+            field.absolute_address, field.signed,
+            field.size, field.parent.endian)
+
+
+def main():
+    setup_tests()
+    filenames = argv[1:] or [os.path.join(TESTCASE, name)
+                             for name in FILENAMES]
+    integers = []
+    parsers = []
+    for filename in filenames:
+        parser = createParser(filename)
+        if parser is None:
+            print("Unable to parse %s" % filename)
+            continue
+        parsers.append(parser)
+        collectIntegers(parser, integers)
+    print("Integers: %s" % len(integers))
+    if not integers:
+        return
+
+    bench = Benchmark(max_time=2.0)
+    print("readInteger() path:")
+    bench.run(genericPath, integers)
+    print("struct path:")
+    bench.run(structPath, integers)
+    for parser in parsers:
+        parser.close()
+
+
+if __name__ == "__main__":
+    main()
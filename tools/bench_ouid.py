@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the OUI table (hachoir.parser.network.ouid): import time,
+time of the first lookup (load of ouid.dat) and memory, measured in new
+processes: best of RUNS runs.
+
+RSS is the increase of the maximum resident set size (ru_maxrss) of the
+process. Bytecode is cached in a temporary directory, warmed up by a first
+run.
+
+Usage: bench_ouid.py
+"""
+from sys import executable
+import os
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RUNS = 5
+CODE = """
+import gc, resource, time
+import hachoir.parser.network
+gc.collect()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+from hachoir.parser.network.ouid import lookupOUID
+t1 = time.perf_counter()
+lookupOUID(0x00000A)
+t2 = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+print(t1 - t0, t2 - t1, rss)
+"""
+
+
+def run(pycache):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (ROOT, env.get("PYTHONPATH")) if path)
+    output = subprocess.check_output([executable,
+                                      "-X", "pycache_prefix=" + pycache,
+                                      "-c", CODE],
+                                     env=env, universal_newlines=True)
+    import_time, lookup_time, rss = output.split()
+    return float(import_time), float(lookup_time), int(rss)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as pycache:
+        run(pycache)
+        results = [run(pycache) for index in range(RUNS)]
+    import_time = min(result[0] for result in results)
+    lookup_time = min(result[1] for result in results)
+    rss = min(result[2] for result in results)
+    print("import: %.1f ms" % (import_time * 1e3))
+    print("first lookup: %.1f ms" % (lookup_time * 1e3))
+    print("RSS: +%s kB" % rss)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark of projection parsing (GenericFieldSet.setProjection()): parse a
+file and read the value of all fields, with and without a projection, and
+report the number of fields created and the time.
+
+Usage: bench_projection.py [filename glob [glob ...]]
+"""
+from hachoir.parser import createParser
+from hachoir.test import setup_tests
+from sys import argv
+import os
+import time
+
+TESTCASE = os.path.join(os.path.dirname(__file__), "..", "tests", "files")
+SCENARIOS = (
+    ("flashmob.mkv", ("/Segment[*]/Info[*]/**", "/Segment[*]/Tracks[*]/**")),
+    ("10min.mkv", ("/Segment[*]/Info[*]/**", "/Segment[*]/Tracks[*]/**")),
+    ("quicktime.mp4", ("/atom[*]/movie/atom[*]/movie_hdr/**",
+                       "/atom[*]/movie/atom[*]/track/atom[*]/track_hdr/**")),
+)
+LOOPS = 5
+
+
+def readValues(fieldset):
+    count = 0
+    for field in fieldset:
+        count += 1
+        field.value
+        if field.is_field_set:
+            count += readValues(field)
+    return count
+
+
+def parse(filename, projection):
+    start = time.perf_counter()
+    parser = createParser(filename)
+    if projection:
+        parser.setProjection(projection)
+    count = readValues(parser)
+    dt = time.perf_counter() - start
+    parser.close()
+    return count, dt
+
+
+def measure(filename, projection):
+    print("%s: %s" % (os.path.basename(filename), ", ".join(projection)))
+    for title, globs in (("full", None), ("projection", projection)):
+        results = [parse(filename, globs) for loop in range(LOOPS)]
+        count = results[0][0]
+        dt = min(result[1] for result in results)
+        print("  %s: %u fields, %.1f ms" % (title, count, dt * 1e3))
+
+
+def main():
+    setup_tests()
+    if 2 < len(argv):
+        measure(argv[1], argv[2:])
+    else:
+        for filename, projection in SCENARIOS:
+            measure(os.path.join(TESTCASE, filename), projection)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Generate hachoir/parser/network/ouid.dat, the table of the registered IEEE
+24-bit Organizationally Unique IDentifiers, from the IEEE oui.txt file:
+http://standards.ieee.org/regauth/oui/oui.txt
+
+See hachoir/parser/network/ouid.py for the file format.
+
+Usage: make_ouid.py oui.txt
+"""
+from array import array
+from sys import argv, byteorder, exit
+import os
+import re
+import struct
+
+FILENAME = os.path.join(os.path.dirname(__file__), "..",
+                        "hachoir", "parser", "network", "ouid.dat")
+MAGIC = b"OUI1"
+
+# "00-00-00   (hex)		XEROX CORPORATION"
+REGEX = re.compile(r"^\s*([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})"
+                   r"\s+\(hex\)\s+(.*?)\s*$")
+
+
+def parseOuiTxt(lines):
+    """
+    Parse the lines of oui.txt: return a dict (OUI => organization name).
+    """
+    ouids = {}
+    for line in lines:
+        match = REGEX.match(line)
+        if not match:
+            continue
+        key = int("".join(match.group(1, 2, 3)), 16)
+        ouids[key] = match.group(4)
+    return ouids
+
+
+def packTable(ouids):
+    """
+    Pack a dict (OUI => organization name) into the ouid.dat format.
+    """
+    keys = array("I", sorted(ouids))
+    names = sorted(set(ouids.values()))
+    name_index = {name: index for index, name in enumerate(names)}
+    indexes = array("H", (name_index[ouids[key]] for key in keys))
+    offsets = array("I", [0])
+    strings = bytearray()
+    for name in names:
+        strings += name.encode("utf-8")
+        offsets.append(len(strings))
+    if byteorder != "little":
+        for item in (keys, indexes, offsets):
+            item.byteswap()
+    return b"".join((MAGIC, struct.pack("<II", len(keys), len(names)),
+                     keys.tobytes(), indexes.tobytes(), offsets.tobytes(),
+                     bytes(strings)))
+
+
+def main():
+    if len(argv) != 2:
+        print(__doc__.strip())
+        exit(1)
+    with open(argv[1], encoding="utf-8", errors="replace") as fp:
+        ouids = parseOuiTxt(fp)
+    with open(FILENAME, "wb") as fp:
+        fp.write(packTable(ouids))
+    print("Write %s: %s OUIs" % (os.path.normpath(FILENAME), len(ouids)))
+
+
+if __name__ == "__main__":
+    main()
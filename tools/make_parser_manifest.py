@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Generate hachoir/parser/parser_manifest.py: the list of the parsers with
+their module and tags, used by HachoirParserList to register the parsers
+without importing their module.
+
+Run it after adding a parser or changing parser tags.
+
+Usage: make_parser_manifest.py
+"""
+from hachoir.parser.parser_list import manifestEntries
+from pprint import pformat
+import os
+
+FILENAME = os.path.join(os.path.dirname(__file__), "..",
+                        "hachoir", "parser", "parser_manifest.py")
+
+HEADER = '''\
+# Generated by tools/make_parser_manifest.py: don't edit.
+#
+# (module, class name, tags) of the parsers registered by HachoirParserList,
+# parser modules are only imported when the parser is used.
+
+PARSERS = (
+'''
+
+
+def writeManifest(out):
+    out.write(HEADER)
+    for module, name, tags in manifestEntries():
+        tags = pformat(tags, width=72).replace("\n", "\n     ")
+        out.write("    (%r, %r,\n     %s),\n" % (module, name, tags))
+    out.write(")\n")
+
+
+def main():
+    with open(FILENAME, "w") as out:
+        writeManifest(out)
+    print("Write %s" % os.path.normpath(FILENAME))
+
+
+if __name__ == "__main__":
+    main()